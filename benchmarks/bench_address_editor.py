@@ -0,0 +1,313 @@
+"""Benchmark the data side of the Address Editor.
+
+Builds an AddressStore over a synthetic project, then times opening a tab
+(the unified view build, the display data shared by every tab's sheet, and
+populating one tab's sheet), typing in the panel's filter box, a styling
+refresh, and an outline rename. Runs headless: the panel methods are called on plain
+stand-ins, so no Tk root or sheet is created.
+
+Run with: uv run python benchmarks/bench_address_editor.py [--sizes 1000 10000] [--output out.json]
+
+Compare runs across commits by diffing the JSON written with --output.
+"""
+
+import argparse
+from functools import partial
+
+from corpus import make_rows
+from report import format_result, time_ms, write_report
+
+from clicknick.data.address_store import AddressStore
+from clicknick.utils.rename_helpers import build_rename_pattern
+from clicknick.views.address_editor.display_model import AddressDisplayModel
+from clicknick.views.address_editor.panel import AddressPanel
+from clicknick.views.address_editor.row_styler import AddressRowStyler
+from clicknick.views.address_editor.view_builder import build_unified_view
+
+# Nicknamed addresses per project; the store also holds every unnamed address
+SIZES = (1_000, 10_000)
+
+# Typed one keystroke at a time into the filter box
+TYPED_FILTER = "pump1"
+
+# Outline node renamed in the rename runs (an array node: Line1_..., Line2_...)
+RENAMED_NODE = "Line"
+
+# Rows shown at once in the styling runs, and how many rows get edited first
+VIEWPORT_ROWS = 40
+EDITED_ROWS = 500
+
+
+class _CorpusSource:
+    """Minimal stand-in for a DataSource serving preloaded rows."""
+
+    supports_used_field = True
+    file_path = "benchmark.mdb"
+    is_read_only = True
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def load_all_addresses(self):
+        return dict(self._rows)
+
+    def save_changes(self, rows):
+        return 0
+
+
+class _Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _Sheet:
+    def display_rows(self, *args, **kwargs):
+        pass
+
+
+class _FilterPanel:
+    """AddressPanel's filtering methods over plain attributes, without widgets."""
+
+    _apply_filters = AddressPanel._apply_filters
+    _narrowing_base = AddressPanel._narrowing_base
+    _recount_modified = AddressPanel._recount_modified
+
+    def __init__(self, store, model):
+        self._store = store
+        self._model = model
+        self.rows = model.rows
+        self._displayed_rows = []
+        self._displayed_row_set = set()
+        self._modified_rows = set()
+        self._search_columns = [None] * len(model.rows)
+        self._last_filter = None
+        self._filter_after_id = None
+        self.sheet = _Sheet()
+        self.filter_enabled_var = _Var(True)
+        self.filter_var = _Var("")
+        self.row_filter_var = _Var("all")
+
+    def _save_selection(self):
+        pass
+
+    def _restore_selection(self):
+        pass
+
+    def _update_status(self):
+        pass
+
+
+class _StyledSheet:
+    """Sheet stand-in that counts styling calls and shows a fixed viewport."""
+
+    def __init__(self):
+        self.cell_notes = {}
+        self.visible_rows = (0, VIEWPORT_ROWS)
+        self.calls = 0
+
+    def _call(self, *args, **kwargs):
+        self.calls += 1
+
+    bind = _call
+    highlight_cells = _call
+    dehighlight_cells = _call
+    dehighlight_all = _call
+    note = _call
+    set_refresh_timer = _call
+
+
+class _TabSheet:
+    """Sheet stand-in that takes the tab's data and counts checkbox calls."""
+
+    def __init__(self):
+        self.checkbox_calls = 0
+
+    def set_sheet_data(self, *args, **kwargs):
+        pass
+
+    def set_index_data(self, *args, **kwargs):
+        pass
+
+    def _checkbox_call(self, *args, **kwargs):
+        self.checkbox_calls += 1
+
+    create_checkbox = _checkbox_call
+    delete_checkbox = _checkbox_call
+
+
+class _TabPanel:
+    """AddressPanel's sheet population over plain attributes, without widgets."""
+
+    COL_INIT_VALUE = AddressPanel.COL_INIT_VALUE
+    _populate_sheet_data = AddressPanel._populate_sheet_data
+
+    def __init__(self, model):
+        self._model = model
+        self._init_checkbox_rows = set()
+        self.sheet = _TabSheet()
+
+
+def _make_store(size):
+    store = AddressStore(_CorpusSource(make_rows(size)))
+    store.load_initial_data()
+    return store
+
+
+def bench_tab_open(size, repeat):
+    """Time the unified view build, the shared display data, and populating each tab's sheet"""
+    store = _make_store(size)
+    view_ms = time_ms(partial(build_unified_view, store.all_rows, store.all_nicknames), repeat)
+    view = build_unified_view(store.all_rows, store.all_nicknames)
+
+    # Display data is built with the first tab; every tab then populates its sheet from it
+    display_ms = time_ms(partial(AddressDisplayModel, store, view), repeat)
+    panel = _TabPanel(AddressDisplayModel(store, view))
+    populate_ms = time_ms(panel._populate_sheet_data, repeat)
+    panel.sheet.checkbox_calls = 0
+    panel._populate_sheet_data()
+    return [
+        {
+            "benchmark": "tab_open",
+            "size": size,
+            "rows": len(view.rows),
+            "unified_view_ms": view_ms,
+            "display_data_ms": display_ms,
+            "populate_ms": populate_ms,
+            "checkbox_calls": panel.sheet.checkbox_calls,
+        }
+    ]
+
+
+def _type_filter(panel, text):
+    for end in range(1, len(text) + 1):
+        panel.filter_var.value = text[:end]
+        panel._apply_filters()
+
+
+def bench_filter(size, repeat):
+    """Time the panel filter on a full unified view, cold and while typing"""
+    store = _make_store(size)
+    model = AddressDisplayModel(store, build_unified_view(store.all_rows, store.all_nicknames))
+
+    def cold_filter():
+        panel = _FilterPanel(store, model)
+        panel.filter_var.value = TYPED_FILTER
+        panel._apply_filters()
+
+    def typing():
+        _type_filter(_FilterPanel(store, model), TYPED_FILTER)
+
+    # Warm panel: search columns already cached, so this is the per-keystroke cost
+    panel = _FilterPanel(store, model)
+    _type_filter(panel, TYPED_FILTER)
+
+    def retype():
+        panel._last_filter = None
+        _type_filter(panel, TYPED_FILTER)
+
+    return [
+        {
+            "benchmark": "filter",
+            "size": size,
+            "rows": len(model.rows),
+            "query": TYPED_FILTER,
+            "matches": len(panel._displayed_rows),
+            "cold_ms": time_ms(cold_filter, repeat),
+            "typing_ms": time_ms(typing, repeat),
+            "warm_typing_ms": time_ms(retype, repeat),
+        }
+    ]
+
+
+def _edit_rows(store, rows):
+    with store.edit_session("Benchmark edits") as session:
+        for row in rows[:: max(len(rows) // EDITED_ROWS, 1)][:EDITED_ROWS]:
+            session.set_field(row.addr_key, "comment", "edited")
+
+
+def bench_styling(size, repeat):
+    """Time a full styling refresh with edited rows, and count sheet calls per refresh"""
+    store = _make_store(size)
+    view = build_unified_view(store.all_rows, store.all_nicknames)
+    _edit_rows(store, view.rows)
+    rows = [store.visible_state[row.addr_key] for row in view.rows]
+    displayed = list(range(len(rows)))
+
+    def full_refresh():
+        styler = AddressRowStyler(_StyledSheet(), store, lambda: rows, lambda: displayed)
+        styler.apply_all_styling()
+        return styler
+
+    styler = full_refresh()
+    first_calls = styler.sheet.calls
+    styler.sheet.calls = 0
+    styler.apply_all_styling()
+    repeat_calls = styler.sheet.calls
+
+    # Edit one visible row's comment, as a cell edit would
+    styler.sheet.calls = 0
+    with store.edit_session("Benchmark edit") as session:
+        session.set_field(rows[1].addr_key, "comment", "edited once")
+    rows[1] = store.visible_state[rows[1].addr_key]
+    styler.update_rows_styling({1})
+    return [
+        {
+            "benchmark": "styling",
+            "size": size,
+            "rows": len(rows),
+            "full_refresh_ms": time_ms(full_refresh, repeat),
+            "full_refresh_calls": first_calls,
+            "repeat_refresh_ms": time_ms(styler.apply_all_styling, repeat),
+            "repeat_refresh_calls": repeat_calls,
+            "row_edit_calls": styler.sheet.calls,
+        }
+    ]
+
+
+def bench_rename(size, repeat):
+    """Time an outline rename of an array node across the whole project"""
+    pattern, template = build_rename_pattern("", RENAMED_NODE, is_array=True)
+    replacement = template.format(new_text="Plant")
+    stores = [_make_store(size) for _ in range(repeat + 1)]
+
+    def rename():
+        return stores.pop().rename_nicknames(RENAMED_NODE, pattern, replacement)
+
+    renamed = rename()
+    return [
+        {
+            "benchmark": "rename",
+            "size": size,
+            "node": RENAMED_NODE,
+            "renamed": renamed,
+            "rename_ms": time_ms(rename, repeat),
+        }
+    ]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Address Editor tab data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of runs per timing.")
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = []
+    for size in args.sizes:
+        for bench in (bench_tab_open, bench_filter, bench_styling, bench_rename):
+            for result in bench(size, args.repeat):
+                print(format_result(result), flush=True)
+                results.append(result)
+
+    if args.output:
+        write_report(args.output, results, args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
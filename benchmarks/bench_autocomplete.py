@@ -0,0 +1,202 @@
+"""Benchmark the autocomplete pipeline over synthetic nickname corpora.
+
+Times every filter strategy (linear scan and indexed), abbreviation tag
+generation, and NicknameManager.get_filtered_nicknames end to end. Runs
+headless: nothing here needs Tk, Win32 or an ODBC driver.
+
+Run with: uv run python benchmarks/bench_autocomplete.py [--sizes 1000 10000] [--output out.json]
+
+Compare runs across commits by diffing the JSON written with --output.
+"""
+
+import argparse
+import time
+from functools import partial
+
+from corpus import make_rows, make_tags
+from report import format_result, time_ms, write_report
+
+from clicknick.data.nickname_manager import NicknameManager
+from clicknick.models.nickname import Nickname
+from clicknick.utils.filters import ContainsPlusFilter
+
+SIZES = (1_000, 10_000, 50_000, 100_000)
+QUERIES = ("p", "pu", "pump", "tnk_lvl", "spd", "alarm reset", "yyyymmdd")
+SEARCH_MODES = ("prefix", "contains", "containsplus", "fuzzy")
+
+# Typed one keystroke at a time in the end-to-end runs
+TYPED_QUERY = "tank lvl"
+
+
+class _CorpusData:
+    """Minimal stand-in for AddressStore: rows only, no observers fire."""
+
+    def __init__(self, rows):
+        self.all_rows = rows
+
+    def add_observer(self, callback):
+        pass
+
+    def remove_observer(self, callback):
+        pass
+
+
+class _Settings:
+    """Plain-value stand-in for AppSettings (which needs a Tk root)."""
+
+    search_mode = "contains"
+    exclude_sc_sd = False
+
+    def get_exclude_terms_list(self):
+        return []
+
+
+def _generate_all_tags(tags):
+    # Fresh filter each run so its lru_cache starts cold
+    tag_filter = ContainsPlusFilter()
+    for tag in tags:
+        tag_filter.generate_tags(tag)
+
+
+def _split_all(tag_filter, tags):
+    for tag in tags:
+        tag_filter.split_into_words(tag)
+
+
+def _load_manager(rows):
+    manager = NicknameManager(settings=_Settings())
+    manager.set_shared_data(_CorpusData(rows))
+    return manager.nicknames
+
+
+def _type_query(manager, address_types, text):
+    for end in range(1, len(text) + 1):
+        manager.get_filtered_nicknames(address_types, text[:end])
+
+
+def bench_filters(size, repeat):
+    """Time each filter strategy, scanning and with its index"""
+    tag_filter = ContainsPlusFilter()
+    items = [Nickname(tag, "", "", "", False) for tag in make_tags(size)]
+    for item in items:
+        item.abbr_tags = tag_filter.generate_tag_tuple(item.nickname)
+
+    results = []
+    for mode, strategy in NicknameManager().filter_strategies.items():
+        build_ms = time_ms(partial(strategy.build_index, items), repeat=1)
+        index = strategy.build_index(items)
+        for query in QUERIES:
+            scan_ms = time_ms(partial(strategy.filter_matches, items, query), repeat)
+            indexed_ms = None
+            if index is not None:
+                indexed_ms = time_ms(
+                    partial(strategy.filter_matches, items, query, index=index), repeat
+                )
+            results.append(
+                {
+                    "benchmark": "filter",
+                    "strategy": mode,
+                    "size": size,
+                    "query": query,
+                    "matches": len(strategy.filter_matches(items, query, index=index)),
+                    "scan_ms": scan_ms,
+                    "indexed_ms": indexed_ms,
+                    "build_index_ms": build_ms if index is not None else None,
+                }
+            )
+    return results
+
+
+def bench_tag_generation(size, repeat):
+    """Time word splitting, and abbreviation tag generation with a cold cache"""
+    tags = make_tags(size)
+    split_ms = time_ms(partial(_split_all, ContainsPlusFilter(), tags), repeat)
+    total_ms = time_ms(partial(_generate_all_tags, tags), repeat)
+    return [
+        {
+            "benchmark": "split_into_words",
+            "size": size,
+            "total_ms": split_ms,
+            "per_tag_us": split_ms * 1000 / size,
+        },
+        {
+            "benchmark": "tag_generation",
+            "size": size,
+            "total_ms": total_ms,
+            "per_tag_us": total_ms * 1000 / size,
+        },
+    ]
+
+
+def bench_manager(size, repeat):
+    """Time get_filtered_nicknames end to end, per search mode"""
+    rows = make_rows(size)
+    address_types = sorted({row.memory_type for row in rows.values()})
+    results = [
+        {
+            "benchmark": "manager_load",
+            "size": size,
+            "total_ms": time_ms(partial(_load_manager, rows), repeat=1),
+        }
+    ]
+
+    settings = _Settings()
+    manager = NicknameManager(settings=settings)
+    manager.set_shared_data(_CorpusData(rows))
+    _ = manager.nicknames
+
+    for mode in SEARCH_MODES:
+        settings.search_mode = mode
+        manager.reset_search_session()
+
+        # First query in a mode also builds that strategy's index
+        start = time.perf_counter()
+        matches = len(manager.get_filtered_nicknames(address_types, "pump"))
+        first_ms = (time.perf_counter() - start) * 1000
+
+        def fresh_query(text):
+            manager.reset_search_session()
+            manager.get_filtered_nicknames(address_types, text)
+
+        def fresh_typing(text):
+            manager.reset_search_session()
+            _type_query(manager, address_types, text)
+
+        results.append(
+            {
+                "benchmark": "manager_search",
+                "strategy": mode,
+                "size": size,
+                "matches": matches,
+                "first_query_ms": first_ms,
+                "query_ms": time_ms(partial(fresh_query, "pump"), repeat),
+                "typed_query": TYPED_QUERY,
+                "typing_ms": time_ms(partial(fresh_typing, TYPED_QUERY), repeat),
+            }
+        )
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark autocomplete filtering.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of runs per timing.")
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = []
+    for size in args.sizes:
+        for bench in (bench_tag_generation, bench_filters, bench_manager):
+            for result in bench(size, args.repeat):
+                print(format_result(result), flush=True)
+                results.append(result)
+
+    if args.output:
+        write_report(args.output, results, args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Synthetic nickname corpora for the autocomplete benchmarks.
+
+Names mix the styles found in real CLICK projects: hierarchical equipment
+tags (Line2_Tank3_Level_PV), array-like runs (Recipe_Step_07), date/time
+fields (Batch_Start_YYYYMMDD), pre-abbreviated tags (Mtr4_Spd_Cmd) and
+CamelCase (MixerSpeedSP). Generation is seeded, so a size always yields the
+same corpus.
+"""
+
+import random
+
+from pyclickplc.addresses import get_addr_key
+from pyclickplc.banks import BANKS
+
+from clicknick.models.address_row import AddressRow
+
+_LINES = ("Line", "Area", "Cell", "Zone")
+_EQUIPMENT = ("Tank", "Pump", "Valve", "Mixer", "Conveyor", "Boiler", "Filter", "Press", "Motor")
+_SIGNALS = ("Speed", "Level", "Alarm", "Reset", "Start", "Stop", "Temp", "Pressure", "Fault")
+_SUFFIXES = ("", "_SP", "_PV", "_Cmd", "_Sts", "_Hi", "_Lo")
+_ARRAYS = ("Recipe_Step", "Alarm_Bit", "Batch_Qty", "Setpoint_Table", "Scan_Buffer")
+_DATE_FIELDS = ("Batch_Start", "Last_Clean", "Shift_Change", "Alarm_Time", "Log")
+_DATE_RUNS = ("YYYYMMDD", "HHMMSS", "YYMM", "HHMM", "YYYYMMDD_HHMMSS")
+_ABBREVIATED = {
+    "Motor": "Mtr",
+    "Tank": "Tnk",
+    "Speed": "Spd",
+    "Level": "Lvl",
+    "Pressure": "Press",
+    "Temp": "Tmp",
+    "Command": "Cmd",
+    "Reset": "Rst",
+}
+
+# (memory type, share of the corpus); addresses run past real bank sizes
+# at the larger sizes so that end-to-end runs can reach 100k nicknames
+_MEMORY_TYPES = (("C", 40), ("DS", 25), ("DF", 15), ("DD", 10), ("X", 5), ("Y", 5))
+
+
+def _hierarchical(rng):
+    return (
+        f"{rng.choice(_LINES)}{rng.randint(1, 9)}_{rng.choice(_EQUIPMENT)}{rng.randint(1, 99)}_"
+        f"{rng.choice(_SIGNALS)}{rng.choice(_SUFFIXES)}"
+    )
+
+
+def _array(rng):
+    return f"{rng.choice(_ARRAYS)}_{rng.randint(0, 199):02d}"
+
+
+def _dated(rng):
+    return f"{rng.choice(_DATE_FIELDS)}_{rng.choice(_DATE_RUNS)}"
+
+
+def _abbreviated(rng):
+    equipment = rng.choice(_EQUIPMENT)
+    signal = rng.choice(_SIGNALS)
+    return (
+        f"{_ABBREVIATED.get(equipment, equipment)}{rng.randint(1, 99)}_"
+        f"{_ABBREVIATED.get(signal, signal)}{rng.choice(_SUFFIXES)}"
+    )
+
+
+def _camel(rng):
+    return f"{rng.choice(_EQUIPMENT)}{rng.randint(1, 99)}{rng.choice(_SIGNALS)}{rng.choice(('SP', 'PV', ''))}"
+
+
+_STYLES = ((_hierarchical, 45), (_array, 15), (_dated, 5), (_abbreviated, 20), (_camel, 15))
+
+
+def make_tags(count, seed=0):
+    """Generate count unique nickname strings"""
+    rng = random.Random(seed)
+    styles = [style for style, _ in _STYLES]
+    weights = [weight for _, weight in _STYLES]
+    tags = []
+    seen = set()
+    while len(tags) < count:
+        tag = rng.choices(styles, weights)[0](rng)
+        if tag in seen:
+            tag = f"{tag}_{len(tags)}"
+        seen.add(tag)
+        tags.append(tag)
+    return tags
+
+
+def make_rows(count, seed=0):
+    """Generate {addr_key: AddressRow} holding count nicknamed addresses"""
+    rng = random.Random(seed)
+    memory_types = [memory_type for memory_type, _ in _MEMORY_TYPES]
+    weights = [weight for _, weight in _MEMORY_TYPES]
+    next_address = {memory_type: BANKS[memory_type].min_addr for memory_type in memory_types}
+
+    rows = {}
+    for tag in make_tags(count, seed):
+        memory_type = rng.choices(memory_types, weights)[0]
+        address = next_address[memory_type]
+        next_address[memory_type] += 1
+        rows[get_addr_key(memory_type, address)] = AddressRow(
+            memory_type=memory_type,
+            address=address,
+            nickname=tag,
+            comment=f"{tag.replace('_', ' ')} signal",
+            data_type=BANKS[memory_type].data_type,
+        )
+    return rows
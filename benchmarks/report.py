@@ -0,0 +1,60 @@
+"""Timing and JSON report helpers shared by the benchmark scripts."""
+
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+
+
+def time_ms(func, repeat=3):
+    """Best-of-repeat wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_result(result):
+    fields = [f"{result['benchmark']:<15}", f"n={result['size']:<7}"]
+    for key, value in result.items():
+        if key in ("benchmark", "size") or value is None:
+            continue
+        if isinstance(value, float):
+            fields.append(f"{key}={value:.2f}")
+        else:
+            fields.append(f"{key}={value}")
+    return " ".join(fields)
+
+
+def write_report(path, results, sizes, repeat):
+    """Write results as JSON, with enough metadata to compare runs across commits"""
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {path}")
@@ -1,3 +1,11 @@
-from .app import main, main_dev
-
 __all__ = ["main", "main_dev"]
+
+
+def __getattr__(name):
+    # Import the Tk/Win32 app only when an entry point is requested, so the
+    # data and filter modules can be imported headless (tests, benchmarks).
+    if name in __all__:
+        from . import app
+
+        return getattr(app, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
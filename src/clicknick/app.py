@@ -12,11 +12,12 @@ from .resources.icon_data import ICON_PNG_BASE64
 from .utils.filters import (  # preserve lru_cache
     ContainsFilter,
     ContainsPlusFilter,
+    FuzzyFilter,
     NoneFilter,
     PrefixFilter,
 )
 from .utils.mdb_shared import find_fallback_csv, set_csv_only_mode
-from .views.dialogs import AboutDialog, CsvFallbackDialog, OdbcWarningDialog
+from .utils.tag_cache import default_tag_cache_path
 from .views.overlay import Overlay
 
 # Set DPI awareness for better UI rendering
@@ -141,12 +142,9 @@ class ClickNickApp:
     def _on_sort_option_changed(self):
         """Handle changes to the sort option."""
         if self.nickname_manager.is_loaded:
-            # Apply the new sorting preference
+            # Apply the new sorting preference (tags stay with their Nickname objects)
             self.nickname_manager.apply_sorting(self.settings.sort_by_nickname)
 
-            # Regenerate abbreviation tags after sorting
-            self.nickname_manager._generate_abbreviation_tags()
-
     def _create_options_section(self, parent):
         """Create the options section."""
         options_frame = ttk.LabelFrame(parent, text="Autocomplete Options", padding=10)
@@ -178,13 +176,20 @@ class ClickNickApp:
             variable=self.settings.search_var,
             value="containsplus",
         )
+        fuzzy_radio = ttk.Radiobutton(
+            filter_frame,
+            text="Fuzzy",
+            variable=self.settings.search_var,
+            value="fuzzy",
+        )
 
         # Layout filter widgets
         filter_label.pack(side=tk.LEFT, padx=(0, 8))
         none_radio.pack(side=tk.LEFT, padx=(0, 8))
         prefix_radio.pack(side=tk.LEFT, padx=(0, 8))
         contains_radio.pack(side=tk.LEFT, padx=(0, 8))
-        contains_plus_radio.pack(side=tk.LEFT)
+        contains_plus_radio.pack(side=tk.LEFT, padx=(0, 8))
+        fuzzy_radio.pack(side=tk.LEFT)
         filter_frame.pack(fill=tk.X, pady=(0, 8))
 
         # Checkbox row (Sort, Tooltips, SC/SD)
@@ -250,10 +255,14 @@ class ClickNickApp:
 
     def _create_about_dialog(self):
         """Create and show the About dialog."""
+        from .views.dialogs import AboutDialog
+
         AboutDialog(self.root, get_version())
 
     def _show_odbc_warning(self):
         """Show a warning dialog about missing ODBC drivers."""
+        from .views.dialogs import OdbcWarningDialog
+
         OdbcWarningDialog(self.root)
 
     def _update_status(self, message, style="normal"):
@@ -866,7 +875,8 @@ class ClickNickApp:
             "none": NoneFilter(),
             "prefix": PrefixFilter(),
             "contains": ContainsFilter(),
-            "containsplus": ContainsPlusFilter(),
+            "containsplus": ContainsPlusFilter(tag_cache_path=default_tag_cache_path()),
+            "fuzzy": FuzzyFilter(),
         }
 
         # Initialize core components
@@ -1147,6 +1157,8 @@ class ClickNickApp:
             fallback_csv = find_fallback_csv(hwnd)
             if fallback_csv:
                 # Show dialog prompting user to save a copy
+                from .views.dialogs import CsvFallbackDialog
+
                 default_name = f"{filename.replace('.ckp', '')}_Address.csv"
                 dialog = CsvFallbackDialog(self.root, fallback_csv, default_name)
                 saved_path = dialog.show()
@@ -1415,6 +1427,7 @@ class ClickNickApp:
         """Handle application shutdown."""
         if self.monitoring:
             self.stop_monitoring()
+        self.nickname_manager.save_tag_cache()
         self.root.destroy()
 
     def run(self):
@@ -13,6 +13,7 @@ Key behaviors:
 
 from __future__ import annotations
 
+import re
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import replace
@@ -33,13 +34,13 @@ from ..models.address_row import AddressRow
 from ..models.validation import validate_comment, validate_initial_value, validate_nickname
 from ..services.block_service import BlockService, compute_all_block_ranges
 from ..services.nickname_index_service import NicknameIndexService
-from .data_source import DataSource
 from .edit_session_new import EditSession
 from .file_monitor import FileMonitor
 from .undo_frame import MAX_UNDO_DEPTH, UndoFrame
 
 if TYPE_CHECKING:
     from ..views.address_editor.view_builder import UnifiedView
+    from .data_source import DataSource
 
 
 class AddressStore:
@@ -455,8 +456,7 @@ class AddressStore:
                     # Get unified view for searching paired tags
                     view = self.get_unified_view()
                     if view:
-                        key_to_idx = {r.addr_key: i for i, r in enumerate(view.rows)}
-                        row_idx = key_to_idx.get(addr_key)
+                        row_idx = view.row_index.get(addr_key)
 
                         if row_idx is not None:
                             result = BlockService.auto_update_matching_block_tag(
@@ -916,6 +916,38 @@ class AddressStore:
         """Update nickname in the index."""
         self._nickname_service.update(addr_key, old_nickname, new_nickname)
 
+    def rename_nicknames(
+        self, prefix: str, pattern: str, replacement: str, description: str = "Rename nicknames"
+    ) -> int:
+        """Rewrite matching nicknames in a single edit session (one undo step).
+
+        Candidates come from the nickname index, so only nicknames starting
+        with prefix are tested against pattern.
+
+        Args:
+            prefix: Literal text every matching nickname starts with
+            pattern: Regex applied to each candidate (first match only)
+            replacement: Replacement template (supports backreferences like \\1)
+            description: Description for the undo menu
+
+        Returns:
+            Number of addresses renamed
+        """
+        compiled = re.compile(pattern)
+        renames: dict[int, str] = {}
+        for nickname in self._nickname_service.get_nicknames_with_prefix(prefix):
+            new_nickname, matched = compiled.subn(replacement, nickname, count=1)
+            if not matched or new_nickname == nickname:
+                continue
+            for addr_key in self._nickname_service.get_addr_keys(nickname):
+                renames[addr_key] = new_nickname
+
+        if renames:
+            with self.edit_session(description) as session:
+                for addr_key, new_nickname in renames.items():
+                    session.set_field(addr_key, "nickname", new_nickname)
+        return len(renames)
+
     def validate_affected_rows(self, old_nickname: str, new_nickname: str) -> set[int]:
         """Validate rows affected by a nickname change."""
         affected_keys: set[int] = set()
@@ -1,23 +1,78 @@
 from __future__ import annotations
 
+import threading
+from bisect import bisect_left
 from typing import TYPE_CHECKING
 
 from pyclickplc.blocks import strip_block_tag
 
 from ..models.nickname import Nickname
-from ..utils.filters import ContainsFilter, ContainsPlusFilter, NoneFilter, PrefixFilter
-from ..utils.mdb_shared import has_access_driver
+from ..utils.filters import (
+    ContainsFilter,
+    ContainsPlusFilter,
+    FuzzyFilter,
+    NoneFilter,
+    PrefixFilter,
+)
 
 if TYPE_CHECKING:
     from .shared_data import SharedAddressData
 
+# Modes where a longer query's matches are always a subset of a shorter one's
+# (abbreviation variants in containsplus are not monotonic in the query)
+NARROWING_SEARCH_MODES = frozenset({"prefix", "contains", "fuzzy"})
+
+# Max cached queries per overlay search session
+SEARCH_SESSION_SIZE = 32
+
+# Memory types dropped by the "Exclude SC/SD Addresses" option
+SYSTEM_MEMORY_TYPES = ("SC", "SD")
+
+# Newly generated abbreviation tags that trigger a save before shutdown
+TAG_CACHE_SAVE_PUTS = 1000
+
+
+def _same_nickname_fields(a: Nickname, b: Nickname) -> bool:
+    """Check whether two Nickname objects carry identical data."""
+    return (
+        a.nickname == b.nickname
+        and a.address == b.address
+        and a.data_type_display == b.data_type_display
+        and a.initial_value == b.initial_value
+        and a.retentive == b.retentive
+        and a.comment == b.comment
+        and a.address_type == b.address_type
+        and a.used == b.used
+    )
+
+
+def _rank_matches(matches: list[Nickname], search_text: str) -> list[Nickname]:
+    """Stable-rank search matches: exact, then prefix, then strategy order.
+
+    Strategies already order word-boundary hits before other substring hits
+    and abbreviation hits last, so those tiers are kept as they come.
+    """
+    needle = search_text.lower()
+    exact = []
+    prefix = []
+    rest = []
+    for obj in matches:
+        lowered = obj.nickname.lower()
+        if lowered == needle:
+            exact.append(obj)
+        elif lowered.startswith(needle):
+            prefix.append(obj)
+        else:
+            rest.append(obj)
+    return exact + prefix + rest
+
 
 class NicknameManager:
     """Read-only shim over SharedAddressData for nickname filtering and lookup.
 
     This class delegates to SharedAddressData for all address data. It builds
-    a cached list of Nickname objects on demand and invalidates the cache when
-    SharedAddressData notifies of changes.
+    a cached list of Nickname objects on demand and patches the cache in place
+    for the affected keys when SharedAddressData notifies of changes.
     """
 
     def __init__(self, settings=None, filter_strategies=None):
@@ -25,6 +80,38 @@ class NicknameManager:
         self._nickname_cache: list[Nickname] | None = None
         self.settings = settings
 
+        # Serializes cache updates (Tk thread) with searches run off-thread by the overlay
+        self._lock = threading.RLock()
+        # Serializes tag cache writes, which happen outside _lock
+        self._tag_cache_save_lock = threading.Lock()
+
+        # addr_key -> Nickname, plus sort keys parallel to _nickname_cache for bisect
+        self._nickname_by_key: dict[int, Nickname] = {}
+        self._cache_sort_keys: list = []
+        self._sort_by_nickname = False
+
+        # Bumped whenever the cache contents or order change
+        self.generation = 0
+        # Bumped only when nickname strings or their order change
+        self._names_generation = 0
+
+        # Per-strategy search indexes over the cache, rebuilt once per names generation
+        self._search_indexes: dict[str, object] = {}
+        self._search_index_generation = -1
+
+        # Per-overlay-session cache: query -> (result nicknames, matches in cache order)
+        self._session_key: tuple | None = None
+        self._session_results: dict[str, tuple[list[str], list[Nickname] | None]] = {}
+        self._cache_positions: dict[int, int] = {}
+        self._cache_positions_generation = -1
+
+        # Cache partitioned by memory type (with lowercase names), and the
+        # candidate lists built from them per (allowed types, exclusion settings)
+        self._partitions: dict[str, list[Nickname]] = {}
+        self._partition_lowers: dict[str, list[str]] = {}
+        self._partitions_generation = -1
+        self._candidate_bases: dict[tuple, tuple[list[Nickname], set[int]]] = {}
+
         # Use provided filter strategies or create default ones
         if filter_strategies:
             self.filter_strategies = filter_strategies
@@ -34,74 +121,312 @@ class NicknameManager:
                 "prefix": PrefixFilter(),
                 "contains": ContainsFilter(),
                 "containsplus": ContainsPlusFilter(),
+                "fuzzy": FuzzyFilter(),
             }
 
-    def _on_data_changed(self, sender=None, affected_keys=None) -> None:
-        """Observer callback when SharedAddressData changes."""
+    def _invalidate_cache(self) -> None:
+        """Drop the cache so the next access rebuilds it."""
         self._nickname_cache = None
+        self._nickname_by_key = {}
+        self._cache_sort_keys = []
+        self.generation += 1
+        self._names_generation += 1
+
+    def _generate_tags_for(self, nickname_obj: Nickname) -> None:
+        """Generate abbreviation tags for a single nickname."""
+        containsplus_filter = self.filter_strategies.get("containsplus")
+        if containsplus_filter:
+            nickname_obj.abbr_tags = containsplus_filter.generate_tag_tuple(nickname_obj.nickname)
+
+    def _make_nickname(self, row, previous: Nickname | None = None) -> Nickname:
+        """Create a Nickname from an AddressRow, reusing tags when the name is unchanged."""
+        nickname_obj = Nickname(
+            nickname=row.nickname,
+            address=row.display_address,
+            data_type_display=row.data_type_display,
+            initial_value=row.initial_value,
+            retentive=row.retentive,
+            comment=strip_block_tag(row.comment),
+            address_type=row.memory_type,
+            used=row.used,
+        )
+        if previous is not None and previous.nickname == nickname_obj.nickname:
+            nickname_obj.abbr_tags = previous.abbr_tags
+        else:
+            self._generate_tags_for(nickname_obj)
+        return nickname_obj
+
+    def _sort_key(self, addr_key: int, nickname_obj: Nickname):
+        """Return the cache ordering key (memory type + address, or nickname A-Z)."""
+        if self._sort_by_nickname:
+            return (nickname_obj.nickname, addr_key)
+        return addr_key
+
+    def _patch_nickname_cache(self, affected_keys) -> None:
+        """Update cached Nickname objects for the affected addr_keys only."""
+        if self._shared_data is None or self._nickname_cache is None:
+            return
+
+        all_rows = self._shared_data.all_rows
+        changed = False
+        names_changed = False
+        for addr_key in affected_keys:
+            old = self._nickname_by_key.get(addr_key)
+            row = all_rows.get(addr_key)
+            new = self._make_nickname(row, old) if row is not None and row.nickname else None
+
+            if old is not None and new is not None and _same_nickname_fields(old, new):
+                continue
+            if old is None and new is None:
+                continue
+            changed = True
+
+            if old is not None and new is not None and old.nickname == new.nickname:
+                # Only metadata changed: swap in place, search indexes stay valid
+                pos = bisect_left(self._cache_sort_keys, self._sort_key(addr_key, old))
+                self._nickname_cache[pos] = new
+                self._nickname_by_key[addr_key] = new
+                continue
+            names_changed = True
+
+            if old is not None:
+                pos = bisect_left(self._cache_sort_keys, self._sort_key(addr_key, old))
+                del self._cache_sort_keys[pos]
+                del self._nickname_cache[pos]
+                del self._nickname_by_key[addr_key]
+            if new is not None:
+                sort_key = self._sort_key(addr_key, new)
+                pos = bisect_left(self._cache_sort_keys, sort_key)
+                self._cache_sort_keys.insert(pos, sort_key)
+                self._nickname_cache.insert(pos, new)
+                self._nickname_by_key[addr_key] = new
+
+        if changed:
+            self.generation += 1
+        if names_changed:
+            self._names_generation += 1
+
+    def _on_data_changed(self, sender=None, affected_keys=None) -> None:
+        """Observer callback when SharedAddressData changes.
+
+        Patches the cache for just the affected keys. A notification without
+        affected keys invalidates the whole cache.
+        """
+        with self._lock:
+            if self._nickname_cache is None:
+                return
+            if affected_keys is None:
+                self._invalidate_cache()
+                return
+            self._patch_nickname_cache(affected_keys)
 
     def set_shared_data(self, shared_data: SharedAddressData | None) -> None:
         """Set the SharedAddressData to delegate to.
 
-        Registers as observer to invalidate cache on changes.
+        Registers as observer to keep the cache in sync with changes.
         """
         # Unregister from old shared data
         if self._shared_data is not None:
             self._shared_data.remove_observer(self._on_data_changed)
 
-        self._shared_data = shared_data
-        self._nickname_cache = None
+        with self._lock:
+            self._shared_data = shared_data
+            self._invalidate_cache()
 
         # Register as observer on new shared data
         if self._shared_data is not None:
             self._shared_data.add_observer(self._on_data_changed)
 
+    def _ordered_nicknames(self) -> list[Nickname]:
+        """Order _nickname_by_key by the current sort key and refresh _cache_sort_keys."""
+        entries = sorted(
+            (
+                (self._sort_key(addr_key, obj), obj)
+                for addr_key, obj in self._nickname_by_key.items()
+            ),
+            key=lambda entry: entry[0],
+        )
+        self._cache_sort_keys = [sort_key for sort_key, _ in entries]
+        return [obj for _, obj in entries]
+
     def _build_nickname_cache(self) -> list[Nickname]:
         """Build Nickname list from SharedAddressData.all_rows."""
+        self._nickname_by_key = {}
         if self._shared_data is None:
+            self._cache_sort_keys = []
             return []
 
-        nicknames = []
-        for row in self._shared_data.all_rows.values():
+        for addr_key, row in self._shared_data.all_rows.items():
             if not row.nickname:
                 continue
-            nickname_obj = Nickname(
-                nickname=row.nickname,
-                address=row.display_address,
-                data_type_display=row.data_type_display,
-                initial_value=row.initial_value,
-                retentive=row.retentive,
-                comment=strip_block_tag(row.comment),
-                address_type=row.memory_type,
-                used=row.used,
-            )
-            nicknames.append(nickname_obj)
-        return nicknames
-
-    def _generate_abbreviation_tags(self):
-        """Generate abbreviation tags for containsplus filtering."""
-        if self._nickname_cache is None:
-            return
+            self._nickname_by_key[addr_key] = self._make_nickname(row)
+
+        return self._ordered_nicknames()
+
+    def _get_search_index(self, search_mode: str, strategy):
+        """Get the strategy's index over the cache, rebuilding it when names change."""
+        nicknames = self.nicknames
+        if self._search_index_generation != self._names_generation:
+            self._search_indexes.clear()
+            self._search_index_generation = self._names_generation
+
+        if search_mode not in self._search_indexes:
+            self._search_indexes[search_mode] = strategy.build_index(nicknames)
+        return self._search_indexes[search_mode]
+
+    def _search_all(
+        self,
+        strategy,
+        search_mode: str,
+        search_text: str,
+        candidates: list[Nickname],
+        candidate_ids: set[int],
+    ) -> list:
+        """Run a full search, using the strategy's index over the cache if it has one."""
+        index = self._get_search_index(search_mode, strategy)
+        if index is None:
+            return strategy.filter_matches(candidates, search_text)
+
+        # Indexed strategies search the whole cache; the candidate check then
+        # only runs on the (much smaller) match list.
+        search_filtered_objects = strategy.filter_matches(self.nicknames, search_text, index=index)
+        return [obj for obj in search_filtered_objects if id(obj) in candidate_ids]
+
+    def _get_partitions(self) -> dict[str, list[Nickname]]:
+        """Get the cache split by memory type, rebuilt once per generation."""
+        if self._partitions_generation != self.generation:
+            partitions: dict[str, list[Nickname]] = {}
+            for nickname_obj in self.nicknames:
+                partitions.setdefault(nickname_obj.address_type, []).append(nickname_obj)
+            self._partitions = partitions
+            self._partition_lowers = {
+                address_type: [obj.nickname.lower() for obj in objs]
+                for address_type, objs in partitions.items()
+            }
+            self._candidate_bases = {}
+            self._partitions_generation = self.generation
+        return self._partitions
+
+    def _in_cache_order(self, nickname_objs: list[Nickname]) -> list[Nickname]:
+        """Sort a subset of cached Nickname objects back into cache order."""
+        if self._cache_positions_generation != self.generation:
+            self._cache_positions = {id(obj): pos for pos, obj in enumerate(self.nicknames)}
+            self._cache_positions_generation = self.generation
+        positions = self._cache_positions
+        return sorted(nickname_objs, key=lambda obj: positions[id(obj)])
+
+    def _get_candidate_base(
+        self, address_types: list[str], exclude_sc_sd: bool, excluded_terms: list[str]
+    ) -> tuple[list[Nickname], set[int]]:
+        """Get nicknames allowed by type and exclusion settings, in cache order.
+
+        The result is cached per (address types, exclusion settings) until the
+        next cache change, so building it only touches the matching partitions.
 
-        containsplus_filter = self.filter_strategies.get("containsplus")
-        if not containsplus_filter:
-            return
+        Returns:
+            Tuple of (candidate list, set of candidate object ids)
+        """
+        partitions = self._get_partitions()
+        key = (tuple(address_types), exclude_sc_sd, tuple(excluded_terms))
+        cached = self._candidate_bases.get(key)
+        if cached is not None:
+            return cached
+
+        parts = []
+        for address_type in dict.fromkeys(address_types):
+            if address_type not in partitions:
+                continue
+            if exclude_sc_sd and address_type in SYSTEM_MEMORY_TYPES:
+                continue
+            objs = partitions[address_type]
+            if excluded_terms:
+                lowers = self._partition_lowers[address_type]
+                objs = [
+                    obj
+                    for obj, nickname_lower in zip(objs, lowers, strict=True)
+                    if not any(term in nickname_lower for term in excluded_terms)
+                ]
+            parts.append(objs)
+
+        if len(parts) == 1:
+            candidates = list(parts[0])
+        else:
+            candidates = self._in_cache_order([obj for part in parts for obj in part])
+
+        cached = (candidates, {id(obj) for obj in candidates})
+        self._candidate_bases[key] = cached
+        return cached
+
+    def _find_narrowing_base(self, search_text: str) -> list[Nickname] | None:
+        """Get cached matches for the longest earlier query that search_text extends."""
+        best_query = None
+        for query, (_, ordered_matches) in self._session_results.items():
+            if (
+                ordered_matches is not None
+                and search_text.startswith(query)
+                and (best_query is None or len(query) > len(best_query))
+            ):
+                best_query = query
+        if best_query is None:
+            return None
+        return self._session_results[best_query][1]
 
-        for nickname_obj in self._nickname_cache:
-            nickname_obj.abbr_tags = containsplus_filter.generate_tags(nickname_obj.nickname)
+    def reset_search_session(self) -> None:
+        """Forget cached query results (call when the overlay opens for a new field)."""
+        with self._lock:
+            self._session_key = None
+            self._session_results = {}
 
     @property
     def nicknames(self) -> list[Nickname]:
         """Get cached Nickname list, rebuilt on demand."""
-        if self._nickname_cache is None:
-            self._nickname_cache = self._build_nickname_cache()
-            self._generate_abbreviation_tags()
-        return self._nickname_cache
+        with self._lock:
+            if self._nickname_cache is None:
+                self._nickname_cache = self._build_nickname_cache()
+            return self._nickname_cache
+
+    def _get_tag_cache(self):
+        """Get the containsplus strategy's on-disk tag cache, or None if not configured."""
+        return getattr(self.filter_strategies.get("containsplus"), "tag_cache", None)
+
+    def save_tag_cache(self) -> bool:
+        """Persist abbreviation tags generated since the last save (if configured).
+
+        Tags are generated with the lock held, so the entries are copied under
+        it; the file itself is written after releasing it. Waits for a save
+        already in progress, so nothing is lost when called at shutdown.
+
+        Returns:
+            True if the file was written
+        """
+        tag_cache = self._get_tag_cache()
+        if tag_cache is None:
+            return False
+        with self._tag_cache_save_lock:
+            with self._lock:
+                data = tag_cache.snapshot()
+            return data is not None and tag_cache.write(data)
+
+    def _save_tag_cache_in_background(self) -> None:
+        """Write the tag cache on a daemon thread once many new tags were generated.
+
+        Smaller batches wait for the save at shutdown, so searches while
+        typing never serialize the file.
+        """
+        tag_cache = self._get_tag_cache()
+        if (
+            tag_cache is None
+            or tag_cache.unsaved_puts < TAG_CACHE_SAVE_PUTS
+            or self._tag_cache_save_lock.locked()
+        ):
+            return
+        threading.Thread(target=self.save_tag_cache, daemon=True).start()
 
     @property
     def is_loaded(self) -> bool:
         """Check if nicknames data is loaded."""
-        return len(self.nicknames) > 0
+        with self._lock:
+            return len(self.nicknames) > 0
 
     def apply_sorting(self, sort_by_nickname: bool = False):
         """Apply sorting to the loaded nicknames.
@@ -110,12 +435,19 @@ class NicknameManager:
             sort_by_nickname: If True, sort by nickname alphabetically.
                              If False, keep original order (memory type + address).
         """
-        if self._nickname_cache is None:
-            # Force cache build first
-            _ = self.nicknames
+        with self._lock:
+            if sort_by_nickname == self._sort_by_nickname and self._nickname_cache is not None:
+                return
+
+            self._sort_by_nickname = sort_by_nickname
+            if self._nickname_cache is None:
+                # Force cache build first
+                _ = self.nicknames
+                return
 
-        if self._nickname_cache and sort_by_nickname:
-            self._nickname_cache.sort(key=lambda x: x.nickname)
+            self._nickname_cache[:] = self._ordered_nicknames()
+            self.generation += 1
+            self._names_generation += 1
 
     def get_address_for_nickname(self, nickname: str) -> str | None:
         """Get the address for a given nickname.
@@ -126,9 +458,10 @@ class NicknameManager:
         Returns:
             The corresponding address or None if not found
         """
-        for nickname_obj in self.nicknames:
-            if nickname_obj.nickname == nickname:
-                return nickname_obj.address
+        with self._lock:
+            for nickname_obj in self.nicknames:
+                if nickname_obj.nickname == nickname:
+                    return nickname_obj.address
         return None
 
     def get_nickname_details(self, nickname: str) -> str:
@@ -140,9 +473,10 @@ class NicknameManager:
         Returns:
             Detailed string with address, data type, initial value, and comment
         """
-        for nickname_obj in self.nicknames:
-            if nickname_obj.nickname == nickname:
-                return nickname_obj.details()
+        with self._lock:
+            for nickname_obj in self.nicknames:
+                if nickname_obj.nickname == nickname:
+                    return nickname_obj.details()
         return ""
 
     def get_filtered_nicknames(self, address_types: list[str], search_text: str = "") -> list[str]:
@@ -153,50 +487,116 @@ class NicknameManager:
             search_text: Text to search for in nicknames
 
         Returns:
-            List of matching nickname strings
+            List of matching nickname strings, best matches first
         """
-        if not self.nicknames or not address_types:
-            return []
+        return self.get_top_nicknames(address_types, search_text)[0]
 
-        # Get filtering parameters from settings (with fallbacks)
-        if self.settings:
-            search_mode = self.settings.search_mode
-            exclude_sc_sd = self.settings.exclude_sc_sd
-            excluded_terms = self.settings.get_exclude_terms_list()
-        else:
-            search_mode = "none"
-            exclude_sc_sd = False
-            excluded_terms = []
-
-        # Filter by address type and exclusions
-        filtered_objects = []
-        for nickname_obj in self.nicknames:
-            # Check if address type matches
-            if nickname_obj.address_type not in address_types:
-                continue
+    def search_options(self) -> tuple[str, bool, list[str]]:
+        """Read the filtering settings as plain values.
 
-            # Skip SC/SD addresses if requested
-            if exclude_sc_sd and (
-                nickname_obj.address.startswith("SC") or nickname_obj.address.startswith("SD")
-            ):
-                continue
+        Call on the Tk thread and pass the result to get_top_nicknames when
+        searching from a worker thread, which must not touch Tk variables.
 
-            # Skip if it contains any excluded terms
-            nickname_lower = nickname_obj.nickname.lower()
-            if any(excluded_term in nickname_lower for excluded_term in excluded_terms):
-                continue
+        Returns:
+            Tuple of (search mode, exclude SC/SD, excluded terms)
+        """
+        if self.settings:
+            return (
+                self.settings.search_mode,
+                self.settings.exclude_sc_sd,
+                self.settings.get_exclude_terms_list(),
+            )
+        return "none", False, []
+
+    def _find_top_nicknames(
+        self,
+        address_types: list[str],
+        search_text: str,
+        limit: int | None,
+        search_options: tuple[str, bool, list[str]],
+    ) -> tuple[list[str], int]:
+        """Run get_top_nicknames with the lock held."""
+        if not self.nicknames or not address_types:
+            return [], 0
+
+        search_mode, exclude_sc_sd, excluded_terms = search_options
 
-            filtered_objects.append(nickname_obj)
+        candidates, candidate_ids = self._get_candidate_base(
+            address_types, exclude_sc_sd, excluded_terms
+        )
 
         # Apply search filtering if search text provided
         if not search_text or search_mode == "none":
-            return [obj.nickname for obj in filtered_objects]
+            return [obj.nickname for obj in candidates[:limit]], len(candidates)
+
+        session_key = (
+            self.generation,
+            search_mode,
+            tuple(address_types),
+            exclude_sc_sd,
+            tuple(excluded_terms),
+        )
+        if session_key != self._session_key:
+            self.reset_search_session()
+            self._session_key = session_key
+
+        cached = self._session_results.get(search_text)
+        if cached is not None:
+            return cached[0][:limit], len(cached[0])
 
         strategy = self.filter_strategies.get(search_mode, self.filter_strategies["none"])
-        search_filtered_objects = strategy.filter_matches(filtered_objects, search_text)
+        narrowing = search_mode in NARROWING_SEARCH_MODES
+        previous_matches = self._find_narrowing_base(search_text) if narrowing else None
+
+        if previous_matches is not None:
+            # Query extends an earlier one: refine its (much smaller) match list
+            search_filtered_objects = strategy.filter_matches(previous_matches, search_text)
+        else:
+            search_filtered_objects = self._search_all(
+                strategy, search_mode, search_text, candidates, candidate_ids
+            )
+
+        ranked = _rank_matches(search_filtered_objects, search_text)
+        result = [obj.nickname for obj in ranked]
+        ordered_matches = self._in_cache_order(search_filtered_objects) if narrowing else None
+        if len(self._session_results) >= SEARCH_SESSION_SIZE:
+            self._session_results.pop(next(iter(self._session_results)))
+        self._session_results[search_text] = (result, ordered_matches)
+        return result[:limit], len(result)
+
+    def get_top_nicknames(
+        self,
+        address_types: list[str],
+        search_text: str = "",
+        limit: int | None = None,
+        search_options: tuple[str, bool, list[str]] | None = None,
+    ) -> tuple[list[str], int]:
+        """Get the best-ranked matching nicknames and the total match count.
+
+        Matches are ranked exact, prefix, word-boundary, other substring, then
+        abbreviation; ties keep cache order. The full ranked list is cached per
+        search session, so asking for a larger limit later is a slice.
 
-        return [obj.nickname for obj in search_filtered_objects]
+        Args:
+            address_types: List of allowed address types (X, Y, C, etc.)
+            search_text: Text to search for in nicknames
+            limit: Max number of names to return (None for all)
+            search_options: Result of search_options() (read from settings if None)
+
+        Returns:
+            Tuple of (top matching nickname strings, total number of matches)
+        """
+        if search_options is None:
+            search_options = self.search_options()
+        with self._lock:
+            result = self._find_top_nicknames(address_types, search_text, limit, search_options)
+        # Persist tags generated by a cache (re)build, outside the lock
+        self._save_tag_cache_in_background()
+        return result
 
     def has_access_driver(self) -> bool:
         """Check if any Microsoft Access ODBC driver is available."""
+        # Imported here so searching does not require pyodbc/win32
+        from ..utils.mdb_shared import has_access_driver
+
         return has_access_driver()
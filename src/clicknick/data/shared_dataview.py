@@ -16,18 +16,26 @@ from pyclickplc.addresses import (
 from pyclickplc.addresses import (
     normalize_address as _normalize_address,
 )
+from pyclickplc.banks import BANKS
 
+from ..utils.filters import ContainsFilter, NoneFilter
 from ..views.dataview_editor.cdv_file import get_dataview_folder, list_cdv_files
+from .nickname_manager import NicknameManager
 
 if TYPE_CHECKING:
     from .data.address_store import AddressStore
 
+# The dataview combobox searches every memory type with a plain contains match
+_SEARCH_ADDRESS_TYPES = list(BANKS)
+_SEARCH_OPTIONS = ("contains", False, [])
+
 
 class SharedDataviewData:
     """Shared data for the Dataview Editor window.
 
     This class:
     - Provides nickname lookup via AddressStore (read-only shim)
+    - Keeps an indexed, A-Z sorted nickname search for the editor's combobox
     - Manages CDV file discovery in the project's DataView folder
     - Tracks the single dataview editor window
     - Observes AddressStore for automatic nickname refresh
@@ -50,6 +58,13 @@ class SharedDataviewData:
         self._store: AddressStore | None = None
         self._dataview_folder: Path | None = dataview_folder
 
+        # Nickname search for the combobox; patched incrementally as the store
+        # changes. Contains search needs no abbreviation tags, so no containsplus.
+        self._nickname_search = NicknameManager(
+            filter_strategies={"none": NoneFilter(), "contains": ContainsFilter()}
+        )
+        self._nickname_search.apply_sorting(sort_by_nickname=True)
+
         # Single window tracking (only one dataview editor at a time)
         self._window = None
 
@@ -95,6 +110,7 @@ class SharedDataviewData:
             self._store.remove_observer(self._on_address_data_changed)
 
         self._store = data
+        self._nickname_search.set_shared_data(data)
 
         # Register as observer on new shared data
         if self._store is not None:
@@ -133,6 +149,39 @@ class SharedDataviewData:
 
         return None
 
+    def search_nicknames(self, search_text: str, limit: int | None = None) -> tuple[list[str], int]:
+        """Find nicknames containing the search text (case-insensitive).
+
+        Matches are ranked exact, prefix, word-start, then other substring,
+        A-Z within each group. An empty search lists all nicknames A-Z.
+
+        Args:
+            search_text: Text to search for in nicknames
+            limit: Max number of nicknames to return (None for all)
+
+        Returns:
+            Tuple of (first matching nickname strings, total number of matches)
+        """
+        return self._nickname_search.get_top_nicknames(
+            _SEARCH_ADDRESS_TYPES, search_text.strip(), limit, search_options=_SEARCH_OPTIONS
+        )
+
+    def get_address_for_nickname(self, nickname: str) -> str | None:
+        """Get the display address for an exact nickname.
+
+        Args:
+            nickname: The exact nickname to look up
+
+        Returns:
+            The display address (lowest address if duplicated), or None if not found.
+        """
+        if not self._store:
+            return None
+        addr_keys = self._store.get_addr_keys_for_nickname(nickname)
+        if not addr_keys:
+            return None
+        return self._store.all_rows[min(addr_keys)].display_address
+
     def normalize_address(self, address: str) -> str | None:
         """Normalize an address string to its canonical display form.
 
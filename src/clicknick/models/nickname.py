@@ -1,11 +1,17 @@
+import sys
 from dataclasses import dataclass
 
 from pyclickplc.banks import DEFAULT_RETENTIVE
 
 
-@dataclass
+@dataclass(slots=True)
 class Nickname:
-    """Represents a nickname with its address and metadata"""
+    """Represents a nickname with its address and metadata.
+
+    Slotted (no per-instance __dict__) since NicknameManager keeps one per
+    named address. The small set of data/address type strings is interned,
+    and abbr_tags holds the filter's shared tag tuple rather than a copy.
+    """
 
     nickname: str
     address: str
@@ -15,7 +21,11 @@ class Nickname:
     comment: str = ""
     address_type: str = ""
     used: bool | None = None
-    abbr_tags: str = ""
+    abbr_tags: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        self.data_type_display = sys.intern(self.data_type_display)
+        self.address_type = sys.intern(self.address_type)
 
     @property
     def is_default_retentive(self) -> bool:
@@ -70,6 +70,19 @@ class NicknameIndexService:
             return set()
         return self._nickname_to_addrs.get(nickname, set()).copy()
 
+    def get_nicknames_with_prefix(self, prefix: str) -> list[str]:
+        """Get distinct nicknames that start with prefix (exact case).
+
+        Scans the index's distinct nicknames rather than every address.
+
+        Args:
+            prefix: The leading text to match
+
+        Returns:
+            List of matching nicknames
+        """
+        return [nickname for nickname in self._nickname_to_addrs if nickname.startswith(prefix)]
+
     def get_addr_keys_insensitive(self, nickname: str) -> set[int]:
         """Get addr_keys with case-insensitive match.
 
@@ -1,37 +1,212 @@
 import re
+from bisect import bisect_left
 from functools import lru_cache
+from itertools import accumulate
+
+from .tag_cache import TagCache
+
+# Fuzzy word starts: first char after a delimiter (or of the text), and humps
+# (uppercase after lowercase, first digit of a number)
+_FUZZY_BOUNDARY_PATTERN = re.compile(r"(?:^|(?<=[_\- ]))[^_\- ]")
+_FUZZY_CAMEL_PATTERN = re.compile(r"(?<=[a-z])[A-Z]|(?<=[^0-9])[0-9]")
+
+
+# Character codes are folded into this many bits; ASCII keeps one bit per character
+_CHAR_MASK_BITS = 128
+
+
+def _char_mask(text):
+    """Fixed-width bitmap with a bit per distinct character in text.
+
+    Codes beyond ASCII share bits with ASCII ones, so the mask is only a
+    conservative prefilter; the subsequence check confirms each match.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) % _CHAR_MASK_BITS)
+    return mask
+
+
+def _word_start_masks(original):
+    """Bitmaps of the positions in original.lower() that start a word, and that start a hump
+
+    Word starts are found on original, where case is still visible, and mapped
+    onto the lowercased text the matcher scores; a few characters ("İ") grow
+    when lowercased and shift every position after them.
+    """
+    if len(original.lower()) == len(original):
+        offsets = range(len(original))
+    else:
+        offsets = list(accumulate((len(char.lower()) for char in original), initial=0))
+    boundary = 0
+    for match in _FUZZY_BOUNDARY_PATTERN.finditer(original):
+        boundary |= 1 << offsets[match.start()]
+    camel = 0
+    for match in _FUZZY_CAMEL_PATTERN.finditer(original):
+        camel |= 1 << offsets[match.start()]
+    return boundary, camel
+
+
+def _prefix_upper_bound(prefix):
+    """Smallest string greater than every string starting with prefix"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SortedPrefixIndex:
+    """Sorted array of (key, position) pairs answering prefix queries with bisect.
+
+    Positions refer to the list the index was built from, so a lookup costs
+    O(log n + k) and results can be returned in the original list order.
+    """
+
+    def __init__(self, entries):
+        pairs = sorted(entries)
+        self.keys = [key for key, _ in pairs]
+        self.positions = [pos for _, pos in pairs]
+
+    def lookup(self, prefix):
+        """Return ascending positions of all keys starting with prefix"""
+        if not prefix:
+            return sorted(set(self.positions))
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, _prefix_upper_bound(prefix), lo)
+        return sorted(set(self.positions[lo:hi]))
+
+
+class TrigramIndex:
+    """Inverted index from lowercase trigrams to item positions.
+
+    Substring queries of 3+ characters only verify the items listed under the
+    query's rarest trigram. Shorter queries fall back to scanning the
+    pre-lowercased strings.
+    """
+
+    def __init__(self, completion_list):
+        self.originals = [str(item) for item in completion_list]
+        self.texts = [text.lower() for text in self.originals]
+        self.postings: dict[str, list[int]] = {}
+
+        postings = self.postings
+        for pos, text in enumerate(self.texts):
+            for gram in {text[i : i + 3] for i in range(len(text) - 2)}:
+                if gram in postings:
+                    postings[gram].append(pos)
+                else:
+                    postings[gram] = [pos]
+
+    def search(self, needle):
+        """Return ascending positions of texts containing needle (already lowercased)"""
+        texts = self.texts
+        if len(needle) < 3:
+            return [pos for pos, text in enumerate(texts) if needle in text]
+
+        rarest = None
+        for i in range(len(needle) - 2):
+            posting = self.postings.get(needle[i : i + 3])
+            if posting is None:
+                return []
+            if rarest is None or len(posting) < len(rarest):
+                rarest = posting
+        return [pos for pos in rarest if needle in texts[pos]]
+
+
+class ContainsPlusIndex:
+    """Trigram index for contains matching plus a tag-prefix index for abbreviations"""
+
+    def __init__(self, completion_list):
+        self.contains = TrigramIndex(completion_list)
+        self.abbreviations = SortedPrefixIndex(
+            (tag, pos)
+            for pos, item in enumerate(completion_list)
+            for tag in getattr(item, "abbr_tags", None) or ()
+        )
+
+    def abbreviation_positions(self, needle_variants):
+        """Positions of items with any tag starting with any needle variant"""
+        positions = set()
+        for variant in needle_variants:
+            positions.update(self.abbreviations.lookup(variant))
+        return positions
+
+
+class FuzzyIndex:
+    """Per-item character and word-start bitmaps for fuzzy matching.
+
+    char_masks has a bit per character present in each lowercased item, so an
+    item missing any query character is rejected with a single AND before the
+    subsequence check. boundary_masks and camel_masks mark word-start positions
+    for scoring.
+    """
+
+    def __init__(self, completion_list):
+        self.originals = [str(item) for item in completion_list]
+        self.texts = [text.lower() for text in self.originals]
+        self.char_masks = [_char_mask(text) for text in self.texts]
+        self.boundary_masks = []
+        self.camel_masks = []
+        for original in self.originals:
+            boundary, camel = _word_start_masks(original)
+            self.boundary_masks.append(boundary)
+            self.camel_masks.append(camel)
 
 
 class FilterBase:
     """Base class for autocomplete strategies"""
 
-    def filter_matches(self, completion_list, current_text):
-        """Filter completion list based on current text"""
+    def build_index(self, completion_list):
+        """Build a reusable search index over completion_list (None if unsupported)"""
+        return None
+
+    def filter_matches(self, completion_list, current_text, index=None):
+        """Filter completion list based on current text.
+
+        If given, index must come from build_index() on this same completion_list.
+        """
         raise NotImplementedError()
 
 
 class NoneFilter(FilterBase):
     """No filtering strategy"""
 
-    def filter_matches(self, completion_list, current_text):
+    def filter_matches(self, completion_list, current_text, index=None):
         return completion_list
 
 
 class PrefixFilter(FilterBase):
     """Simple prefix matching strategy"""
 
-    def filter_matches(self, completion_list, current_text):
+    def build_index(self, completion_list):
+        return SortedPrefixIndex(
+            (str(item).lower(), pos) for pos, item in enumerate(completion_list)
+        )
+
+    def filter_matches(self, completion_list, current_text, index=None):
         if not current_text:
             return completion_list
 
         current_text = current_text.lower()
+        if index is not None:
+            return [completion_list[pos] for pos in index.lookup(current_text)]
         return [item for item in completion_list if str(item).lower().startswith(current_text)]
 
 
 class ContainsFilter(FilterBase):
     """Contains matching strategy with word boundary prioritization"""
 
-    def filter_matches(self, completion_list, current_text):
+    def build_index(self, completion_list):
+        return TrigramIndex(completion_list)
+
+    @staticmethod
+    def _is_word_start_match(item_lower, original_item_str, current_lower):
+        """Check if match occurs after common word delimiters or before uppercase"""
+        match_pos = item_lower.find(current_lower)
+        return (
+            match_pos == 0
+            or original_item_str[match_pos - 1] in "_- "
+            or original_item_str[match_pos].isupper()
+        )
+
+    def filter_matches(self, completion_list, current_text, index=None):
         if not current_text:
             return completion_list
 
@@ -41,19 +216,23 @@ class ContainsFilter(FilterBase):
         word_start_matches = []
         other_matches = []
 
+        if index is not None:
+            originals = index.originals
+            texts = index.texts
+            for pos in index.search(current_lower):
+                item = completion_list[pos]
+                if self._is_word_start_match(texts[pos], originals[pos], current_lower):
+                    word_start_matches.append(item)
+                else:
+                    other_matches.append(item)
+            return word_start_matches + other_matches
+
         for item in completion_list:
             item_str = str(item).lower()
             if current_lower not in item_str:
                 continue
 
-            # Check if match occurs after common word delimiters or before uppercase
-            match_pos = item_str.find(current_lower)
-            original_item_str = str(item)
-            if (
-                match_pos == 0
-                or original_item_str[match_pos - 1] in "_- "
-                or original_item_str[match_pos].isupper()
-            ):
+            if self._is_word_start_match(item_str, str(item), current_lower):
                 word_start_matches.append(item)
             else:
                 other_matches.append(item)
@@ -61,6 +240,124 @@ class ContainsFilter(FilterBase):
         return word_start_matches + other_matches
 
 
+class FuzzyFilter(FilterBase):
+    """fzf-style subsequence matching, ranked by score.
+
+    Query characters must appear in order. Each matched character scores, with
+    bonuses at word starts and camel humps (doubled for the first character)
+    and for consecutive runs, and penalties for gaps. Ties keep list order.
+    """
+
+    SCORE_MATCH = 16
+    BONUS_BOUNDARY = 10
+    BONUS_CAMEL = 8
+    BONUS_CONSECUTIVE = 6
+    PENALTY_GAP_START = 3
+    PENALTY_GAP_EXTENSION = 1
+
+    def build_index(self, completion_list):
+        return FuzzyIndex(completion_list)
+
+    @staticmethod
+    def _match_positions(text, needle, start):
+        """Positions of needle as a subsequence of text[start:], tightened to the shortest span"""
+        pos = start - 1
+        for char in needle:
+            pos = text.find(char, pos + 1)
+            if pos < 0:
+                return None
+
+        # Walk back from the end to pick the latest start for that end
+        positions = []
+        pos += 1
+        for char in reversed(needle):
+            pos = text.rfind(char, 0, pos)
+            positions.append(pos)
+        positions.reverse()
+        return positions
+
+    def _score(self, positions, boundary_mask, camel_mask):
+        """Score matched positions using the item's word-start bitmaps"""
+        score = 0
+        prev = None
+        for pos in positions:
+            if boundary_mask >> pos & 1:
+                bonus = self.BONUS_BOUNDARY
+            elif camel_mask >> pos & 1:
+                bonus = self.BONUS_CAMEL
+            else:
+                bonus = 0
+
+            if prev is None:
+                score += self.SCORE_MATCH + 2 * bonus
+            elif pos == prev + 1:
+                score += self.SCORE_MATCH + bonus + self.BONUS_CONSECUTIVE
+            else:
+                gap = pos - prev - 1
+                score += (
+                    self.SCORE_MATCH
+                    + bonus
+                    - self.PENALTY_GAP_START
+                    - self.PENALTY_GAP_EXTENSION * (gap - 1)
+                )
+            prev = pos
+        return score
+
+    def _best_score(self, text, needle, boundary_mask, camel_mask):
+        """Best score over alignments starting at each occurrence of needle's first char"""
+        # No alignment can beat a word-start first char followed by a consecutive run
+        ceiling = (
+            self.SCORE_MATCH
+            + 2 * self.BONUS_BOUNDARY
+            + (len(needle) - 1) * (self.SCORE_MATCH + self.BONUS_BOUNDARY + self.BONUS_CONSECUTIVE)
+        )
+        best = None
+        start = text.find(needle[0])
+        while start >= 0:
+            positions = self._match_positions(text, needle, start)
+            if positions is None:
+                # No match from here means none from any later start either
+                break
+            score = self._score(positions, boundary_mask, camel_mask)
+            if best is None or score > best:
+                best = score
+                if best >= ceiling:
+                    break
+            start = text.find(needle[0], positions[0] + 1)
+        return best
+
+    def filter_matches(self, completion_list, current_text, index=None):
+        # Whitespace in the query is ignored ("tank lvl" matches as "tanklvl")
+        needle = "".join(current_text.lower().split())
+        if not needle:
+            return completion_list
+
+        scored = []
+        if index is not None:
+            needle_mask = _char_mask(needle)
+            texts = index.texts
+            boundary_masks = index.boundary_masks
+            camel_masks = index.camel_masks
+            for pos, char_mask in enumerate(index.char_masks):
+                if char_mask & needle_mask != needle_mask:
+                    continue
+                score = self._best_score(texts[pos], needle, boundary_masks[pos], camel_masks[pos])
+                if score is not None:
+                    scored.append((-score, pos))
+        else:
+            for pos, item in enumerate(completion_list):
+                original = str(item)
+                text = original.lower()
+                if self._match_positions(text, needle, 0) is None:
+                    continue
+                score = self._best_score(text, needle, *_word_start_masks(original))
+                scored.append((-score, pos))
+
+        # Best score first; equal scores keep list order
+        scored.sort()
+        return [completion_list[pos] for _, pos in scored]
+
+
 class ContainsPlusFilter(FilterBase):
     """Enhanced contains matching with abbreviation support - with caching"""
 
@@ -73,8 +370,15 @@ class ContainsPlusFilter(FilterBase):
     # underscores, spaces, and CamelCase
     WORD_BOUNDARY_PATTERN = re.compile(r"[_\s]+|(?<=[a-z])(?=[A-Z])")
 
-    def __init__(self):
+    # Bump whenever tag generation rules change, invalidating persisted tag caches
+    TAG_RULES_VERSION = 1
+
+    def __init__(self, tag_cache_path=None):
         self.contains_filter = ContainsFilter()
+        # Optional on-disk tag cache so cold starts skip tag generation
+        self.tag_cache = (
+            TagCache(tag_cache_path, self.TAG_RULES_VERSION) if tag_cache_path else None
+        )
         self._DT_PATTERNs = [
             (self.DT_PATTERN_1, r"\1\1\1\1 \2\2 \3\3"),
             (self.DT_PATTERN_2, r"\1\1\1\1 \2\2"),
@@ -105,13 +409,14 @@ class ContainsPlusFilter(FilterBase):
         }
 
     def split_into_words(self, text):
-        # Single regex operation instead of multiple substitutions
-        for pattern, replacement in self._DT_PATTERNs:
-            text = pattern.sub(replacement, text)
+        # Every date/time run (YYYYMMDD, HHMMSS, ...) contains two consecutive doubled
+        # letters, so one search lets most nicknames skip the four expansion passes
+        if self.DT_PATTERN_4.search(text) is not None:
+            for pattern, replacement in self._DT_PATTERNs:
+                text = pattern.sub(replacement, text)
 
         # Single split operation
-        words = [word for word in self.WORD_BOUNDARY_PATTERN.split(text) if len(word) > 1]
-        return words
+        return [word for word in self.WORD_BOUNDARY_PATTERN.split(text) if len(word) > 1]
 
     def _abbrword_special_case(self, word):
         """Special Abbreviation Cases"""
@@ -231,9 +536,8 @@ class ContainsPlusFilter(FilterBase):
                     return True
         return False
 
-    @lru_cache(maxsize=12000)  # noqa: B019
-    def _generate_tags_cached(self, text):
-        """Internal cached method that returns a tuple"""
+    def _compute_tags(self, text):
+        """Generate the sorted tag tuple for a nickname"""
         words = self.split_into_words(text)
         tags = []
 
@@ -254,57 +558,97 @@ class ContainsPlusFilter(FilterBase):
 
         return tuple(sorted(set(tags)))  # Return tuple for hashability
 
+    @lru_cache(maxsize=12000)  # noqa: B019
+    def _generate_tags_cached(self, text):
+        """Internal cached method that returns a tuple"""
+        if self.tag_cache is not None:
+            cached = self.tag_cache.get(text)
+            if cached is not None:
+                return cached
+            tags = self._compute_tags(text)
+            self.tag_cache.put(text, tags)
+            return tags
+        return self._compute_tags(text)
+
     def generate_tags(self, text):
         """Generate searchable tags for a nickname - returns list for compatibility"""
         return list(self._generate_tags_cached(text))
 
-    def _filter_single_word(self, completion_list, word):
+    def generate_tag_tuple(self, text):
+        """Generate searchable tags as the cached tuple, shared rather than copied"""
+        return self._generate_tags_cached(text)
+
+    def _contains_positions(self, completion_list, word, pool, index):
+        """Positions (within pool) of items containing word"""
+        word_lower = word.lower()
+        if index is not None:
+            return pool.intersection(index.contains.search(word_lower))
+        return {pos for pos in pool if word_lower in str(completion_list[pos]).lower()}
+
+    def _abbreviation_positions(self, completion_list, needle_variants, pool, index):
+        """Positions (within pool) of items whose abbreviation tags match a needle variant"""
+        if index is not None:
+            return pool.intersection(index.abbreviation_positions(needle_variants))
+        return {
+            pos for pos in pool if self.matches_abbreviation(completion_list[pos], needle_variants)
+        }
+
+    def _filter_single_word(self, completion_list, word, index=None):
         """Filter using cascading approach for single word searches"""
-        contains_matches = self.contains_filter.filter_matches(completion_list, word)
+        contains_index = index.contains if index is not None else None
+        contains_matches = self.contains_filter.filter_matches(
+            completion_list, word, index=contains_index
+        )
         contains_matched_ids = {id(item) for item in contains_matches}
-        remaining_items = [item for item in completion_list if id(item) not in contains_matched_ids]
-
         needle_variants = self.get_needle_variants(word)
+
+        if index is not None:
+            abbreviation_matches = [
+                completion_list[pos]
+                for pos in sorted(index.abbreviation_positions(needle_variants))
+                if id(completion_list[pos]) not in contains_matched_ids
+            ]
+            return contains_matches + abbreviation_matches
+
+        remaining_items = [item for item in completion_list if id(item) not in contains_matched_ids]
         abbreviation_matches = [
             item for item in remaining_items if self.matches_abbreviation(item, needle_variants)
         ]
         return contains_matches + abbreviation_matches
 
-    def _filter_multiple_words(self, completion_list, search_words):
+    def _filter_multiple_words(self, completion_list, search_words, index=None):
         """Filter using intersection approach for multiple word searches"""
         # Sort words by length (longer/more specific words first for faster elimination)
         search_words.sort(key=len, reverse=True)
 
-        matching_items = set(completion_list)
+        # Track candidates by position so results keep the completion list order
+        matching_positions = set(range(len(completion_list)))
 
         for word in search_words:
             # Early exit if no items match all previous words
-            if not matching_items:
+            if not matching_positions:
                 break
 
-            # Only search within current candidates (progressively smaller set)
-            current_candidates = list(matching_items)
-
-            # Get contains matches for this word
-            contains_matches = set(self.contains_filter.filter_matches(current_candidates, word))
+            # Get contains matches for this word (only within current candidates)
+            contains_matches = self._contains_positions(
+                completion_list, word, matching_positions, index
+            )
 
-            # Get abbreviation matches for this word
+            # Get abbreviation matches for the candidates not already matched
             needle_variants = self.get_needle_variants(word)
-            abbreviation_matches = {
-                item
-                for item in current_candidates
-                if self.matches_abbreviation(item, needle_variants)
-            }
-
-            # Combine both types of matches for this word
-            word_matches = contains_matches | abbreviation_matches
+            abbreviation_matches = self._abbreviation_positions(
+                completion_list, needle_variants, matching_positions - contains_matches, index
+            )
 
             # Keep only items that match this word too (intersection)
-            matching_items &= word_matches
+            matching_positions = contains_matches | abbreviation_matches
+
+        return [completion_list[pos] for pos in sorted(matching_positions)]
 
-        return list(matching_items)
+    def build_index(self, completion_list):
+        return ContainsPlusIndex(completion_list)
 
-    def filter_matches(self, completion_list, current_text):
+    def filter_matches(self, completion_list, current_text, index=None):
         """Find items that match ALL search words (intersection) with early termination optimization"""
         if not current_text:
             return completion_list
@@ -317,9 +661,9 @@ class ContainsPlusFilter(FilterBase):
 
         # Route to appropriate filtering method
         if len(search_words) == 1:
-            return self._filter_single_word(completion_list, search_words[0])
+            return self._filter_single_word(completion_list, search_words[0], index)
         else:
-            return self._filter_multiple_words(completion_list, search_words)
+            return self._filter_multiple_words(completion_list, search_words, index)
 
 
 def text_matches_filter(text: str, filter_text: str, anchor_start: bool, anchor_end: bool) -> bool:
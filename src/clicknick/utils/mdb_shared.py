@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-
-import pyodbc
+from typing import TYPE_CHECKING
 
 from ..utils.win32_utils import WIN32
 
+if TYPE_CHECKING:
+    import pyodbc
+
 PREFERRED_ACCESS_DRIVERS = [
     "Microsoft Access Driver (*.mdb, *.accdb)",
     "Microsoft Access Driver (*.mdb)",
@@ -35,6 +37,9 @@ def get_available_access_drivers() -> list[str]:
     Returns:
         List of available Access driver names
     """
+    # Imported on first use so app startup does not load the ODBC driver manager
+    import pyodbc
+
     try:
         return [driver for driver in pyodbc.drivers() if "Access" in driver]
     except Exception as e:
@@ -160,6 +165,8 @@ def create_access_connection(db_path: str | Path) -> pyodbc.Connection:
     Raises:
         RuntimeError: If no drivers available or all fail to connect
     """
+    import pyodbc
+
     available_drivers = get_available_access_drivers()
 
     if not available_drivers:
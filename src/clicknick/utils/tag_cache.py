@@ -0,0 +1,133 @@
+"""Persistent cache of ContainsPlus abbreviation tags.
+
+Tags are stored per nickname string in a gzipped JSON file in the user's
+app-data folder, so a cold start can skip regenerating them. The file records
+the tag rules version; a file written under different rules is ignored.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+# Max nicknames kept on disk; least recently used entries are dropped first
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def default_tag_cache_path() -> Path:
+    """Get the default location of the abbreviation tag cache file."""
+    base = Path(os.environ.get("LOCALAPPDATA", Path.home()))
+    return base / "ClickNick" / "abbr_tags.json.gz"
+
+
+class TagCache:
+    """Size-bounded on-disk mapping of nickname -> abbreviation tags.
+
+    The file is read on first lookup, not on construction. Entries are kept
+    in least-recently-used order (lookups and stores both count as a use)
+    and the least recently used are evicted beyond max_entries. Lookups only
+    reorder the entries in memory; the order reaches the file the next time
+    stores are written (snapshot() then write()).
+    """
+
+    def __init__(self, path: Path, rules_version: int, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.rules_version = rules_version
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[str, ...]] | None = None
+        # Entries stored since the last snapshot, and in the last snapshot
+        self._unsaved_puts = 0
+        self._snapshot_puts = 0
+        # Error from the last failed write(), if any
+        self.last_error: OSError | None = None
+
+    def _load(self) -> dict[str, tuple[str, ...]]:
+        """Read the cache file, ignoring it if missing, corrupt, or from other rules."""
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.rules_version:
+            return {}
+        tags = data.get("tags")
+        if not isinstance(tags, dict):
+            return {}
+
+        # Tags never contain whitespace, so each entry is stored space-joined
+        return {text: tuple(joined.split()) for text, joined in tags.items()}
+
+    @property
+    def entries(self) -> dict[str, tuple[str, ...]]:
+        """Get the cached entries, loading the file on first access."""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def get(self, text: str) -> tuple[str, ...] | None:
+        """Get the cached tags for a nickname, or None if not cached.
+
+        A hit moves the entry to the most recently used end (in memory only).
+        """
+        entries = self.entries
+        tags = entries.pop(text, None)
+        if tags is None:
+            return None
+        entries[text] = tags
+        return tags
+
+    def put(self, text: str, tags: tuple[str, ...]) -> None:
+        """Store the tags for a nickname, evicting least recently used entries beyond max_entries."""
+        entries = self.entries
+        entries.pop(text, None)
+        entries[text] = tags
+        while len(entries) > self.max_entries:
+            del entries[next(iter(entries))]
+        self._unsaved_puts += 1
+
+    @property
+    def unsaved_puts(self) -> int:
+        """Get the number of stores since the last snapshot (lookups do not count)."""
+        return self._unsaved_puts
+
+    def snapshot(self) -> dict | None:
+        """Copy the entries for writing if any were stored, and mark the cache clean.
+
+        Kept separate from write() so callers that generate tags under a lock
+        only need to hold it while copying, not while writing the file.
+
+        Returns:
+            The file contents to pass to write(), or None if nothing was stored
+        """
+        if not self._unsaved_puts or self._entries is None:
+            return None
+        self._snapshot_puts = self._unsaved_puts
+        self._unsaved_puts = 0
+        return {
+            "version": self.rules_version,
+            "tags": {text: " ".join(tags) for text, tags in self._entries.items()},
+        }
+
+    def write(self, data: dict) -> bool:
+        """Write a snapshot() to disk.
+
+        On failure the error is kept in last_error and the snapshot's stores
+        count as unsaved again, so a later save retries them.
+
+        Returns:
+            True if the file was written
+        """
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, "wt", compresslevel=1, encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving abbreviation tag cache: {e}")
+            self.last_error = e
+            self._unsaved_puts += self._snapshot_puts
+            return False
+        self.last_error = None
+        return True
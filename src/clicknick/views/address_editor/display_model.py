@@ -0,0 +1,143 @@
+"""Display data for the unified view, shared by every Address Editor tab.
+
+tksheet keeps a reference to the data and index lists it is given rather
+than copying them, so every AddressPanel's sheet can display the same
+lists. The model updates them in place once per store change; each panel
+keeps only its own filter, selection, checkboxes and styling.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyclickplc.banks import NON_EDITABLE_TYPES, DataType
+
+from .view_builder import find_paired_row
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from ...data.address_store import AddressStore
+    from ...models.address_row import AddressRow
+    from .view_builder import UnifiedView
+
+
+def build_row_display_data(row: AddressRow, rows_by_key: Mapping[int, AddressRow]) -> list:
+    """Build display data array for a single row.
+
+    Args:
+        row: The AddressRow to build display data for
+        rows_by_key: Current rows by addr_key (to resolve T/TD and CT/CTD pairs)
+
+    Returns:
+        List of display values for the row's columns
+    """
+
+    # Used column display
+    used_display = "\u2713" if row.used else ""
+
+    # Init value: logic to determine if we show "-", Checkbox (bool), or Text
+    paired_row = find_paired_row(row, rows_by_key)
+    effective_retentive = paired_row.retentive if paired_row else row.retentive
+
+    # If Retentive is ON and not exempt, force display to "-"
+    if effective_retentive and row.memory_type not in NON_EDITABLE_TYPES:
+        init_value_display = "-"
+    else:
+        # Otherwise show the underlying value
+        # For BIT types, return bool so tksheet knows to check/uncheck the checkbox
+        if row.data_type == DataType.BIT:
+            init_value_display = row.initial_value == "1"
+        else:
+            init_value_display = row.initial_value
+
+    # Retentive: TD/CTD rows share retentive with their paired T/CT row
+    retentive_display = effective_retentive
+
+    return [
+        used_display,
+        row.nickname,
+        row.comment,
+        init_value_display,
+        retentive_display,  # Boolean for checkbox
+    ]
+
+
+class AddressDisplayModel:
+    """Sheet cell data for a UnifiedView's rows, shared across panels.
+
+    data and index_data are handed to every panel's sheet as-is. Rows are
+    only ever updated in place, so the lists (and each row's list) keep
+    their identity for the lifetime of the view.
+    """
+
+    def _track_row_state(self, data_idx: int) -> None:
+        """Record whether a row currently has an error and is dirty."""
+        row = self.rows[data_idx]
+        if row.has_reportable_error:
+            self.error_rows.add(data_idx)
+        else:
+            self.error_rows.discard(data_idx)
+        if self._store.is_dirty(row.addr_key):
+            self.dirty_rows.add(data_idx)
+        else:
+            self.dirty_rows.discard(data_idx)
+
+    def __init__(self, store: AddressStore, view: UnifiedView):
+        self._store = store
+        self.rows = view.rows
+        self.row_index = view.row_index
+        self.section_boundaries = view.section_boundaries
+
+        visible_state = store.visible_state
+        self.data = [build_row_display_data(row, visible_state) for row in self.rows]
+        self.index_data = [row.display_address for row in self.rows]
+
+        # Lowercased (address, nickname, comment) per data index, stored with the
+        # row object they came from; edits replace rows, so stale entries miss
+        self.search_columns: list[tuple | None] = [None] * len(self.rows)
+
+        # Data indices of rows with reportable errors / user modifications,
+        # kept current by _update_row so panels can count without scanning
+        self.error_rows: set[int] = set()
+        self.dirty_rows: set[int] = set()
+        for data_idx in range(len(self.rows)):
+            self._track_row_state(data_idx)
+
+    def _update_row(self, data_idx: int) -> None:
+        """Sync one row (and its display data) with the store's visible_state."""
+        visible_state = self._store.visible_state
+        current = visible_state.get(self.rows[data_idx].addr_key)
+        if current is not None:
+            self.rows[data_idx] = current
+        self.data[data_idx][:] = build_row_display_data(self.rows[data_idx], visible_state)
+        self._track_row_state(data_idx)
+
+    def shows_init_checkbox(self, data_idx: int) -> bool:
+        """Check if a row's Init Value cell shows a checkbox (unmasked BIT)."""
+        row = self.rows[data_idx]
+        if row.data_type != DataType.BIT:
+            return False
+        paired_row = find_paired_row(row, self._store.visible_state)
+        effective_retentive = paired_row.retentive if paired_row else row.retentive
+        return not row.is_initial_value_masked(effective_retentive)
+
+    def refresh_targeted(self, addr_keys: set[int]) -> set[int]:
+        """Update the rows for changed addresses.
+
+        Args:
+            addr_keys: Set of address keys that changed
+
+        Returns:
+            Data indices of the rows in this view
+        """
+        row_index = self.row_index
+        row_indices = {row_index[addr_key] for addr_key in addr_keys if addr_key in row_index}
+        for data_idx in row_indices:
+            self._update_row(data_idx)
+        return row_indices
+
+    def refresh_all(self) -> None:
+        """Update every row after a change of unknown scope."""
+        for data_idx in range(len(self.rows)):
+            self._update_row(data_idx)
@@ -10,8 +10,8 @@ from collections.abc import Callable
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
-from pyclickplc.banks import DATA_TYPE_HINTS, NON_EDITABLE_TYPES, DataType
-from tksheet import num2alpha
+from pyclickplc.banks import DATA_TYPE_HINTS, DataType
+from tksheet import is_bool_like, num2alpha, try_to_bool
 
 from ...models.address_row import AddressRow
 from ...utils.filters import text_matches_filter
@@ -29,6 +29,10 @@ from .view_builder import find_paired_row
 
 if TYPE_CHECKING:
     from ...data.address_store import AddressStore
+    from .display_model import AddressDisplayModel
+
+# Delay after the last keystroke in the filter entry before re-filtering
+FILTER_DEBOUNCE_MS = 120
 
 # Mapping from column index to AddressRow field name for discard operations
 COL_TO_FIELD = {
@@ -160,6 +164,50 @@ class AddressPanel(ttk.Frame):
             # Row is not visible in current filter - clear saved selection
             pass
 
+    def _narrowing_base(
+        self, filter_text: str, anchor_start: bool, anchor_end: bool, row_filter: str
+    ) -> list[int] | None:
+        """Get the displayed rows to re-scan if the new text filter only narrows the last one.
+
+        Returns:
+            The previous matches, or None if every row must be scanned
+        """
+        if self._last_filter is None:
+            return None
+        last_text, last_start, last_end, last_row_filter = self._last_filter
+        if (last_start, last_end, last_row_filter) != (anchor_start, anchor_end, row_filter):
+            return None
+        if filter_text == last_text:
+            return self._displayed_rows
+
+        if anchor_start and anchor_end:
+            return None
+        if anchor_start:
+            extends = filter_text.startswith(last_text)
+        elif anchor_end:
+            extends = filter_text.endswith(last_text)
+        else:
+            extends = last_text in filter_text
+        return self._displayed_rows if extends else None
+
+    def _recount_modified(self) -> None:
+        """Rebuild the displayed-row set and modified rows after the filter changes."""
+        self._displayed_row_set = set(self._displayed_rows)
+        if self._model is None:
+            self._modified_rows = set()
+        else:
+            self._modified_rows = self._model.dirty_rows & self._displayed_row_set
+
+    def _update_status(self) -> None:
+        """Update the status label with current counts."""
+        total_visible = len(self._displayed_rows)
+        error_count = self.get_error_count()
+        modified_count = len(self._modified_rows)
+
+        self.status_label.config(
+            text=f"Rows: {total_visible} | Errors: {error_count} | Modified: {modified_count}"
+        )
+
     def _apply_filters(self) -> None:
         """Apply current filter settings using tksheet's display_rows().
 
@@ -168,6 +216,10 @@ class AddressPanel(ttk.Frame):
         - pattern$ - matches at end of field
         - ^pattern$ - exact match
         """
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
         # Save current selection before changing filter
         self._save_selection()
 
@@ -195,27 +247,42 @@ class AddressPanel(ttk.Frame):
             self._displayed_rows = list(range(len(self.rows)))
             self.sheet.display_rows("all", redraw=True)
         else:
+            # Re-scan only the previous matches when the text filter was just extended
+            candidates = self._narrowing_base(filter_text, anchor_start, anchor_end, row_filter)
+            if candidates is None:
+                candidates = range(len(self.rows))
+
+            rows = self.rows
+            search_columns = self._search_columns
+            dirty_keys = self._store.get_dirty_keys() if row_filter == "changed" else None
+
             # Build list of rows to display
             self._displayed_rows = []
-            for i, row in enumerate(self.rows):
+            for i in candidates:
+                row = rows[i]
+
                 # Filter by text (matches address, nickname, or comment)
                 if filter_text:
-                    addr_match = text_matches_filter(
-                        row.display_address.lower(), filter_text, anchor_start, anchor_end
-                    )
-                    nick_match = text_matches_filter(
-                        row.nickname.lower(), filter_text, anchor_start, anchor_end
-                    )
-                    comment_match = text_matches_filter(
-                        row.comment.lower(), filter_text, anchor_start, anchor_end
-                    )
-                    if not (addr_match or nick_match or comment_match):
+                    columns = search_columns[i]
+                    if columns is None or columns[0] is not row:
+                        columns = (
+                            row,
+                            row.display_address.lower(),
+                            row.nickname.lower(),
+                            row.comment.lower(),
+                        )
+                        search_columns[i] = columns
+                    if not (
+                        text_matches_filter(columns[1], filter_text, anchor_start, anchor_end)
+                        or text_matches_filter(columns[2], filter_text, anchor_start, anchor_end)
+                        or text_matches_filter(columns[3], filter_text, anchor_start, anchor_end)
+                    ):
                         continue
 
                 # Row filter modes
                 if row_filter == "content" and row.is_empty:
                     continue
-                if row_filter == "changed" and not self._store.is_dirty(row.addr_key):
+                if row_filter == "changed" and row.addr_key not in dirty_keys:
                     continue
                 if row_filter == "errors" and not row.has_reportable_error:
                     continue
@@ -224,9 +291,19 @@ class AddressPanel(ttk.Frame):
 
             self.sheet.display_rows(rows=self._displayed_rows, all_displayed=False, redraw=True)
 
+        self._last_filter = (filter_text, anchor_start, anchor_end, row_filter)
+        self._recount_modified()
+        self._update_status()
+
         # Restore selection after filter change
         self._restore_selection()
 
+    def _schedule_filters(self) -> None:
+        """Re-apply filters once typing in the filter entry pauses."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, self._apply_filters)
+
     def _on_sheet_modified(self, event) -> None:
         """Handle sheet modification events (called AFTER changes are applied).
 
@@ -288,7 +365,7 @@ class AddressPanel(ttk.Frame):
                         continue
 
                     # Check if row is masked by Retentive (showing "-")
-                    paired_row = find_paired_row(address_row, self.rows)
+                    paired_row = find_paired_row(address_row, self._store.visible_state)
                     effective_retentive = (
                         paired_row.retentive if paired_row else address_row.retentive
                     )
@@ -299,7 +376,14 @@ class AddressPanel(ttk.Frame):
 
                     # Standard update logic
                     if address_row.data_type == DataType.BIT:
-                        new_init = "1" if bool(new_value) else "0"
+                        # Cells not yet scrolled into view have no checkbox, so
+                        # pasted text arrives unconverted
+                        if not is_bool_like(new_value):
+                            self.sheet.set_cell_data(
+                                data_idx, col, address_row.initial_value == "1"
+                            )
+                            continue
+                        new_init = "1" if try_to_bool(new_value) else "0"
                     else:
                         new_init = new_value if new_value else ""
 
@@ -319,7 +403,7 @@ class AddressPanel(ttk.Frame):
                     new_retentive = bool(new_value)
 
                     # For TD/CTD rows, update the paired T/CT row instead
-                    paired_row = find_paired_row(address_row, self.rows)
+                    paired_row = find_paired_row(address_row, self._store.visible_state)
                     target_row = paired_row if paired_row else address_row
                     target_key = target_row.addr_key
 
@@ -499,6 +583,31 @@ class AddressPanel(ttk.Frame):
             note="Comment (max 128 chars)",
         )
 
+    def _materialize_checkboxes(self, event_data=None) -> None:
+        """Create Init Value checkboxes for BIT rows in or near the viewport."""
+        if self._styler is None:
+            return
+
+        created = False
+        for data_idx in self._styler.viewport_rows():
+            if data_idx in self._init_checkbox_rows:
+                continue
+            if not self._model.shows_init_checkbox(data_idx):
+                continue
+            row = self.rows[data_idx]
+            self.sheet.create_checkbox(
+                r=data_idx,
+                c=self.COL_INIT_VALUE,
+                checked=row.initial_value == "1",
+                state="normal" if row.can_edit_initial_value else "readonly",
+                text="",
+                redraw=False,
+            )
+            self._init_checkbox_rows.add(data_idx)
+            created = True
+        if created:
+            self.sheet.set_refresh_timer()
+
     def _create_widgets(self) -> None:
         """Create all panel widgets."""
         # Filter controls frame
@@ -517,7 +626,7 @@ class AddressPanel(ttk.Frame):
         self.filter_var = tk.StringVar()
         self.filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=15)
         self.filter_entry.pack(side=tk.LEFT, padx=(5, 0))
-        self.filter_var.trace_add("write", lambda *_: self._apply_filters())
+        self.filter_var.trace_add("write", lambda *_: self._schedule_filters())
 
         # Vertical separator between text filter and checkbox filters
         ttk.Separator(filter_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=10)
@@ -613,12 +722,16 @@ class AddressPanel(ttk.Frame):
         self.sheet.row_index(70)  # Set row index width
         self.sheet.readonly_columns([self.COL_USED])
 
+        # Every row has a Retentive checkbox, so one column-wide checkbox covers them
+        self.sheet.checkbox(self.sheet.span(num2alpha(self.COL_RETENTIVE)), edit_data=False)
+
         # Set up header notes with hints
         self._setup_header_notes()
 
         # Bind to <<SheetModified>> for post-edit processing ===
         # This fires AFTER the sheet has been modified, not during
         self.sheet.bind("<<SheetModified>>", self._on_sheet_modified)
+        self.sheet.bind("<<SheetRedrawn>>", self._materialize_checkboxes, add="+")
 
         # Apply initial column visibility
         self._toggle_used_column()
@@ -656,8 +769,23 @@ class AddressPanel(ttk.Frame):
         self.is_duplicate_fn = is_duplicate_fn
         self.section_boundaries = section_boundaries or {}
 
+        # Display data shared with the other panels (set by initialize_from_model)
+        self._model: AddressDisplayModel | None = None
         self.rows: list[AddressRow] = []
+        # addr_key -> index in self.rows (shared with the UnifiedView)
+        self._row_index: dict[int, int] = {}
         self._displayed_rows: list[int] = []  # Data indices of currently displayed rows
+        # Set view of _displayed_rows, and the displayed rows that are modified;
+        # rebuilt when the filter changes, updated per row by refresh_targeted
+        self._displayed_row_set: set[int] = set()
+        self._modified_rows: set[int] = set()
+
+        # Lowercased search columns per data index (shared, see AddressDisplayModel)
+        self._search_columns: list[tuple | None] = []
+        # (text, anchor_start, anchor_end, row_filter) that produced _displayed_rows,
+        # or None once row data has changed since
+        self._last_filter: tuple | None = None
+        self._filter_after_id: str | None = None
 
         # Flag to suppress change notifications during programmatic updates
         self._suppress_notifications = False
@@ -669,19 +797,10 @@ class AddressPanel(ttk.Frame):
         # Styler will be initialized after load_data() populates self.rows
         self._styler: AddressRowStyler | None = None
 
-        self._create_widgets()
+        # Data indices whose Init Value cell currently has a checkbox
+        self._init_checkbox_rows: set[int] = set()
 
-    def _update_status(self) -> None:
-        """Update the status label with current counts."""
-        total_visible = len(self._displayed_rows)
-        error_count = self.get_error_count()
-        modified_count = sum(
-            1 for idx in self._displayed_rows if self._store.is_dirty(self.rows[idx].addr_key)
-        )
-
-        self.status_label.config(
-            text=f"Rows: {total_visible} | Errors: {error_count} | Modified: {modified_count}"
-        )
+        self._create_widgets()
 
     def _refresh_display(self, modified_rows: set[int] | None = None) -> None:
         """Refresh styling and status.
@@ -697,88 +816,20 @@ class AddressPanel(ttk.Frame):
             else:
                 # Full refresh (for filter changes, etc.)
                 self._styler.apply_all_styling()
-        # Defer status update to avoid blocking the edit (iterates all rows)
-        self.after_idle(self._update_status)
+            self._materialize_checkboxes()
+        self._update_status()
         # Use set_refresh_timer() instead of redraw() to prevent multiple redraws
         # and ensure proper refresh after set_cell_data() calls
         self.sheet.set_refresh_timer()
 
-    def _build_row_display_data(self, row: AddressRow) -> list:
-        """Build display data array for a single row.
-
-        Args:
-            row: The AddressRow to build display data for
+    def _sync_init_checkbox(self, data_idx: int) -> None:
+        """Drop a row's Init Value checkbox once the cell shows "-" (or text).
 
-        Returns:
-            List of display values for the row's columns
+        Cells that need one get it when next in view (_materialize_checkboxes).
         """
-
-        # Used column display
-        used_display = "\u2713" if row.used else ""
-
-        # Init value: logic to determine if we show "-", Checkbox (bool), or Text
-        paired_row = find_paired_row(row, self.rows)
-        effective_retentive = paired_row.retentive if paired_row else row.retentive
-
-        # If Retentive is ON and not exempt, force display to "-"
-        if effective_retentive and row.memory_type not in NON_EDITABLE_TYPES:
-            init_value_display = "-"
-        else:
-            # Otherwise show the underlying value
-            # For BIT types, return bool so tksheet knows to check/uncheck the checkbox
-            if row.data_type == DataType.BIT:
-                init_value_display = row.initial_value == "1"
-            else:
-                init_value_display = row.initial_value
-
-        # Retentive: TD/CTD rows share retentive with their paired T/CT row
-        retentive_display = effective_retentive
-
-        return [
-            used_display,
-            row.nickname,
-            row.comment,
-            init_value_display,
-            retentive_display,  # Boolean for checkbox
-        ]
-
-    def _update_row_display(self, data_idx: int) -> None:
-        """Update display data for a single row after changes.
-
-        Args:
-            data_idx: Index into self.rows (data index, not display index)
-        """
-        row = self.rows[data_idx]
-        display_data = self._build_row_display_data(row)
-
-        # Update each cell in the row
-        for col, value in enumerate(display_data):
-            # Special handling for Init Value to switch between Checkbox and Text
-            if col == self.COL_INIT_VALUE:
-                # Always attempt to delete existing checkbox in this cell to ensure clean state
-                self.sheet.delete_checkbox(data_idx, col)
-
-                if value == "-":
-                    # Just set the text "-"
-                    self.sheet.set_cell_data(data_idx, col, value)
-                elif row.data_type == DataType.BIT:
-                    # It's a BIT type and not masked -> Create Checkbox
-                    is_checked = value is True
-                    state = "normal" if row.can_edit_initial_value else "readonly"
-                    self.sheet.create_checkbox(
-                        r=data_idx,
-                        c=col,
-                        checked=is_checked,
-                        state=state,
-                        text="",
-                    )
-                    # Also set the data model to the boolean value
-                    self.sheet.set_cell_data(data_idx, col, is_checked)
-                else:
-                    # Standard value (Word/Float/Text) -> Just set data
-                    self.sheet.set_cell_data(data_idx, col, value)
-            else:
-                self.sheet.set_cell_data(data_idx, col, value)
+        if data_idx in self._init_checkbox_rows and not self._model.shows_init_checkbox(data_idx):
+            self.sheet.delete_checkbox(data_idx, self.COL_INIT_VALUE)
+            self._init_checkbox_rows.discard(data_idx)
 
     def _keys_to_indices(self, addr_keys: set[int]) -> set[int]:
         """Convert address keys to row indices in this panel.
@@ -789,11 +840,8 @@ class AddressPanel(ttk.Frame):
         Returns:
             Set of row indices in self.rows
         """
-        indices = set()
-        for i, row in enumerate(self.rows):
-            if row.addr_key in addr_keys:
-                indices.add(i)
-        return indices
+        row_index = self._row_index
+        return {row_index[addr_key] for addr_key in addr_keys if addr_key in row_index}
 
     def toggle_filter_enabled(self, enabled: bool) -> None:
         """Toggle filter enabled state.
@@ -846,43 +894,33 @@ class AddressPanel(ttk.Frame):
         return True
 
     def _populate_sheet_data(self) -> None:
-        """Populate sheet with ALL row data (called once at load time).
+        """Point the sheet at the shared display data (called once at load time).
 
-        This sets up the full dataset and creates cell-specific checkboxes.
+        Retentive uses a column-wide checkbox (set up in _create_widgets);
+        Init Value checkboxes are created lazily by _materialize_checkboxes.
         """
-        # Build and set all data at once
-        data = [self._build_row_display_data(row) for row in self.rows]
-
-        self.sheet.set_sheet_data(data, reset_col_positions=False)
-        self.sheet.set_index_data([row.display_address for row in self.rows])
+        self.sheet.set_sheet_data(self._model.data, reset_col_positions=False)
+        self.sheet.set_index_data(self._model.index_data)
 
-        # Create checkboxes
-        for data_idx, row in enumerate(self.rows):
-            # Retentive checkbox
-            self.sheet.create_checkbox(
-                r=data_idx,
-                c=self.COL_RETENTIVE,
-                checked=row.retentive,
-                text="",
-            )
-            # Initial value checkbox
-            if row.data_type == DataType.BIT:
-                init_val = data[data_idx][self.COL_INIT_VALUE]
-                if init_val != "-":
-                    self.sheet.create_checkbox(
-                        r=data_idx,
-                        c=self.COL_INIT_VALUE,
-                        checked=(init_val is True),
-                        text="",
-                    )
+        # Init Value checkboxes are created as rows come into view
+        for data_idx in self._init_checkbox_rows:
+            self.sheet.delete_checkbox(data_idx, self.COL_INIT_VALUE)
+        self._init_checkbox_rows.clear()
 
-    def initialize_from_view(self, rows: list):
-        """Initializes the panel with row data and sets up styling.
+    def initialize_from_model(self, model: AddressDisplayModel):
+        """Initializes the panel with the shared display model and sets up styling.
 
         Note: Validation is handled by edit_session during data loading,
         so rows are already validated when this is called.
+
+        Args:
+            model: Display data shared by all panels over the same UnifiedView
         """
-        self.rows = rows
+        self._model = model
+        self.rows = model.rows
+        self._row_index = model.row_index
+        self._search_columns = model.search_columns
+        self._last_filter = None
 
         self._populate_sheet_data()
         self._apply_filters()
@@ -898,17 +936,19 @@ class AddressPanel(ttk.Frame):
         self._refresh_display()
 
     def refresh_from_external(self) -> None:
-        """Refresh all row displays after external data changes.
+        """Refresh the panel after external data changes.
 
-        Call this when AddressRow objects have been updated externally
-        to sync the sheet's cell data.
+        Call this after the shared display model has been updated
+        (AddressDisplayModel.refresh_all()); the sheet already shows its data.
 
         Note: Validation is handled by edit_session, so this only refreshes
         the display without re-validating.
         """
-        # Update all row displays to sync AddressRow data to sheet cells
-        for data_idx in range(len(self.rows)):
-            self._update_row_display(data_idx)
+        self._last_filter = None
+        self._recount_modified()
+
+        for data_idx in list(self._init_checkbox_rows):
+            self._sync_init_checkbox(data_idx)
 
         self._refresh_display()
 
@@ -916,7 +956,8 @@ class AddressPanel(ttk.Frame):
         """Refresh only specific rows after external data changes.
 
         More efficient than refresh_from_external() when only a few rows changed.
-        Used by observer callbacks to handle targeted updates from edit_session.
+        Used by observer callbacks to handle targeted updates from edit_session,
+        after the shared display model has updated those rows.
 
         Args:
             addr_keys: Set of address keys that changed
@@ -924,13 +965,8 @@ class AddressPanel(ttk.Frame):
         if not addr_keys:
             return
 
-        # Update the rows list from the store's visible_state
-        for i, row in enumerate(self.rows):
-            if row.addr_key in addr_keys:
-                # Get the updated row from the store
-                updated_row = self._store.visible_state.get(row.addr_key)
-                if updated_row:
-                    self.rows[i] = updated_row
+        # Changed rows may now match (or stop matching) the current filter
+        self._last_filter = None
 
         # Convert addr_keys to row indices in this panel
         row_indices = self._keys_to_indices(addr_keys)
@@ -938,24 +974,37 @@ class AddressPanel(ttk.Frame):
         if not row_indices:
             return
 
-        # Update display for affected rows only
+        dirty_rows = self._model.dirty_rows
         for data_idx in row_indices:
-            self._update_row_display(data_idx)
+            self._sync_init_checkbox(data_idx)
+            if data_idx in dirty_rows and data_idx in self._displayed_row_set:
+                self._modified_rows.add(data_idx)
+            else:
+                self._modified_rows.discard(data_idx)
 
         # Refresh styling for affected rows only (validation already done by edit_session)
         self._refresh_display(modified_rows=row_indices)
 
+    def destroy(self) -> None:
+        """Cancel a pending filter update before the widget goes away."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        super().destroy()
+
     def get_dirty_rows(self) -> list[AddressRow]:
         """Get all rows that have been modified."""
-        return [row for row in self.rows if self._store.is_dirty(row.addr_key)]
+        if self._model is None:
+            return []
+        return [self.rows[idx] for idx in sorted(self._model.dirty_rows)]
 
     def has_errors(self) -> bool:
         """Check if any rows have validation errors."""
-        return any(row.has_reportable_error for row in self.rows)
+        return self.get_error_count() > 0
 
     def get_error_count(self) -> int:
         """Get count of rows with validation errors."""
-        return sum(1 for row in self.rows if row.has_reportable_error)
+        return len(self._model.error_rows) if self._model is not None else 0
 
     def _highlight_row(self, data_idx: int, duration_ms: int = 1500) -> None:
         """Temporarily highlight a row to draw user attention.
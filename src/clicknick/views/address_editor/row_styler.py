@@ -33,6 +33,15 @@ if TYPE_CHECKING:
 # Number of data columns in the sheet
 NUM_COLUMNS = 5
 
+# Rows above and below the viewport styled ahead of scrolling
+VIEWPORT_MARGIN_ROWS = 50
+
+# Highlight key for the row index canvas (other keys are column numbers)
+ROW_INDEX = "row_index"
+
+# Fields with dirty highlights and "Original:" notes
+STYLED_FIELDS = ("nickname", "comment", "initial_value", "retentive")
+
 
 class AddressRowStyler:
     """Encapsulates ALL styling logic for AddressPanel sheets.
@@ -44,6 +53,13 @@ class AddressRowStyler:
     - Non-editable styling (gray bg for SC/SD/XD/YD)
     - Temporary highlight (green flash on navigation)
 
+    Only rows in or near the viewport are styled; the rest are styled when
+    scrolled into view (on <<SheetRedrawn>>). Each styled row remembers the
+    signature of the state it was styled from, so revisiting an unchanged
+    row costs one signature comparison. A row whose state did change is
+    diffed against the highlights and notes last applied to it, so only
+    cells whose style changed are touched.
+
     Usage:
         styler = AddressRowStyler(
             sheet=self.sheet,
@@ -51,33 +67,10 @@ class AddressRowStyler:
             get_rows=lambda: self.rows,
             get_displayed_rows=lambda: self._displayed_rows,
         )
-        styler.apply_all_styling()  # Full refresh
+        styler.apply_all_styling()  # Re-check the viewport
         styler.update_rows_styling({data_idx})  # Single row update
     """
 
-    def __init__(
-        self,
-        sheet: Sheet,
-        store: AddressStore,
-        get_rows: Callable[[], list[AddressRow]],
-        get_displayed_rows: Callable[[], list[int]],
-    ):
-        """Initialize the styler.
-
-        Args:
-            sheet: The tksheet Sheet instance
-            store: The AddressStore for dirty checking
-            get_rows: Callable returning the current list of AddressRow
-            get_displayed_rows: Callable returning current displayed row indices
-        """
-        self.sheet = sheet
-        self._store = store
-        self._get_rows = get_rows
-        self._get_displayed_rows = get_displayed_rows
-
-        # Track pending highlight clear callbacks
-        self._pending_highlight_clears: dict[int, str] = {}  # data_idx -> after_id
-
     def _is_field_dirty(self, addr_key: int, field: str) -> bool:
         """Check if a specific field is dirty."""
         return self._store.is_field_dirty(addr_key, field)
@@ -89,280 +82,252 @@ class AddressRowStyler:
             return getattr(base_row, field, None)
         return None
 
-    def _apply_row_highlights(
-        self,
-        data_idx: int,
-    ) -> None:
-        """Apply highlights for a single row."""
+    def _compute_row_highlights(self, data_idx: int) -> dict[int | str, tuple[str, str | None]]:
+        """Compute the highlights a row should have.
+
+        Rules are applied in order and a later rule replaces an earlier
+        highlight on the same cell (as highlight_cells does).
+
+        Returns:
+            Dict mapping column (or ROW_INDEX) -> (bg, fg)
+        """
         row = self._get_rows()[data_idx]
         addr_key = row.addr_key
+        highlights: dict[int | str, tuple[str, str | None]] = {}
 
         # 1. Block color on row index (from store's block_colors dict)
         block_color = self._store.get_block_color(row.addr_key)
         if block_color:
             hex_color = get_block_color_hex(block_color)
             if hex_color:
-                self.sheet.highlight_cells(
-                    row=data_idx,
-                    bg=hex_color,
-                    canvas="row_index",
-                )
+                highlights[ROW_INDEX] = (hex_color, None)
 
         # 2. Interleaved secondary type alternation (light blue for TD/CTD rows)
         if row.is_interleaved_secondary:
             for col in range(NUM_COLUMNS):
-                self.sheet.highlight_cells(
-                    row=data_idx,
-                    column=col,
-                    bg=COLOR_COMBINED_TYPE_ALT,
-                )
+                highlights[col] = (COLOR_COMBINED_TYPE_ALT, None)
 
         # 3. Error highlighting (nickname column) - takes priority over dirty
         if not row.nickname_valid and row.nickname:
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_NICKNAME,
-                bg=COLOR_ERROR_BG,
-                fg="black",
-            )
+            highlights[COL_NICKNAME] = (COLOR_ERROR_BG, "black")
         elif self._is_field_dirty(addr_key, "nickname"):
             # Dirty nickname gets light yellow background
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_NICKNAME,
-                bg=COLOR_DIRTY_BG,
-                fg="black",
-            )
+            highlights[COL_NICKNAME] = (COLOR_DIRTY_BG, "black")
 
         # 4. Comment error or dirty highlighting
         if not row.comment_valid and row.comment != "":
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_COMMENT,
-                bg=COLOR_ERROR_BG,
-                fg="black",
-            )
+            highlights[COL_COMMENT] = (COLOR_ERROR_BG, "black")
         elif self._is_field_dirty(addr_key, "comment"):
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_COMMENT,
-                bg=COLOR_DIRTY_BG,
-                fg="black",
-            )
+            highlights[COL_COMMENT] = (COLOR_DIRTY_BG, "black")
 
         # 5. Dirty initial value gets light yellow background
         if self._is_field_dirty(addr_key, "initial_value"):
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_INIT_VALUE,
-                bg=COLOR_DIRTY_BG,
-                fg="black",
-            )
+            highlights[COL_INIT_VALUE] = (COLOR_DIRTY_BG, "black")
 
         # 6. Dirty retentive gets light yellow background
         if self._is_field_dirty(addr_key, "retentive"):
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_RETENTIVE,
-                bg=COLOR_DIRTY_BG,
-                fg="black",
-            )
+            highlights[COL_RETENTIVE] = (COLOR_DIRTY_BG, "black")
 
         # 7. Invalid initial value gets red background
         if not row.initial_value_valid and row.initial_value != "":
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_INIT_VALUE,
-                bg=COLOR_ERROR_BG,
-                fg="black",
-            )
+            highlights[COL_INIT_VALUE] = (COLOR_ERROR_BG, "black")
 
         # 8. Non-editable types get gray background on init/retentive columns
         if not row.can_edit_initial_value:
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_INIT_VALUE,
-                bg=COLOR_NON_EDITABLE_BG,
-                fg=COLOR_NON_EDITABLE_FG,
-            )
-            self.sheet.highlight_cells(
-                row=data_idx,
-                column=COL_RETENTIVE,
-                bg=COLOR_NON_EDITABLE_BG,
-                fg=COLOR_NON_EDITABLE_FG,
-            )
+            highlights[COL_INIT_VALUE] = (COLOR_NON_EDITABLE_BG, COLOR_NON_EDITABLE_FG)
+            highlights[COL_RETENTIVE] = (COLOR_NON_EDITABLE_BG, COLOR_NON_EDITABLE_FG)
+
+        return highlights
+
+    def _dirty_note(self, addr_key: int, field: str) -> str | None:
+        """Get the "Original:" note text for a dirty field, or None if clean."""
+        if self._is_field_dirty(addr_key, field):
+            base_value = self._get_base_value(addr_key, field)
+            if base_value is not None:
+                return str(base_value)
+        return None
+
+    def _compute_row_notes(self, data_idx: int) -> dict[int, CellNote]:
+        """Compute the notes a row should have.
+
+        Returns:
+            Dict mapping column -> CellNote (columns without a note are omitted)
+        """
+        row = self._get_rows()[data_idx]
+        addr_key = row.addr_key
+
+        nick_error = row.nickname_error if (not row.nickname_valid and row.nickname) else None
+        init_error = (
+            row.initial_value_error
+            if (not row.initial_value_valid and row.initial_value != "")
+            else None
+        )
+        comment_error = row.comment_error if (not row.comment_valid and row.comment != "") else None
+
+        notes = {
+            COL_NICKNAME: CellNote(nick_error, self._dirty_note(addr_key, "nickname")),
+            COL_INIT_VALUE: CellNote(init_error, self._dirty_note(addr_key, "initial_value")),
+            COL_COMMENT: CellNote(comment_error, self._dirty_note(addr_key, "comment")),
+            COL_RETENTIVE: CellNote(None, self._dirty_note(addr_key, "retentive")),
+        }
+        return {col: cell_note for col, cell_note in notes.items() if cell_note}
 
     # --- Internal Methods ---
 
-    def _apply_highlights(self) -> None:
-        """Apply all highlight_cells calls for displayed rows."""
-        displayed = self._get_displayed_rows()
+    def _row_signature(self, data_idx: int) -> tuple:
+        """Get everything a row's highlights and notes depend on.
+
+        AddressRow is immutable and compares by value, so it covers validation
+        and the displayed values; the store supplies block color and dirty state.
+        """
+        row = self._get_rows()[data_idx]
+        addr_key = row.addr_key
+        dirty = tuple(
+            (field, self._get_base_value(addr_key, field))
+            for field in STYLED_FIELDS
+            if self._is_field_dirty(addr_key, field)
+        )
+        return (row, self._store.get_block_color(addr_key), dirty)
 
-        for data_idx in displayed:
-            self._apply_row_highlights(data_idx)
+    def _apply_row_diff(self, data_idx: int) -> bool:
+        """Bring a row's highlights and notes to their computed state.
 
-    def _compute_target_notes(self) -> dict[tuple[int, int], CellNote]:
-        """Compute what notes should exist for displayed rows.
+        Only cells whose highlight or note differs from what was last
+        applied get a sheet call.
 
         Returns:
-            Dict mapping (row, col) -> CellNote
+            True if any highlight or note was changed
         """
-        target: dict[tuple[int, int], CellNote] = {}
-        displayed = self._get_displayed_rows()
+        sheet = self.sheet
+        target_highlights = self._compute_row_highlights(data_idx)
+        target_notes = self._compute_row_notes(data_idx)
+        applied_highlights = self._applied_highlights.get(data_idx, {})
+        applied_notes = self._applied_notes.get(data_idx, {})
+        changed = False
+
+        for key in applied_highlights.keys() - target_highlights.keys():
+            if key == ROW_INDEX:
+                sheet.dehighlight_cells(row=data_idx, canvas="row_index", redraw=False)
+            else:
+                sheet.dehighlight_cells(row=data_idx, column=key, redraw=False)
+            changed = True
+        for key, (bg, fg) in target_highlights.items():
+            if applied_highlights.get(key) == (bg, fg):
+                continue
+            if key == ROW_INDEX:
+                sheet.highlight_cells(row=data_idx, bg=bg, fg=fg, canvas="row_index", redraw=False)
+            else:
+                sheet.highlight_cells(row=data_idx, column=key, bg=bg, fg=fg, redraw=False)
+            changed = True
+
+        for col in applied_notes.keys() - target_notes.keys():
+            sheet.note(data_idx, col, note=None)
+            sheet.cell_notes.pop((data_idx, col), None)
+            changed = True
+        for col, cell_note in target_notes.items():
+            if applied_notes.get(col) == cell_note:
+                continue
+            sheet.note(data_idx, col, note=str(cell_note))
+            sheet.cell_notes[(data_idx, col)] = cell_note
+            changed = True
+
+        self._applied_highlights[data_idx] = target_highlights
+        self._applied_notes[data_idx] = target_notes
+        return changed
+
+    def _style_row(self, data_idx: int) -> bool:
+        """Restyle a row if its state changed since it was last styled.
 
-        rows = self._get_rows()
-        for data_idx in displayed:
-            row = rows[data_idx]
-            addr_key = row.addr_key
-
-            # Nickname note (error and/or dirty)
-            nick_error = row.nickname_error if (not row.nickname_valid and row.nickname) else None
-            nick_dirty = None
-            if self._is_field_dirty(addr_key, "nickname"):
-                base_nick = self._get_base_value(addr_key, "nickname")
-                if base_nick is not None:
-                    nick_dirty = str(base_nick)
-            if nick_error or nick_dirty:
-                target[(data_idx, COL_NICKNAME)] = CellNote(
-                    error_note=nick_error, dirty_note=nick_dirty
-                )
-
-            # Init value note (error and/or dirty)
-            init_error = (
-                row.initial_value_error
-                if (not row.initial_value_valid and row.initial_value != "")
-                else None
-            )
-            init_dirty = None
-            if self._is_field_dirty(addr_key, "initial_value"):
-                base_init = self._get_base_value(addr_key, "initial_value")
-                if base_init is not None:
-                    init_dirty = str(base_init)
-            if init_error or init_dirty:
-                target[(data_idx, COL_INIT_VALUE)] = CellNote(
-                    error_note=init_error, dirty_note=init_dirty
-                )
-
-            # Comment note (error and/or dirty)
-            comment_error = (
-                row.comment_error if (not row.comment_valid and row.comment != "") else None
-            )
-            comment_dirty = None
-            if self._is_field_dirty(addr_key, "comment"):
-                base_comment = self._get_base_value(addr_key, "comment")
-                if base_comment is not None:
-                    comment_dirty = str(base_comment)
-            if comment_error or comment_dirty:
-                target[(data_idx, COL_COMMENT)] = CellNote(
-                    error_note=comment_error, dirty_note=comment_dirty
-                )
-
-            # Retentive note (dirty only)
-            if self._is_field_dirty(addr_key, "retentive"):
-                base_ret = self._get_base_value(addr_key, "retentive")
-                if base_ret is not None:
-                    target[(data_idx, COL_RETENTIVE)] = CellNote(dirty_note=str(base_ret))
-
-        return target
-
-    def _update_notes(self) -> None:
-        """Update all cell notes for displayed rows."""
-        # Clear all existing notes first
-        self.sheet.cell_notes.clear()
-
-        # Build and apply target notes
-        target_notes = self._compute_target_notes()
-        for cell_key, cell_note in target_notes.items():
-            self.sheet.note(cell_key[0], cell_key[1], note=str(cell_note))
-            self.sheet.cell_notes[cell_key] = cell_note
+        Returns:
+            True if highlights or notes were changed
+        """
+        signature = self._row_signature(data_idx)
+        if self._row_signatures.get(data_idx) == signature:
+            return False
 
-    # --- Public API ---
+        self._row_signatures[data_idx] = signature
+        return self._apply_row_diff(data_idx)
 
-    def apply_all_styling(self) -> None:
-        """Apply full styling refresh (dehighlight all, then apply).
+    def _style_viewport(self) -> None:
+        """Style the rows in or near the viewport, skipping unchanged rows."""
+        changed = False
+        for data_idx in self.viewport_rows():
+            changed = self._style_row(data_idx) or changed
+        if changed:
+            self.sheet.set_refresh_timer()
+
+    def _on_sheet_redrawn(self, event_data) -> None:
+        """Style rows that scrolled (or were filtered) into view."""
+        self._style_viewport()
+
+    def __init__(
+        self,
+        sheet: Sheet,
+        store: AddressStore,
+        get_rows: Callable[[], list[AddressRow]],
+        get_displayed_rows: Callable[[], list[int]],
+    ):
+        """Initialize the styler.
 
-        Call after filter changes or major data changes.
+        Args:
+            sheet: The tksheet Sheet instance
+            store: The AddressStore for dirty checking
+            get_rows: Callable returning the current list of AddressRow
+            get_displayed_rows: Callable returning current displayed row indices
         """
-        self.sheet.dehighlight_all()
-        self._apply_highlights()
-        self._update_notes()
+        self.sheet = sheet
+        self._store = store
+        self._get_rows = get_rows
+        self._get_displayed_rows = get_displayed_rows
 
-    def _clear_row_highlights(self, data_idx: int) -> None:
-        """Clear highlights for a single row."""
-        for col in range(NUM_COLUMNS):
-            self.sheet.dehighlight_cells(row=data_idx, column=col)
-        self.sheet.dehighlight_cells(row=data_idx, canvas="row_index")
+        # Track pending highlight clear callbacks
+        self._pending_highlight_clears: dict[int, str] = {}  # data_idx -> after_id
 
-    def _update_row_notes(self, data_idx: int) -> None:
-        """Update notes for a single row."""
-        row = self._get_rows()[data_idx]
-        addr_key = row.addr_key
+        # data_idx -> signature of the state its highlights and notes were built from
+        self._row_signatures: dict[int, tuple] = {}
 
-        # Helper to set a single cell note
-        def set_cell_note(col: int, error_note: str | None, dirty_note: str | None) -> None:
-            cell_key = (data_idx, col)
-            if error_note or dirty_note:
-                cell_note = CellNote(error_note=error_note, dirty_note=dirty_note)
-                self.sheet.note(data_idx, col, note=str(cell_note))
-                self.sheet.cell_notes[cell_key] = cell_note
-            else:
-                self.sheet.note(data_idx, col, note=None)
-                self.sheet.cell_notes.pop(cell_key, None)
+        # Highlights and notes last applied to each row, to diff against
+        self._applied_highlights: dict[int, dict[int | str, tuple[str, str | None]]] = {}
+        self._applied_notes: dict[int, dict[int, CellNote]] = {}
 
-        # Nickname
-        nick_error = row.nickname_error if (not row.nickname_valid and row.nickname) else None
-        nick_dirty = None
-        if self._is_field_dirty(addr_key, "nickname"):
-            base_nick = self._get_base_value(addr_key, "nickname")
-            if base_nick is not None:
-                nick_dirty = str(base_nick)
-        set_cell_note(COL_NICKNAME, nick_error, nick_dirty)
-
-        # Init value
-        init_error = (
-            row.initial_value_error
-            if (not row.initial_value_valid and row.initial_value != "")
-            else None
-        )
-        init_dirty = None
-        if self._is_field_dirty(addr_key, "initial_value"):
-            base_init = self._get_base_value(addr_key, "initial_value")
-            if base_init is not None:
-                init_dirty = str(base_init)
-        set_cell_note(COL_INIT_VALUE, init_error, init_dirty)
+        self.sheet.bind("<<SheetRedrawn>>", self._on_sheet_redrawn, add="+")
 
-        # Comment
-        comment_error = row.comment_error if (not row.comment_valid and row.comment != "") else None
-        comment_dirty = None
-        if self._is_field_dirty(addr_key, "comment"):
-            base_comment = self._get_base_value(addr_key, "comment")
-            if base_comment is not None:
-                comment_dirty = str(base_comment)
-        set_cell_note(COL_COMMENT, comment_error, comment_dirty)
-
-        # Retentive
-        retentive_dirty = None
-        if self._is_field_dirty(addr_key, "retentive"):
-            base_ret = self._get_base_value(addr_key, "retentive")
-            if base_ret is not None:
-                retentive_dirty = str(base_ret)
-        set_cell_note(COL_RETENTIVE, None, retentive_dirty)
+    def viewport_rows(self) -> list[int]:
+        """Get the data indices of displayed rows in or near the viewport."""
+        displayed = self._get_displayed_rows()
+        start, end = self.sheet.visible_rows
+        start = max(start - VIEWPORT_MARGIN_ROWS, 0)
+        return displayed[start : end + VIEWPORT_MARGIN_ROWS]
+
+    # --- Public API ---
+
+    def apply_all_styling(self) -> None:
+        """Bring styling up to date for the rows in or near the viewport.
+
+        Call after filter changes or major data changes. Rows elsewhere are
+        checked when they are scrolled into view, so the cost does not grow
+        with the number of rows.
+        """
+        self._style_viewport()
 
     def update_rows_styling(self, data_indices: set[int]) -> None:
         """Update styling for specific rows only (incremental update).
 
-        Much faster than apply_all_styling() for single-cell edits.
+        Rows in or near the viewport are restyled now; the others are
+        restyled when next scrolled into view.
 
         Args:
             data_indices: Set of data row indices to update
         """
+        viewport = set(self.viewport_rows())
+        changed = False
         for data_idx in data_indices:
-            # Clear existing highlights for this row
-            self._clear_row_highlights(data_idx)
-            # Re-apply highlights
-            self._apply_row_highlights(data_idx)
-            # Update notes for this row
-            self._update_row_notes(data_idx)
+            if data_idx in viewport:
+                changed = self._style_row(data_idx) or changed
+            else:
+                self._row_signatures.pop(data_idx, None)
+        if changed:
+            self.sheet.set_refresh_timer()
 
     def highlight_row_temporary(
         self,
@@ -392,13 +357,18 @@ class AddressRowStyler:
         )
         self.sheet.set_refresh_timer()
 
+        # Record the flash as applied so restoring the row diffs against it.
+        # The signature is kept, so redraws leave the flash alone until it is cleared
+        flash = (COLOR_HIGHLIGHT_TEMP, None)
+        self._applied_highlights[data_idx] = dict.fromkeys([*range(NUM_COLUMNS), ROW_INDEX], flash)
+
         # Schedule removal of highlight
         if after_func:
 
             def clear_highlight() -> None:
-                self._clear_row_highlights(data_idx)
                 # Re-apply normal styling
-                self._apply_row_highlights(data_idx)
+                self._row_signatures.pop(data_idx, None)
+                self._style_row(data_idx)
                 self.sheet.set_refresh_timer()
                 # Remove from pending
                 if data_idx in self._pending_highlight_clears:
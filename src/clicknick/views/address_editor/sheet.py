@@ -8,7 +8,6 @@ from tkinter import messagebox
 from typing import TYPE_CHECKING
 
 from tksheet import Sheet
-from tksheet.formatters import data_to_str
 from tksheet.functions import bisect_in, try_binding
 
 from .panel_constants import COL_COMMENT, COL_NICKNAME
@@ -68,44 +67,43 @@ class AddressEditorSheet(Sheet):
             MT.find_see_and_set(MT.find_all_cells(find, reverse=reverse), within=within)
         return "break"
 
+    def _cell_search_str(self, r: int, c: int) -> str:
+        """Get the text find/replace sees for the cell at data indices (r, c).
+
+        Nickname and Comment cells hold plain strings, which are used as-is;
+        anything else goes through tksheet so formatters are respected.
+        """
+        try:
+            value = self.MT.data[r][c]
+        except IndexError:
+            return ""
+        if isinstance(value, str):
+            return value
+        if value is None:
+            return ""
+        return str(self.MT.get_cell_data(r, c, True) or "")
+
     def _regex_find_match(self, find_str: str, r: int, c: int) -> bool:
         """Check if cell at (r, c) matches the regex pattern find_str.
 
         This replaces the default find_match which uses 'in' operator.
         Falls back to substring match if regex is invalid.
         Only searches in Nickname and Comment columns.
-        Handles formatters like the original tksheet implementation.
         """
         # Only search in allowed columns
         if c not in self._SEARCHABLE_COLS:
             return False
 
-        # Get raw value from data
-        try:
-            value = self.MT.data[r][c]
-        except Exception:
-            value = ""
-
-        # Handle formatters
-        kwargs = self.MT.get_cell_kwargs(r, c, key="format")
-        if kwargs:
-            value = data_to_str(value, **kwargs) if kwargs["formatter"] is None else str(value)
-
-        # Handle None/empty cases
-        if value is None:
-            return find_str == ""
-        elif not find_str:
-            return str(value) == ""
-
-        # Regex search instead of substring
-        cell_str = str(value)
+        cell_str = self._cell_search_str(r, c)
+        if not find_str:
+            return cell_str == ""
 
         # Don't match empty cells with non-empty regex patterns (e.g., .*)
-        if not cell_str and find_str:
+        if not cell_str:
             return False
 
         try:
-            return bool(re.search(find_str, cell_str))
+            return re.compile(find_str).search(cell_str) is not None
         except re.error:
             # If regex is invalid, fall back to simple substring match
             return find_str in cell_str
@@ -306,9 +304,10 @@ class AddressEditorSheet(Sheet):
         event_data = self.MT.new_event_dict("edit_table")
         event_data["selection_boxes"] = self.MT.get_boxes()
 
-        # Get the range of cells to search
+        # Get the range of cells to search (data indices, searchable columns only)
         # Selection boxes store DISPLAY indices, so we need to convert to data indices
-        if selection_only and self.MT.selection_boxes:
+        MT = self.MT
+        if selection_only and MT.selection_boxes:
             from itertools import chain
 
             from tksheet.functions import box_gen_coords
@@ -324,73 +323,64 @@ class AddressEditorSheet(Sheet):
                     start_c=box.coords.from_c,
                     reverse=False,
                 )
-                for box in self.MT.selection_boxes.values()
+                for box in MT.selection_boxes.values()
             )
             # Convert display indices to data indices
-            iterable = (
-                (self.MT.datarn(disp_r), self.MT.datacn(disp_c))
+            # No visibility check needed - selection is already visible
+            cells = (
+                (MT.datarn(disp_r), datacn)
                 for disp_r, disp_c in display_iterable
+                if (datacn := MT.datacn(disp_c)) in self._SEARCHABLE_COLS
             )
-            # No visibility check needed - selection is already visible
-            check_visibility = False
         else:
-            from tksheet.functions import box_gen_coords
-
-            total_rows = self.MT.total_data_rows(include_index=False)
-            total_cols = self.MT.total_data_cols(include_header=False)
-            iterable = box_gen_coords(
-                from_r=0,
-                from_c=0,
-                upto_r=total_rows,
-                upto_c=total_cols,
-                start_r=0,
-                start_c=0,
-                reverse=False,
-            )
-            # Check visibility when iterating all data rows (unless visible_rows_only is False)
-            check_visibility = visible_rows_only
+            # Only visible rows and columns unless visible_rows_only is False
+            if not visible_rows_only or MT.PAR.ops.treeview or MT.all_rows_displayed:
+                rows = range(MT.total_data_rows(include_index=False))
+            else:
+                rows = MT.displayed_rows
+            total_cols = MT.total_data_cols(include_header=False)
+            cols = [
+                c
+                for c in sorted(self._SEARCHABLE_COLS)
+                if c < total_cols
+                and (
+                    not visible_rows_only
+                    or MT.all_columns_displayed
+                    or bisect_in(MT.displayed_columns, c)
+                )
+            ]
+            cells = ((r, c) for r in rows for c in cols)
 
         # Iterate through cells and collect replacements
-        tree = self.MT.PAR.ops.treeview
-        for r, c in iterable:
-            # Check visibility only when iterating all data (not selection)
-            if check_visibility and not (
-                (tree or self.MT.all_rows_displayed or bisect_in(self.MT.displayed_rows, r))
-                and (self.MT.all_columns_displayed or bisect_in(self.MT.displayed_columns, c))
-            ):
-                continue
+        for r, c in cells:
+            current = self._cell_search_str(r, c)
 
-            # Check if this cell matches the pattern
-            if not self._regex_find_match(find_str, r, c):
+            # Don't match empty cells with non-empty regex patterns (e.g., .*)
+            if not current:
                 continue
 
-            # Get current cell value
-            current = str(self.MT.get_cell_data(r, c, True) or "")
-
             # Perform regex replacement (count=1 to avoid double-match on patterns like .*)
             try:
-                new_value = compiled.sub(replace_str, current, count=1)
+                new_value, matched = compiled.subn(replace_str, current, count=1)
             except re.error as e:
                 messagebox.showerror(
                     "Regex Error", f"Invalid replacement pattern: {e}", parent=self
                 )
                 return 0
 
-            # Skip if no change
-            if new_value == current:
+            # Skip if no match or no change
+            if not matched or new_value == current:
                 continue
 
             # Run individual cell validation if configured
-            if self.MT.edit_validation_func:
-                validated = self.MT.edit_validation_func(
-                    self.MT.mod_event_val(event_data, new_value, (r, c))
-                )
+            if MT.edit_validation_func:
+                validated = MT.edit_validation_func(MT.mod_event_val(event_data, new_value, (r, c)))
                 if validated is None:
                     continue
                 new_value = validated
 
             # Collect this change in event_data
-            event_data = self.MT.event_data_set_cell(r, c, new_value, event_data)
+            event_data = MT.event_data_set_cell(r, c, new_value, event_data)
 
         # Run bulk validation
         event_data = self.MT.bulk_edit_validation(event_data)
@@ -17,7 +17,7 @@ from ...models.address_row import AddressRow
 from ...services.block_service import compute_all_block_ranges
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Mapping
 
 # Memory types in display order (matches SIDEBAR_TYPES from jump_sidebar.py)
 UNIFIED_TYPE_ORDER = [
@@ -64,6 +64,10 @@ class UnifiedView:
     # Block colors computed from comments (row_idx -> color_name)
     block_colors: dict[int, str] = field(default_factory=dict)
 
+    # Maps addr_key to row index. Edits replace row objects in place but
+    # never reorder rows, so this stays valid for the life of the view.
+    row_index: dict[int, int] = field(default_factory=dict)
+
 
 def build_single_type_rows(
     all_rows: dict[int, AddressRow],
@@ -201,7 +205,7 @@ def compute_index_labels(rows: list[AddressRow]) -> list[str]:
     return [row.display_address for row in rows]
 
 
-def find_paired_row(row: AddressRow, rows: list[AddressRow]) -> AddressRow | None:
+def find_paired_row(row: AddressRow, rows_by_key: Mapping[int, AddressRow]) -> AddressRow | None:
     """Find the paired T/CT row for a TD/CTD row.
 
     TD rows share retentive with T rows at the same address.
@@ -209,7 +213,7 @@ def find_paired_row(row: AddressRow, rows: list[AddressRow]) -> AddressRow | Non
 
     Args:
         row: The row to find a pair for
-        rows: List of all rows to search
+        rows_by_key: Rows keyed by addr_key (e.g. AddressStore.visible_state)
 
     Returns:
         The paired row, or None if not found or not a paired type
@@ -218,12 +222,7 @@ def find_paired_row(row: AddressRow, rows: list[AddressRow]) -> AddressRow | Non
     if not paired_type:
         return None
 
-    # Find the row with the same address and the paired type
-    for other_row in rows:
-        if other_row.memory_type == paired_type and other_row.address == row.address:
-            return other_row
-
-    return None
+    return rows_by_key.get(get_addr_key(paired_type, row.address))
 
 
 def build_unified_view(
@@ -268,4 +267,5 @@ def build_unified_view(
         section_boundaries=section_boundaries,
         index_labels=index_labels,
         block_colors=block_colors,
+        row_index={row.addr_key: idx for idx, row in enumerate(unified_rows)},
     )
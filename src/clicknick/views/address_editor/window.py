@@ -30,6 +30,7 @@ from ...widgets.export_csv_dialog import ExportCsvDialog
 from ...widgets.import_csv_dialog import ImportCsvDialog
 from ...widgets.new_tab_dialog import ask_new_tab
 from ..nav_window.window import NavWindow
+from .display_model import AddressDisplayModel
 from .jump_sidebar import COMBINED_TYPES, JumpSidebar
 from .panel import AddressPanel
 from .tab_state import TabState
@@ -828,21 +829,14 @@ class AddressEditorWindow(tk.Toplevel):
         # Format the replacement template with the new text
         replacement = replacement_template.format(new_text=new_text)
 
-        # Get the current panel
-        panel = self._get_current_panel()
-        if not panel:
-            messagebox.showerror(
-                "No Active Panel", "Please open a tab to perform the rename.", parent=self
-            )
-            return
-
-        # Use the direct regex replacement method
-        replacements_made = panel.sheet.regex_replace_all_direct(
-            pattern, replacement, selection_only=False, visible_rows_only=False
+        # Rename in the store (one undo step); panels refresh from its notification
+        replacements_made = self._store.rename_nicknames(
+            prefix + old_text, pattern, replacement, f"Rename {old_text} to {new_text}"
         )
 
         # Clear filter and switch to "Show: Changed"
-        if replacements_made > 0:
+        panel = self._get_current_panel()
+        if replacements_made > 0 and panel:
             panel.filter_enabled_var.set(False)
             panel.filter_var.set("")
             panel.row_filter_var.set("changed")
@@ -954,6 +948,10 @@ class AddressEditorWindow(tk.Toplevel):
                 self._store.set_unified_view(unified_view)
                 self._store.set_rows("unified", unified_view.rows)
 
+            # Display data is built once and shared by every tab
+            if self._display_model is None:
+                self._display_model = AddressDisplayModel(self._store, unified_view)
+
             # Create unified panel
             panel = AddressPanel(
                 self.notebook,
@@ -976,8 +974,8 @@ class AddressEditorWindow(tk.Toplevel):
             # Apply state to panel (filters, column visibility)
             self._apply_state_to_panel(panel, state)
 
-            # Initialize panel with unified view data
-            panel.initialize_from_view(unified_view.rows)
+            # Initialize panel with the shared display data
+            panel.initialize_from_model(self._display_model)
 
             # Bind selection events for Add Block button
             self._bind_panel_selection(panel)
@@ -1118,7 +1116,13 @@ class AddressEditorWindow(tk.Toplevel):
         # Update local reference to nicknames
         self.all_nicknames = self._store.all_nicknames
 
-        # Update all tab panels - skeleton rows are already updated in-place
+        # Update the shared display data once, then let each tab refresh its view of it
+        if self._display_model is not None:
+            if affected_indices is not None:
+                self._display_model.refresh_targeted(affected_indices)
+            else:
+                self._display_model.refresh_all()
+
         for _tab_id, (panel, _state) in self._tabs.items():
             if affected_indices is not None:
                 # Targeted refresh - only update specific rows (validation done by edit_session)
@@ -1441,6 +1445,9 @@ class AddressEditorWindow(tk.Toplevel):
         self.title(self._get_window_title())
         self.geometry("1025x700")
 
+        # Cell data for the unified view, shared by all tabs (built with the first tab)
+        self._display_model: AddressDisplayModel | None = None
+
         # Tab tracking: maps tab widget name to (panel, state) tuple
         self._tabs: dict[str, tuple[AddressPanel, TabState]] = {}
         self._tab_counter = 0  # For generating unique tab names
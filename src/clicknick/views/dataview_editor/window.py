@@ -954,38 +954,17 @@ class DataviewEditorWindow(tk.Toplevel):
         except tk.TclError:
             pass
 
-    def _provide_filtered_nicknames(self, search_text: str) -> list[str]:
+    def _provide_filtered_nicknames(self, search_text: str, limit: int) -> tuple[list[str], int]:
         """Data provider for the NicknameCombobox.
 
         Args:
             search_text: The current search text from the combobox
+            limit: Max number of nicknames to return
 
         Returns:
-            List of matching nickname strings
+            Tuple of (first matching nickname strings, total number of matches)
         """
-        address_shared = self.shared_data._store
-        if not address_shared:
-            return []
-
-        search_upper = search_text.strip().upper()
-
-        # Build list of matching nicknames
-        matches = []
-        for row in address_shared.all_rows.values():
-            nickname = row.nickname
-            if not nickname:
-                continue
-
-            # Match against nickname (contains search)
-            if search_upper:
-                if search_upper in nickname.upper():
-                    matches.append(nickname)
-            else:
-                matches.append(nickname)
-
-        # Sort and return
-        matches.sort()
-        return matches
+        return self.shared_data.search_nicknames(search_text, limit)
 
     def _on_nickname_selected(self, nickname: str) -> None:
         """Handle nickname selection from combobox.
@@ -995,20 +974,15 @@ class DataviewEditorWindow(tk.Toplevel):
         Args:
             nickname: The selected nickname string
         """
-        if not nickname:
+        if not nickname or not self.shared_data.address_store:
             return
 
-        address_shared = self.shared_data._store
-        if not address_shared:
+        address = self.shared_data.get_address_for_nickname(nickname)
+        if address:
+            self.add_address_to_current(address)
+            self.nickname_combo.reset()
             return
 
-        # Find the address for this nickname
-        for row in address_shared.all_rows.values():
-            if row.nickname == nickname:
-                self.add_address_to_current(row.display_address)
-                self.nickname_combo.reset()
-                return
-
         # Nickname not found - maybe user typed an address directly?
         # Try to add it as-is (will be validated by the panel)
         self.add_address_to_current(nickname)
@@ -41,26 +41,26 @@ class Overlay(tk.Toplevel):
         except Exception as e:
             print(f"Error inserting text: {e}")
 
-    def _provide_filtered_data(self, search_text: str) -> tuple[list[str], bool]:
+    def _provide_filtered_data(self, search_text: str, limit: int) -> tuple[list[str], int]:
         """
         Data provider function for the combobox.
 
         Args:
             search_text: The current search text from the combobox
+            limit: Max number of values to return
 
         Returns:
-            filtered_values
+            (top filtered_values, total number of matches)
         """
         if not self.allowed_types:
-            return []
+            return [], 0
 
-        # Get filtered nicknames using the nickname manager
-        filtered_items = self.nickname_manager.get_filtered_nicknames(
-            self.allowed_types, search_text
+        # Get the best-ranked nicknames using the nickname manager. Settings were
+        # read on the Tk thread since this may run on the combobox's search worker.
+        return self.nickname_manager.get_top_nicknames(
+            self.allowed_types, search_text, limit, self.search_options
         )
 
-        return filtered_items
-
     def _on_nickname_navigation(self, nickname):
         """Handle navigation through nickname items to show details in tooltip."""
         # Check if tooltips are enabled in settings
@@ -105,7 +105,7 @@ class Overlay(tk.Toplevel):
         # Configure style for wider dropdown
         style = ttk.Style()
         style.configure("Wider.TCombobox", postoffset=(0, 0, 90, 0))  # last value extends width
-        self.combobox = NicknameCombobox(self, width=30, style="Wider.TCombobox")
+        self.combobox = NicknameCombobox(self, width=30, style="Wider.TCombobox", async_search=True)
         self.combobox.pack(padx=2, pady=2)
 
         # provide functions
@@ -171,6 +171,7 @@ class Overlay(tk.Toplevel):
         self.target_window_class = None
         self.target_edit_control = None
         self.allowed_types = []
+        self.search_options = None
 
         self._debounce_retrigger = False
         self.combobox.finalizing = False
@@ -302,9 +303,13 @@ class Overlay(tk.Toplevel):
         # Store allowed types for the data provider
         self.allowed_types = allowed_types
 
+        # Start a fresh search session (cached results only narrow within one field)
+        self.nickname_manager.reset_search_session()
+        self.search_options = self.nickname_manager.search_options()
+
         # Get initial nicknames for empty search
-        initial_nicknames = self._provide_filtered_data("")
-        self.combobox.update_values(initial_nicknames)
+        self.combobox.result_limit = self.combobox.page_size
+        self.combobox.fetch_values("")
 
         # Only show if positioning is successful
         if not self.position_near_edit_control():
@@ -325,5 +330,9 @@ class Overlay(tk.Toplevel):
             self.after_cancel(self.debounce_after_id)
             self.debounce_after_id = None
 
+        # Drop any search still running for the field being left
+        if hasattr(self, "combobox") and self.combobox.search_manager is not None:
+            self.combobox.search_manager.cancel()
+
         # Call the parent class's withdraw method
         super().withdraw()
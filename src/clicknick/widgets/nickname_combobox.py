@@ -1,11 +1,19 @@
 import re
+import threading
 import tkinter as tk
 from collections.abc import Callable
+from functools import partial
 from tkinter import ttk
 
 from ..detection.window_mapping import DATA_TYPES
 from .prefix_autocomplete import PrefixAutocomplete
 
+# Number of results requested from the data provider per page
+RESULT_PAGE_SIZE = 200
+
+# Quiet period after a keystroke before an async search is posted
+SEARCH_DEBOUNCE_MS = 40
+
 
 # Utility functions (no tkinter dependencies, easily testable)
 def normalize_nickname(nickname: str) -> str:
@@ -148,6 +156,8 @@ class DropdownManager:
         self.original_selectbackground = None
         self.listbox_has_focus = False
         self._bindings_set = False
+        # Tcl command for _on_listbox_page_request, registered on first use
+        self._page_request_command = None
 
     def get_listbox_widget(self):
         """Get the listbox widget from the dropdown."""
@@ -352,7 +362,8 @@ class DropdownManager:
                     "bind",
                     listbox,
                     "<KeyPress-Down>",
-                    self.combobox.register(
+                    "+"
+                    + self.combobox.register(
                         lambda: self._on_listbox_navigation(navigation_callback)
                     ),
                 )
@@ -368,6 +379,42 @@ class DropdownManager:
             except tk.TclError:
                 pass
 
+    def _on_listbox_page_request(self):
+        """Load the next page of results once the end of the list is visible."""
+        listbox = self.get_listbox_widget()
+        if not listbox or not self.combobox.has_more_results():
+            return
+        try:
+            _, bottom = self.combobox.tk.splitlist(self.combobox.tk.call(listbox, "yview"))
+            if float(bottom) < 1.0:
+                return
+        except tk.TclError:
+            return
+        self.combobox.load_more_results()
+
+    def get_active_index(self):
+        """Get the listbox's highlighted row, or None if the dropdown has no listbox."""
+        listbox = self.get_listbox_widget()
+        if not listbox:
+            return None
+        try:
+            return self.combobox.tk.call(listbox, "index", "active")
+        except tk.TclError:
+            return None
+
+    def set_active_index(self, active_index):
+        """Highlight a listbox row (after its contents were replaced)."""
+        listbox = self.get_listbox_widget()
+        if not listbox:
+            return
+        try:
+            self.combobox.tk.call(listbox, "selection", "clear", 0, "end")
+            self.combobox.tk.call(listbox, "selection", "set", active_index)
+            self.combobox.tk.call(listbox, "activate", active_index)
+            self.combobox.tk.call(listbox, "see", active_index)
+        except tk.TclError:
+            pass
+
     def setup_listbox_bindings(self):
         """Set up event bindings for the listbox widget."""
         listbox = self.get_listbox_widget()
@@ -400,6 +447,17 @@ class DropdownManager:
                         self.combobox.register(self._on_listbox_mouse_leave),
                     )
 
+                # Page in more results when navigating past the end. The listbox
+                # outlives the dropdown, so the binding is replaced on every open
+                # (navigation bindings below append to it)
+                if self._page_request_command is None:
+                    self._page_request_command = self.combobox.register(
+                        self._on_listbox_page_request
+                    )
+                page_request = self._page_request_command
+                self.combobox.tk.call("bind", listbox, "<KeyPress-Down>", page_request)
+                self.combobox.tk.call("bind", listbox, "<KeyPress-Next>", page_request)
+
                 # Add navigation bindings if callback is set
                 if (
                     hasattr(self.combobox, "item_navigation_callback")
@@ -479,8 +537,8 @@ class DropdownManager:
         if listbox:
             try:
                 self.combobox.tk.call(listbox, "delete", 0, "end")
-                for value in filtered_values:
-                    self.combobox.tk.call(listbox, "insert", "end", value)
+                # One Tcl call for the whole page instead of one per value
+                self.combobox.tk.call(listbox, "insert", "end", *filtered_values)
 
                 if filtered_values:
                     # Get current text in the entry widget
@@ -510,6 +568,107 @@ class DropdownManager:
                 self.combobox["values"] = filtered_values
 
 
+class AsyncSearchManager:
+    """Runs data provider queries on a worker thread, keeping only the newest.
+
+    Every submitted query gets a generation number. Queries are posted after a
+    short debounce, a worker thread runs the provider, and the result is
+    marshalled back to the Tk thread with after(). Results whose generation is
+    older than the latest submission are dropped, as are queries still waiting
+    for the worker when a newer one arrives.
+    """
+
+    def __init__(self, combobox, debounce_ms: int = SEARCH_DEBOUNCE_MS):
+        self.combobox = combobox
+        self.debounce_ms = debounce_ms
+        self.generation = 0
+        self._debounce_after_id = None
+
+        # Latest posted query, handed to the worker under _lock
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending_request = None
+        self._worker = None
+
+        # True from submit() until its result is delivered or cancelled
+        self.in_flight = False
+
+    def _schedule_ui(self, callback: Callable[[], None]) -> None:
+        """Schedule callback on Tk thread; ignore if the widget is already destroyed."""
+        try:
+            self.combobox.after(0, callback)
+        except (tk.TclError, RuntimeError):
+            pass
+
+    def _deliver(self, generation: int, result, error, on_result) -> None:
+        """Hand a finished query to on_result unless a newer one was submitted."""
+        if generation != self.generation:
+            return
+        self.in_flight = False
+        if error is not None:
+            print(f"Error searching nicknames: {error}")
+            return
+        on_result(*result)
+
+    def _run_worker(self) -> None:
+        """Worker loop: run the newest pending query, skipping superseded ones."""
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                self._wakeup.clear()
+                request = self._pending_request
+                self._pending_request = None
+            if request is None:
+                continue
+
+            generation, provider, search_text, limit, on_result = request
+            if generation != self.generation:
+                continue
+            result = None
+            error = None
+            try:
+                result = provider(search_text, limit)
+            except Exception as exc:
+                error = exc
+            self._schedule_ui(partial(self._deliver, generation, result, error, on_result))
+
+    def _post(self, generation: int, provider, search_text: str, limit: int, on_result) -> None:
+        """Hand a query to the worker thread (replacing any it has not started)."""
+        self._debounce_after_id = None
+        if generation != self.generation:
+            return
+        with self._lock:
+            self._pending_request = (generation, provider, search_text, limit, on_result)
+        self._wakeup.set()
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+
+    def cancel(self) -> None:
+        """Drop any pending or in-flight query."""
+        self.generation += 1
+        self.in_flight = False
+        if self._debounce_after_id is not None:
+            self.combobox.after_cancel(self._debounce_after_id)
+            self._debounce_after_id = None
+
+    def submit(
+        self,
+        provider: Callable[[str, int], tuple[list[str], int]],
+        search_text: str,
+        limit: int,
+        on_result: Callable[[list[str], int], None],
+    ) -> None:
+        """Queue a query; on_result(values, total) runs on the Tk thread if still current."""
+        self.cancel()
+        self.in_flight = True
+        post = partial(self._post, self.generation, provider, search_text, limit, on_result)
+        if self.debounce_ms > 0:
+            self._debounce_after_id = self.combobox.after(self.debounce_ms, post)
+        else:
+            post()
+
+
 class ComboboxEventHandler:
     """Handles keyboard and selection events for combobox."""
 
@@ -518,30 +677,55 @@ class ComboboxEventHandler:
         self.dropdown_manager = dropdown_manager
         self.autocomplete = autocomplete
 
+    def _update_dropdown_visibility(self, should_show_dropdown, filtered_values):
+        """Open or hide the dropdown for the latest search results."""
+        show_dropdown = should_show_dropdown and filtered_values
+
+        if show_dropdown:
+            if not self.dropdown_manager.is_dropdown_open():
+                self.dropdown_manager.open_dropdown_keep_focus()
+        else:
+            self.dropdown_manager.hide_dropdown()
+
+    def _on_search_results(self, should_show_dropdown, complete, filtered_values, total):
+        """Show results delivered by the async search manager.
+
+        Typed characters are autocompleted here, against the results for the
+        text they produced rather than an older query's.
+        """
+        self.combobox.update_values(filtered_values, total)
+        if complete:
+            self.autocomplete.autocomplete()
+        self._update_dropdown_visibility(should_show_dropdown, filtered_values)
+
     def _handle_data_provider_update(self, event):
         """Handle data provider updates and dropdown visibility."""
         if not (hasattr(self.combobox, "data_provider") and self.combobox.data_provider):
             return
 
         search_text = self.combobox.get_search_text()
-        should_show_dropdown = not self.combobox.is_possible_address_or_literal(search_text)
-        filtered_values = self.combobox.data_provider(search_text)
-
-        # Update the combobox values
-        self.combobox.update_values(filtered_values)
-
-        # Determine dropdown visibility
-        show_dropdown = (
-            should_show_dropdown
-            and filtered_values
-            and ((event.char and event.char.isprintable()) or event.keysym == "BackSpace")
+        should_show_dropdown = not self.combobox.is_possible_address_or_literal(search_text) and (
+            (event.char and event.char.isprintable()) or event.keysym == "BackSpace"
         )
 
-        if show_dropdown:
-            if not self.dropdown_manager.is_dropdown_open():
-                self.dropdown_manager.open_dropdown_keep_focus()
-        else:
-            self.dropdown_manager.hide_dropdown()
+        # New search text starts again from the first page of results
+        self.combobox.result_limit = self.combobox.page_size
+
+        if self.combobox.search_manager is not None:
+            self.combobox.search_manager.submit(
+                self.combobox.data_provider,
+                search_text,
+                self.combobox.result_limit,
+                partial(
+                    self._on_search_results,
+                    should_show_dropdown,
+                    self.autocomplete.is_completion_key(event),
+                ),
+            )
+            return
+
+        filtered_values = self.combobox.fetch_values(search_text)
+        self._update_dropdown_visibility(should_show_dropdown, filtered_values)
 
     def _trigger_navigation_callback(self):
         """Trigger the navigation callback with current selection."""
@@ -598,7 +782,9 @@ class ComboboxEventHandler:
             self.combobox.master.withdraw()
             return
 
-        self.autocomplete.handle_keyrelease(event)
+        # With async search, autocompletion waits for this keystroke's results
+        searches_async = self.combobox.search_manager is not None and self.combobox.data_provider
+        self.autocomplete.handle_keyrelease(event, complete=not searches_async)
         self._handle_data_provider_update(event)
 
     def _on_selection(self, event):
@@ -624,6 +810,9 @@ class NicknameCombobox(ttk.Combobox):
 
         # Extract values before passing kwargs to parent
         self.values_list = kwargs.pop("values", [])
+        self.page_size = kwargs.pop("page_size", RESULT_PAGE_SIZE)
+        async_search = kwargs.pop("async_search", False)
+        search_debounce_ms = kwargs.pop("search_debounce_ms", SEARCH_DEBOUNCE_MS)
 
         # Initialize parent with valid ttk.Combobox options only
         super().__init__(parent, **kwargs)
@@ -631,9 +820,12 @@ class NicknameCombobox(ttk.Combobox):
         """Initialize all component managers."""
         self.data_provider = None
         self.selection_callback = None
+        self.result_limit = self.page_size
+        self.total_results = len(self.values_list)
 
         # Initialize managers
         self.dropdown_manager = DropdownManager(self)
+        self.search_manager = AsyncSearchManager(self, search_debounce_ms) if async_search else None
 
         # Configure combobox
         self["values"] = self.values_list
@@ -709,6 +901,12 @@ class NicknameCombobox(ttk.Combobox):
         After processing, hides the master window.
         """
         self.finalizing = True
+        if self.search_manager is not None:
+            in_flight = self.search_manager.in_flight
+            self.search_manager.cancel()
+            if in_flight and self.data_provider:
+                # The shown values belong to an earlier query; search the current text now
+                self.fetch_values(self.get_search_text())
         search_text = self.get_search_text()
         values = self["values"]
         selection = self.current()
@@ -735,15 +933,57 @@ class NicknameCombobox(ttk.Combobox):
 
         self.master.withdraw()
 
-    def set_data_provider(self, provider_func: Callable[[str], tuple[list[str], bool]]) -> None:
+    def set_data_provider(self, provider_func: Callable[[str, int], tuple[list[str], int]]) -> None:
         """
         Set the data provider function.
 
         Args:
-            provider_func: Function that takes search text and returns filtered_values
+            provider_func: Function that takes search text and a result limit and
+                returns (top filtered_values, total number of matches)
         """
         self.data_provider = provider_func
 
+    def fetch_values(self, search_text: str) -> list[str]:
+        """Run the data provider for search_text and show its results.
+
+        Args:
+            search_text: The text to search for
+
+        Returns:
+            The values now shown (at most result_limit of them)
+        """
+        values, total = self.data_provider(search_text, self.result_limit)
+        self.update_values(values, total)
+        return values
+
+    def has_more_results(self) -> bool:
+        """Check whether the provider has matches beyond the values shown."""
+        return self.total_results > len(self.values_list)
+
+    def _show_page(self, values: list[str], total: int) -> None:
+        """Show a longer page of results, keeping the dropdown's highlighted row."""
+        active_index = self.dropdown_manager.get_active_index()
+        self.update_values(values, total)
+        if active_index is not None:
+            self.dropdown_manager.set_active_index(active_index)
+
+    def load_more_results(self) -> None:
+        """Extend the shown values by another page from the data provider.
+
+        With async search the page is fetched on the worker thread like any
+        other query, so paging never blocks the Tk thread.
+        """
+        if not self.data_provider or not self.has_more_results():
+            return
+        self.result_limit = len(self.values_list) + self.page_size
+        search_text = self.get_search_text()
+        if self.search_manager is not None:
+            self.search_manager.submit(
+                self.data_provider, search_text, self.result_limit, self._show_page
+            )
+            return
+        self._show_page(*self.data_provider(search_text, self.result_limit))
+
     def set_item_navigation_callback(self, callback: Callable[[str], None]) -> None:
         """Set the callback function for when navigating through items."""
         self.item_navigation_callback = callback
@@ -754,12 +994,20 @@ class NicknameCombobox(ttk.Combobox):
 
     def reset(self):
         """Reset the combobox content and autocomplete state."""
+        if self.search_manager is not None:
+            self.search_manager.cancel()
         self.delete(0, tk.END)
         self._autocomplete.reset()
 
-    def update_values(self, values: list[str]) -> None:
-        """Update the combobox values and autocomplete list."""
+    def update_values(self, values: list[str], total: int | None = None) -> None:
+        """Update the combobox values and autocomplete list.
+
+        Args:
+            values: The values to show
+            total: Total number of matches, if more exist than are shown
+        """
         self.values_list = values
+        self.total_results = len(values) if total is None else total
         self["values"] = values
         self._autocomplete.set_completion_list(values)
 
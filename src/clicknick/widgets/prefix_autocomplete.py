@@ -12,8 +12,20 @@ class PrefixAutocomplete:
         self.position = 0
         self.finalized = False
 
-    def handle_keyrelease(self, event) -> None:
-        """Handle key release event for autocompletion and navigation."""
+    @staticmethod
+    def is_completion_key(event) -> bool:
+        """Check if a key release types a character that triggers autocompletion."""
+        return len(event.keysym) == 1 or event.char == "_"
+
+    def handle_keyrelease(self, event, complete: bool = True) -> None:
+        """Handle key release event for autocompletion and navigation.
+
+        Args:
+            event: The key release event
+            complete: Autocomplete typed characters now; pass False when the
+                completion list is still being searched for (call autocomplete()
+                once it arrives)
+        """
         if event.keysym == "BackSpace":
             self.widget.delete(self.position, tk.END)
             # Position stays the same
@@ -29,7 +41,7 @@ class PrefixAutocomplete:
             self.widget.icursor(tk.END)
             self.widget.selection_clear()
             return
-        elif len(event.keysym) == 1 or event.char == "_":
+        elif complete and self.is_completion_key(event):
             self.autocomplete()
 
     def set_completion_list(self, completion_list):
@@ -0,0 +1,36 @@
+"""Shared fixtures for the clicknick test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from clicknick.data.address_store import AddressStore
+
+
+class MockDataSource:
+    """In-memory data source that serves a fixed set of rows."""
+
+    supports_used_field = True
+    file_path = "test.mdb"
+    is_read_only = False
+
+    def __init__(self, initial_rows=None):
+        self._initial_rows = initial_rows or {}
+
+    def load_all_addresses(self):
+        return self._initial_rows
+
+    def save_changes(self, rows):
+        return len(rows)
+
+
+@pytest.fixture
+def make_address_store():
+    """Factory for a loaded AddressStore backed by MockDataSource."""
+
+    def _make(initial_rows=None) -> AddressStore:
+        store = AddressStore(MockDataSource(initial_rows))
+        store.load_initial_data()
+        return store
+
+    return _make
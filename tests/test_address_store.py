@@ -6,6 +6,7 @@ from pyclickplc.addresses import get_addr_key
 from clicknick.data.address_store import AddressStore
 from clicknick.data.undo_frame import MAX_UNDO_DEPTH
 from clicknick.models.address_row import AddressRow
+from clicknick.utils.rename_helpers import build_rename_pattern
 
 
 class MockDataSource:
@@ -121,6 +122,45 @@ class TestEditSession:
                     inner.set_field(addr_key, "nickname", "Inner")
 
 
+class TestRenameNicknames:
+    """Tests for bulk nickname renames (outline rename)."""
+
+    def test_rename_nicknames_single_undo_frame(self):
+        """Matching nicknames are renamed together and undone together."""
+        nicknames = ["Tank_Pump_Speed", "Tank_Pump", "Tank_Pump1_Speed", "Tank_Valve", "Pump_Flow"]
+        initial_rows = {
+            get_addr_key("C", i): AddressRow(memory_type="C", address=i, nickname=nickname)
+            for i, nickname in enumerate(nicknames, start=1)
+        }
+        s = AddressStore(MockDataSource(initial_rows))
+        s.load_initial_data()
+
+        pattern, template = build_rename_pattern("Tank_", "Pump", is_array=False)
+        renamed = s.rename_nicknames(
+            "Tank_Pump", pattern, template.format(new_text="Motor"), "Rename Pump"
+        )
+
+        assert renamed == 2
+        assert [s.visible_state[key].nickname for key in initial_rows] == [
+            "Tank_Motor_Speed",
+            "Tank_Motor",
+            "Tank_Pump1_Speed",
+            "Tank_Valve",
+            "Pump_Flow",
+        ]
+        assert s.get_addr_keys_for_nickname("Tank_Motor") == {get_addr_key("C", 2)}
+        assert len(s.undo_stack) == 1
+        assert s.undo_stack[0].description == "Rename Pump"
+
+        s.undo()
+        assert [s.visible_state[key].nickname for key in initial_rows] == nicknames
+
+    def test_rename_nicknames_no_match(self, store_with_data):
+        """No matches means no edit session and no undo frame."""
+        assert store_with_data.rename_nicknames("Tank_", r"^(Tank_)(Pump)(_|$)", r"\1X\3") == 0
+        assert len(store_with_data.undo_stack) == 0
+
+
 class TestUndoRedo:
     """Tests for undo/redo functionality."""
 
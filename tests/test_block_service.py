@@ -631,3 +631,34 @@ def test_interleaved_pair_sync_ct_ctd(store):
     # CTD1 should have the block tag with _D suffix
     ctd1_row = store.visible_state[ctd1_key]
     assert "<Counters_D>" in ctd1_row.comment
+
+
+def test_find_paired_row_resolves_through_store(store):
+    """TD/CTD rows resolve their T/CT pair by addr_key; other types have no pair."""
+    from pyclickplc.addresses import get_addr_key
+
+    from clicknick.views.address_editor.view_builder import find_paired_row
+
+    rows = store.visible_state
+    td_row = rows[get_addr_key("TD", 7)]
+    ctd_row = rows[get_addr_key("CTD", 3)]
+
+    assert find_paired_row(td_row, rows) is rows[get_addr_key("T", 7)]
+    assert find_paired_row(ctd_row, rows) is rows[get_addr_key("CT", 3)]
+    assert find_paired_row(rows[get_addr_key("T", 7)], rows) is None
+    assert find_paired_row(rows[get_addr_key("DS", 1)], rows) is None
+
+
+def test_unified_view_row_index_survives_edits(store):
+    """row_index maps every addr_key to its row, including after rows are replaced."""
+    view = store.get_unified_view()
+    assert len(view.row_index) == len(view.rows)
+    assert all(view.row_index[row.addr_key] == idx for idx, row in enumerate(view.rows))
+
+    target = view.rows[3]
+    with store.edit_session("Add block") as session:
+        session.set_field(target.addr_key, "comment", "<Block bg='Red'>")
+
+    idx = view.row_index[target.addr_key]
+    assert view.rows[idx] is not target
+    assert view.rows[idx].addr_key == target.addr_key
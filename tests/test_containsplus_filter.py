@@ -1,7 +1,33 @@
+import random
+import re
+
 import pytest
 
+from clicknick.data.nickname_manager import NicknameManager
 from clicknick.models.nickname import Nickname
 from clicknick.utils.filters import ContainsPlusFilter
+from clicknick.utils.tag_cache import TagCache
+
+
+def _reference_split_into_words(filter_instance, text):
+    """Original tokenizer: all four date/time expansions, then the boundary split"""
+    for pattern, replacement in filter_instance._DT_PATTERNs:
+        text = pattern.sub(replacement, text)
+    return [word for word in re.split(r"[_\s]+|(?<=[a-z])(?=[A-Z])", text) if len(word) > 1]
+
+
+def _random_tokenizer_corpus(count, seed=0):
+    """Random nickname-like strings, heavy on repeated letters and separators"""
+    rng = random.Random(seed)
+    pieces = ("Y", "M", "D", "H", "S", "h", "m", "s", "a", "e", "T", "_", " ", "1", "Tank", "é")
+    corpus = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(0, 8)):
+            piece = rng.choice(pieces)
+            parts.append(piece * rng.choice((1, 1, 2, 2, 3, 4, 5)))
+        corpus.append("".join(parts))
+    return corpus
 
 
 class TestContainsPlusFilter:
@@ -244,6 +270,17 @@ class TestContainsPlusFilter:
             expected_filtered = [w for w in expected_words if len(w) > 1]
             assert set(words) == set(expected_filtered)
 
+    def test_split_into_words_matches_reference_tokenizer(self, filter_obj):
+        """Randomized corpus gives identical word lists to the original implementation"""
+        filter_instance = filter_obj[0]
+        corpus = _random_tokenizer_corpus(20_000)
+        corpus += ["YYYYMMDD", "Log_YYYYMMDD_HHMMSS", "AAAAAMMDD", "bookkeeper", "hhmmss"]
+
+        for text in corpus:
+            assert filter_instance.split_into_words(text) == _reference_split_into_words(
+                filter_instance, text
+            ), text
+
     def test_abbrword_special_case(self, filter_obj):
         """Test _abbrword_special_case function independently"""
         filter_instance = filter_obj[0]
@@ -397,6 +434,30 @@ class TestContainsPlusFilter:
         # After splitting whitespace, it becomes empty search, so should return full list
         assert len(result) == len(completion_list)
 
+    def test_index_matches_linear_scan(self, filter_obj):
+        """Indexed searches return the same items in the same order as a scan"""
+        filter_instance, completion_list = filter_obj
+        index = filter_instance.build_index(completion_list)
+
+        for text in ["cmd", "command", "st", "system error", "alarm ack", "hh", "xyz"]:
+            expected = filter_instance.filter_matches(completion_list, text)
+            result = filter_instance.filter_matches(completion_list, text, index=index)
+            assert result == expected
+
+    def test_abbreviation_index_matches_tag_scan(self, filter_obj):
+        """Tag-prefix index lookups find exactly the items matches_abbreviation finds"""
+        filter_instance, completion_list = filter_obj
+        index = filter_instance.build_index(completion_list)
+
+        for word in ["cmd", "control", "st", "prm", "hist", "yyyy", "2nd"]:
+            variants = filter_instance.get_needle_variants(word)
+            expected = {
+                pos
+                for pos, item in enumerate(completion_list)
+                if filter_instance.matches_abbreviation(item, variants)
+            }
+            assert index.abbreviation_positions(variants) == expected
+
     def test_no_matches_case(self, filter_obj):
         """Test searching for non-existent terms"""
         filter_instance, completion_list = filter_obj
@@ -529,3 +590,96 @@ class TestContainsPlusFilter:
             # Complete pipeline should return the unchanged word
             complete_result = filter_instance.get_abbreviated_word_list(word)
             assert complete_result == [word]
+
+
+def _save_tags(filter_instance):
+    """Save a filter's tag cache the way the app does, through NicknameManager."""
+    manager = NicknameManager()
+    manager.filter_strategies["containsplus"] = filter_instance
+    return manager.save_tag_cache()
+
+
+def _save_cache(cache):
+    data = cache.snapshot()
+    return data is not None and cache.write(data)
+
+
+class TestPersistentTagCache:
+    def test_tags_reload_from_disk_without_regenerating(self, tmp_path, monkeypatch):
+        path = tmp_path / "abbr_tags.json.gz"
+        names = ["Tank_Level_High", "MotorSpeed", "YYYYMMDD_Stamp", "ab"]
+
+        writer = ContainsPlusFilter(tag_cache_path=path)
+        expected = {name: writer.generate_tags(name) for name in names}
+        assert _save_tags(writer)
+        assert not _save_tags(writer)
+
+        reader = ContainsPlusFilter(tag_cache_path=path)
+        monkeypatch.setattr(reader, "split_into_words", None)
+        assert {name: reader.generate_tags(name) for name in names} == expected
+
+        # Reading cached tags alone leaves nothing to save
+        assert reader.tag_cache.unsaved_puts == 0
+        assert not _save_tags(reader)
+
+    def test_cache_from_other_rules_version_is_ignored(self, tmp_path, monkeypatch):
+        path = tmp_path / "abbr_tags.json.gz"
+        writer = ContainsPlusFilter(tag_cache_path=path)
+        writer.generate_tags("Tank_Level")
+        assert _save_tags(writer)
+
+        monkeypatch.setattr(ContainsPlusFilter, "TAG_RULES_VERSION", 999)
+        reader = ContainsPlusFilter(tag_cache_path=path)
+        assert reader.tag_cache.get("Tank_Level") is None
+        assert reader.generate_tags("Tank_Level") == ContainsPlusFilter().generate_tags(
+            "Tank_Level"
+        )
+
+    def test_cache_evicts_oldest_beyond_max_entries(self, tmp_path):
+        cache = TagCache(tmp_path / "tags.json.gz", rules_version=1, max_entries=2)
+        cache.put("First", ("first",))
+        cache.put("Second", ("second",))
+        cache.put("First", ("first",))
+        cache.put("Third", ("third",))
+        assert list(cache.entries) == ["First", "Third"]
+
+        assert _save_cache(cache)
+        assert not _save_cache(cache)
+        reloaded = TagCache(tmp_path / "tags.json.gz", rules_version=1, max_entries=2)
+        assert reloaded.get("Third") == ("third",)
+        assert reloaded.get("Second") is None
+
+    def test_lookups_keep_entries_from_eviction(self, tmp_path):
+        path = tmp_path / "tags.json.gz"
+        cache = TagCache(path, rules_version=1, max_entries=2)
+        cache.put("Every_Session", ("every",))
+        cache.put("One_Off", ("one",))
+        assert _save_cache(cache)
+
+        # A hit reorders in memory only; the order is saved along with the next store
+        reloaded = TagCache(path, rules_version=1, max_entries=2)
+        assert reloaded.get("Every_Session") == ("every",)
+        assert reloaded.unsaved_puts == 0
+        reloaded.put("New_Tag", ("new",))
+        assert list(reloaded.entries) == ["Every_Session", "New_Tag"]
+        assert _save_cache(reloaded)
+        assert list(TagCache(path, rules_version=1).entries) == ["Every_Session", "New_Tag"]
+
+    def test_failed_write_is_reported_and_retried(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        cache = TagCache(blocker / "tags.json.gz", rules_version=1)
+        cache.put("Tank_Level", ("tnk",))
+
+        assert not _save_cache(cache)
+        assert isinstance(cache.last_error, OSError)
+        assert cache.unsaved_puts == 1
+
+        cache.path = tmp_path / "tags.json.gz"
+        assert _save_cache(cache)
+        assert cache.last_error is None
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        path = tmp_path / "tags.json.gz"
+        path.write_bytes(b"not gzip")
+        assert TagCache(path, rules_version=1).get("Tank_Level") is None
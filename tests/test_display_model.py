@@ -0,0 +1,69 @@
+"""Tests for the display data shared by Address Editor tabs."""
+
+from __future__ import annotations
+
+from pyclickplc.addresses import get_addr_key
+
+from clicknick.models.address_row import AddressRow
+from clicknick.views.address_editor.display_model import AddressDisplayModel
+from clicknick.views.address_editor.panel_constants import (
+    COL_COMMENT,
+    COL_INIT_VALUE,
+    COL_RETENTIVE,
+)
+from clicknick.views.address_editor.view_builder import build_unified_view
+
+
+def test_display_model_updates_shared_lists_in_place(make_address_store) -> None:
+    c1 = get_addr_key("C", 1)
+    store = make_address_store({c1: AddressRow(memory_type="C", address=1, nickname="Pump")})
+    view = build_unified_view(store.visible_state, store.all_nicknames)
+    model = AddressDisplayModel(store, view)
+
+    data = model.data
+    idx = view.row_index[c1]
+    row_data = data[idx]
+    assert row_data[COL_INIT_VALUE] is False
+    assert model.shows_init_checkbox(idx)
+
+    with store.edit_session("Edit C1") as session:
+        session.set_field(c1, "comment", "Main pump")
+        session.set_field(c1, "retentive", True)
+    assert model.refresh_targeted({c1}) == {idx}
+
+    # Sheets hold references to these lists, so they must be updated, not replaced
+    assert model.data is data
+    assert data[idx] is row_data
+    assert row_data[COL_COMMENT] == "Main pump"
+    assert row_data[COL_RETENTIVE] is True
+    assert row_data[COL_INIT_VALUE] == "-"
+    assert not model.shows_init_checkbox(idx)
+    assert model.rows[idx] is store.visible_state[c1]
+
+
+def test_display_model_tracks_dirty_and_error_rows(make_address_store) -> None:
+    c1 = get_addr_key("C", 1)
+    c2 = get_addr_key("C", 2)
+    store = make_address_store(
+        {
+            c1: AddressRow(memory_type="C", address=1, nickname="Pump"),
+            c2: AddressRow(memory_type="C", address=2, nickname="Valve"),
+        }
+    )
+    view = build_unified_view(store.visible_state, store.all_nicknames)
+    model = AddressDisplayModel(store, view)
+    idx1, idx2 = view.row_index[c1], view.row_index[c2]
+    assert model.dirty_rows == set()
+    assert model.error_rows == set()
+
+    # A duplicate nickname puts both rows in error; only the edited row is dirty
+    with store.edit_session("Duplicate") as session:
+        session.set_field(c2, "nickname", "Pump")
+    model.refresh_targeted({c1, c2})
+    assert model.dirty_rows == {idx2}
+    assert model.error_rows == {idx1, idx2}
+
+    with store.edit_session("Rename back") as session:
+        session.set_field(c2, "nickname", "Valve")
+    model.refresh_targeted({c1, c2})
+    assert model.error_rows == set()
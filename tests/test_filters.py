@@ -1,4 +1,7 @@
-from clicknick.utils.filters import ContainsFilter
+import random
+import time
+
+from clicknick.utils.filters import ContainsFilter, FuzzyFilter, PrefixFilter
 
 
 class TestContainsFilter:
@@ -30,3 +33,171 @@ class TestContainsFilter:
         # Check the grouping
         assert set(result[:4]) == word_boundary_expected
         assert set(result[4:]) == buried_expected
+
+    def test_trigram_index_matches_linear_scan(self):
+        """Indexed search returns the same items in the same order as a scan"""
+        filter_obj = ContainsFilter()
+        completion_list = [
+            "metadata",
+            "parseData",
+            "User Data",
+            "mandatary",
+            "update_data",
+            "validate",
+            "data_file",
+            "Tank1_Level",
+            "tank_lvl",
+        ]
+        index = filter_obj.build_index(completion_list)
+
+        for text in ["d", "da", "data", "DATA", "ata_f", "tank", "lvl", "xyz", "a_d"]:
+            expected = filter_obj.filter_matches(completion_list, text)
+            assert filter_obj.filter_matches(completion_list, text, index=index) == expected
+
+
+class TestPrefixFilter:
+    COMPLETION_LIST = [
+        "Pump_Speed",
+        "pump_run",
+        "Motor1",
+        "PUMPHOUSE",
+        "Pu",
+        "Valve_Pump",
+        "motor2",
+    ]
+
+    def test_index_matches_linear_scan(self):
+        """Indexed lookups return the same items in the same order as a scan"""
+        filter_obj = PrefixFilter()
+        index = filter_obj.build_index(self.COMPLETION_LIST)
+
+        for text in ["p", "pu", "PUMP", "pump_", "mo", "motor2", "x", "Valve_Pump!"]:
+            expected = filter_obj.filter_matches(self.COMPLETION_LIST, text)
+            assert filter_obj.filter_matches(self.COMPLETION_LIST, text, index=index) == expected
+
+    def test_index_preserves_list_order(self):
+        """Results follow the completion list order, not the index's sort order"""
+        filter_obj = PrefixFilter()
+        index = filter_obj.build_index(self.COMPLETION_LIST)
+
+        result = filter_obj.filter_matches(self.COMPLETION_LIST, "pump", index=index)
+        assert result == ["Pump_Speed", "pump_run", "PUMPHOUSE"]
+
+    def test_empty_text_returns_everything(self):
+        filter_obj = PrefixFilter()
+        index = filter_obj.build_index(self.COMPLETION_LIST)
+
+        assert filter_obj.filter_matches(self.COMPLETION_LIST, "", index=index) == (
+            self.COMPLETION_LIST
+        )
+
+
+def _make_tags(count, seed=0):
+    """Nickname-like tags such as Tank3_Level_SP"""
+    rng = random.Random(seed)
+    areas = ("Tank", "Pump", "Valve", "Mixer", "Conveyor", "Boiler", "Filter", "Press")
+    signals = ("Speed", "Level", "Alarm", "Reset", "Start", "Stop", "Temp", "Pressure")
+    suffixes = ("", "_SP", "_PV", "_Cmd", "_Sts", "_Hi", "_Lo")
+    return [
+        f"{rng.choice(areas)}{rng.randint(1, 99)}_{rng.choice(signals)}{rng.choice(suffixes)}_{i}"
+        for i in range(count)
+    ]
+
+
+class TestFuzzyFilter:
+    COMPLETION_LIST = [
+        "Tank_Level",
+        "TankLevelHigh",
+        "tank_lvl",
+        "Total_Run_Level",
+        "Pump_Run",
+        "mixer_pump2",
+        "Pause_Mode_Pump",
+        "stepump",
+    ]
+
+    def test_subsequence_matching(self):
+        filter_obj = FuzzyFilter()
+
+        result = filter_obj.filter_matches(self.COMPLETION_LIST, "tlvl")
+        assert set(result) == {"Tank_Level", "TankLevelHigh", "tank_lvl", "Total_Run_Level"}
+        assert filter_obj.filter_matches(self.COMPLETION_LIST, "lvlt") == []
+
+        # Whitespace in the query is ignored
+        assert filter_obj.filter_matches(self.COMPLETION_LIST, "tank lvl") == (
+            filter_obj.filter_matches(self.COMPLETION_LIST, "tanklvl")
+        )
+
+    def test_word_starts_and_runs_rank_first(self):
+        filter_obj = FuzzyFilter()
+
+        # Consecutive run beats gapped matches of the same characters
+        assert filter_obj.filter_matches(self.COMPLETION_LIST, "tlvl")[0] == "tank_lvl"
+
+        # Word-start runs beat a buried run; the best alignment is used, not the first
+        result = filter_obj.filter_matches(self.COMPLETION_LIST, "pump")
+        assert result[-1] == "stepump"
+        assert set(result[:3]) == {"Pump_Run", "mixer_pump2", "Pause_Mode_Pump"}
+
+    def test_index_matches_linear_scan(self):
+        filter_obj = FuzzyFilter()
+        completion_list = self.COMPLETION_LIST + _make_tags(500)
+        index = filter_obj.build_index(completion_list)
+
+        for text in ["t", "tl", "tlvl", "PUMP", "pmp sp", "lo", "zz", "9_a", "Level"]:
+            expected = filter_obj.filter_matches(completion_list, text)
+            assert filter_obj.filter_matches(completion_list, text, index=index) == expected
+
+    def test_empty_text_returns_everything(self):
+        filter_obj = FuzzyFilter()
+        assert filter_obj.filter_matches(self.COMPLETION_LIST, " ") == self.COMPLETION_LIST
+
+    def test_non_ascii_characters_match_through_index(self):
+        filter_obj = FuzzyFilter()
+        completion_list = ["Température_Cuve", "Temp_Tank", "Niveau_Élevé", "Pump"]
+        index = filter_obj.build_index(completion_list)
+
+        # Masks stay fixed-width; non-ASCII characters still match exactly
+        assert all(mask.bit_length() <= 128 for mask in index.char_masks)
+        for text in ["é", "tcv", "élv", "tmp"]:
+            expected = filter_obj.filter_matches(completion_list, text)
+            assert filter_obj.filter_matches(completion_list, text, index=index) == expected
+        assert set(filter_obj.filter_matches(completion_list, "é", index=index)) == {
+            "Température_Cuve",
+            "Niveau_Élevé",
+        }
+
+    def test_word_starts_survive_characters_that_grow_when_lowercased(self):
+        filter_obj = FuzzyFilter()
+        # "İ" lowercases to two characters, shifting every later position by one
+        completion_list = ["İnput_Valve", "Input_Valve", "İnputValve", "InputValve"]
+        index = filter_obj.build_index(completion_list)
+
+        # Same word starts as the plain spelling, so scores tie and list order holds
+        for text, expected in [
+            ("valve", ["İnput_Valve", "Input_Valve"]),
+            ("nv", ["İnputValve", "InputValve"]),
+        ]:
+            pair = [item for item in completion_list if item in expected]
+            assert filter_obj.filter_matches(pair, text) == expected
+            assert filter_obj.filter_matches(pair, text, index=filter_obj.build_index(pair)) == (
+                expected
+            )
+        for text in ["valve", "iv", "npv"]:
+            expected = filter_obj.filter_matches(completion_list, text)
+            assert filter_obj.filter_matches(completion_list, text, index=index) == expected
+
+    def test_latency_budget_at_50k_tags(self):
+        """Indexed fuzzy queries over 50k tags stay interactive.
+
+        The slowest of these queries takes under 100 ms on a developer
+        machine; the 300 ms budget leaves about 3x margin for CI runners.
+        """
+        filter_obj = FuzzyFilter()
+        tags = _make_tags(50_000)
+        index = filter_obj.build_index(tags)
+
+        for text in ["t", "tnk", "tnklvl", "pmp spd", "alarm", "zzz"]:
+            start = time.perf_counter()
+            filter_obj.filter_matches(tags, text, index=index)
+            assert time.perf_counter() - start < 0.3, text
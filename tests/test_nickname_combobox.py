@@ -1,6 +1,11 @@
 """Tests for nickname_combobox utility functions."""
 
+import queue
+import threading
+
 from clicknick.widgets.nickname_combobox import (
+    AsyncSearchManager,
+    NicknameCombobox,
     is_possible_address_or_literal,
     normalize_nickname,
 )
@@ -249,3 +254,223 @@ class TestIsPossibleAddressOrLiteral:
             assert is_possible_address_or_literal(f"{prefix}1", strict=True) is True, (
                 f"{prefix}1 strict"
             )
+
+
+class _FakeWidget:
+    """Stands in for the combobox: after() callbacks are queued for the test to run."""
+
+    def __init__(self):
+        self.callbacks = queue.Queue()
+
+    def after(self, ms, callback):
+        self.callbacks.put(callback)
+        return callback
+
+    def after_cancel(self, after_id):
+        pass
+
+    def run_until(self, predicate):
+        while not predicate():
+            self.callbacks.get(timeout=5)()
+
+
+class TestAsyncSearchManager:
+    """Tests for off-thread searches with stale-result dropping."""
+
+    def test_results_delivered_on_ui_callback(self):
+        widget = _FakeWidget()
+        manager = AsyncSearchManager(widget, debounce_ms=0)
+        delivered = []
+
+        manager.submit(
+            lambda text, limit: ([text.upper()], 1),
+            "pump",
+            10,
+            lambda values, total: delivered.append((values, total)),
+        )
+        widget.run_until(lambda: delivered)
+        assert delivered == [(["PUMP"], 1)]
+
+    def test_stale_results_are_dropped(self):
+        widget = _FakeWidget()
+        manager = AsyncSearchManager(widget, debounce_ms=0)
+        started = threading.Event()
+        release = threading.Event()
+        delivered = []
+
+        def provider(text, limit):
+            if text == "p":
+                started.set()
+                release.wait(5)
+            return [text], 1
+
+        def on_result(values, total):
+            delivered.append(values)
+
+        manager.submit(provider, "p", 10, on_result)
+        assert started.wait(5)
+        manager.submit(provider, "pu", 10, on_result)
+        release.set()
+
+        widget.run_until(lambda: delivered)
+        # Drain the late "p" result too; it must not be delivered
+        while not widget.callbacks.empty():
+            widget.callbacks.get()()
+        assert delivered == [["pu"]]
+
+    def test_debounce_skips_intermediate_keystrokes(self):
+        widget = _FakeWidget()
+        manager = AsyncSearchManager(widget, debounce_ms=50)
+        searched = []
+        delivered = []
+
+        def provider(text, limit):
+            searched.append(text)
+            return [text], 1
+
+        for text in ("p", "pu", "pum"):
+            manager.submit(provider, text, 10, lambda values, total: delivered.append(values))
+
+        widget.run_until(lambda: delivered)
+        assert searched == ["pum"]
+        assert delivered == [["pum"]]
+
+    def test_cancel_drops_in_flight_result(self):
+        widget = _FakeWidget()
+        manager = AsyncSearchManager(widget, debounce_ms=0)
+        started = threading.Event()
+        release = threading.Event()
+        delivered = []
+
+        def provider(text, limit):
+            started.set()
+            release.wait(5)
+            return [text], 1
+
+        manager.submit(provider, "p", 10, lambda values, total: delivered.append(values))
+        assert started.wait(5)
+        manager.cancel()
+        release.set()
+        widget.callbacks.get(timeout=5)()
+        assert delivered == []
+
+
+class _PagingCombobox(_FakeWidget):
+    """NicknameCombobox's paging methods over plain attributes, without Tk."""
+
+    has_more_results = NicknameCombobox.has_more_results
+    load_more_results = NicknameCombobox.load_more_results
+
+    def __init__(self, provider, async_search):
+        super().__init__()
+        self.data_provider = provider
+        self.page_size = 2
+        self.values_list = ["a", "b"]
+        self.total_results = 5
+        self.result_limit = 2
+        self.search_manager = AsyncSearchManager(self, debounce_ms=0) if async_search else None
+        self.pages = []
+
+    def get_search_text(self):
+        return "x"
+
+    def _show_page(self, values, total):
+        self.pages.append((values, total))
+
+
+class TestLoadMoreResults:
+    """Tests for paging in more results from the data provider."""
+
+    def test_async_page_is_fetched_off_the_tk_thread(self):
+        threads = []
+
+        def provider(text, limit):
+            threads.append(threading.current_thread())
+            return ["a", "b", "c", "d"][:limit], 5
+
+        combobox = _PagingCombobox(provider, async_search=True)
+        combobox.load_more_results()
+        assert combobox.pages == []
+
+        combobox.run_until(lambda: combobox.pages)
+        assert combobox.pages == [(["a", "b", "c", "d"], 5)]
+        assert threads[0] is not threading.current_thread()
+
+    def test_sync_page_is_fetched_immediately(self):
+        combobox = _PagingCombobox(
+            lambda text, limit: (["a", "b", "c", "d"], 5), async_search=False
+        )
+        combobox.load_more_results()
+        assert combobox.pages == [(["a", "b", "c", "d"], 5)]
+
+
+class _FinalizingCombobox(_FakeWidget):
+    """NicknameCombobox's finalize_entry over plain attributes, without Tk."""
+
+    finalize_entry = NicknameCombobox.finalize_entry
+    fetch_values = NicknameCombobox.fetch_values
+
+    def __init__(self, provider):
+        super().__init__()
+        self.data_provider = provider
+        self.result_limit = 10
+        self.search_manager = AsyncSearchManager(self, debounce_ms=40)
+        self.selected = []
+        self.selection_callback = self.selected.append
+        self.master = self
+        self.text = ""
+        self.values = []
+
+    def get(self):
+        return self.text
+
+    def get_search_text(self):
+        return self.text
+
+    def current(self):
+        return self.values.index(self.text) if self.text in self.values else -1
+
+    def is_possible_address_or_literal(self, search_text, strict=False):
+        return False
+
+    def _normalize_nickname(self, nickname):
+        return nickname
+
+    def update_values(self, values, total=None):
+        self.values = values
+
+    def withdraw(self):
+        pass
+
+    def __getitem__(self, key):
+        return self.values
+
+
+class TestFinalizeEntry:
+    """Tests for finalizing while an async search is still pending."""
+
+    def test_finalize_searches_the_current_text_before_selecting(self):
+        names = ["Pump_Run", "Pump_Stop", "Valve"]
+
+        def provider(text, limit):
+            matches = [name for name in names if name.lower().startswith(text.lower())]
+            return matches[:limit], len(matches)
+
+        combobox = _FinalizingCombobox(provider)
+        # "Pump_R" had a single match; the user backspaced to "Pump_" and pressed Enter
+        combobox.values = ["Pump_Run"]
+        combobox.text = "Pump_"
+        combobox.search_manager.submit(provider, "Pump_", 10, combobox.update_values)
+
+        combobox.finalize_entry()
+        assert combobox.selected == ["Pump_"]
+        assert combobox.values == ["Pump_Run", "Pump_Stop"]
+        assert not combobox.search_manager.in_flight
+
+    def test_finalize_uses_single_result_once_delivered(self):
+        combobox = _FinalizingCombobox(lambda text, limit: (["Valve"], 1))
+        combobox.values = ["Valve"]
+        combobox.text = "val"
+
+        combobox.finalize_entry()
+        assert combobox.selected == ["Valve"]
@@ -186,6 +186,24 @@ class TestNicknameIndexServiceDuplicateDetection:
         assert service.is_duplicate("Motor1", 999) is True
 
 
+class TestNicknameIndexServicePrefix:
+    """Tests for prefix lookups (outline rename candidates)."""
+
+    def test_get_nicknames_with_prefix(self):
+        """Only distinct nicknames starting with the prefix are returned."""
+        service = NicknameIndexService()
+        rows = [
+            AddressRow(memory_type="X", address=1, nickname="Tank_Pump"),
+            AddressRow(memory_type="X", address=2, nickname="Tank_Valve"),
+            AddressRow(memory_type="X", address=3, nickname="tank_Level"),
+            AddressRow(memory_type="X", address=4, nickname="Tank_Pump"),
+        ]
+        service.rebuild_index(rows)
+
+        assert sorted(service.get_nicknames_with_prefix("Tank_")) == ["Tank_Pump", "Tank_Valve"]
+        assert service.get_nicknames_with_prefix("Pump") == []
+
+
 class TestNicknameIndexServiceUpdate:
     """Tests for update method (incremental index updates)."""
 
@@ -2,38 +2,51 @@
 
 from __future__ import annotations
 
+import time
+
 from pyclickplc.addresses import get_addr_key
 
+from clicknick.data import nickname_manager
 from clicknick.data.address_store import AddressStore
 from clicknick.data.nickname_manager import NicknameManager
 from clicknick.data.shared_dataview import SharedDataviewData
 from clicknick.models.address_row import AddressRow
+from clicknick.utils.filters import ContainsPlusFilter
+
 
+class _Settings:
+    """The app settings NicknameManager reads its search options from."""
 
-class _MockDataSource:
-    supports_used_field = True
-    file_path = "test.mdb"
-    is_read_only = False
+    def __init__(self, search_mode="none", exclude_sc_sd=False, exclude_terms=None):
+        self.search_mode = search_mode
+        self.exclude_sc_sd = exclude_sc_sd
+        self.exclude_terms = exclude_terms or []
 
-    def __init__(self, initial_rows=None):
-        self._initial_rows = initial_rows or {}
+    def get_exclude_terms_list(self):
+        return self.exclude_terms
 
-    def load_all_addresses(self):
-        return self._initial_rows
 
-    def save_changes(self, rows):
-        return len(rows)
+def _nickname_rows(memory_type: str, names) -> dict[int, AddressRow]:
+    """Rows with the names at addresses 1, 2, ... of memory_type."""
+    return {
+        get_addr_key(memory_type, addr): AddressRow(
+            memory_type=memory_type, address=addr, nickname=name
+        )
+        for addr, name in enumerate(names, start=1)
+    }
 
 
-def _make_store(initial_rows=None) -> AddressStore:
-    store = AddressStore(_MockDataSource(initial_rows))
-    store.load_initial_data()
-    return store
+def _make_manager(store: AddressStore, search_mode: str = "none") -> NicknameManager:
+    manager = NicknameManager(settings=_Settings(search_mode))
+    manager.set_shared_data(store)
+    return manager
 
 
-def test_nickname_manager_invalidates_cache_when_external_update_adds_new_row() -> None:
+def test_nickname_manager_invalidates_cache_when_external_update_adds_new_row(
+    make_address_store,
+) -> None:
     addr_key_1 = get_addr_key("X", 1)
-    store = _make_store(
+    store = make_address_store(
         {
             addr_key_1: AddressRow(
                 memory_type="X",
@@ -64,9 +77,9 @@ def test_nickname_manager_invalidates_cache_when_external_update_adds_new_row()
     assert manager.get_address_for_nickname("Input3") == "X003"
 
 
-def test_shared_dataview_refreshes_when_address_store_changes() -> None:
+def test_shared_dataview_refreshes_when_address_store_changes(make_address_store) -> None:
     addr_key = get_addr_key("X", 1)
-    store = _make_store(
+    store = make_address_store(
         {
             addr_key: AddressRow(
                 memory_type="X",
@@ -92,3 +105,235 @@ def test_shared_dataview_refreshes_when_address_store_changes() -> None:
         session.set_field(addr_key, "nickname", "Input1Renamed")
 
     assert window.refresh_calls == 1
+
+
+def test_shared_dataview_searches_and_resolves_nicknames_from_index(make_address_store) -> None:
+    rows = {
+        get_addr_key("X", 1): AddressRow(memory_type="X", address=1, nickname="Pump_Start"),
+        get_addr_key("C", 1): AddressRow(memory_type="C", address=1, nickname="Tank_Pump"),
+        get_addr_key("DS", 1): AddressRow(memory_type="DS", address=1, nickname="Alarm_Count"),
+    }
+    store = make_address_store(rows)
+    shared = SharedDataviewData(address_store=store)
+
+    assert shared.search_nicknames("") == (["Alarm_Count", "Pump_Start", "Tank_Pump"], 3)
+    assert shared.search_nicknames(" PUMP ", limit=1) == (["Pump_Start"], 2)
+    assert shared.get_address_for_nickname("Tank_Pump") == "C1"
+    assert shared.get_address_for_nickname("Missing") is None
+
+    # Edits patch the index in place; lookups follow the store
+    with store.edit_session("Rename") as session:
+        session.set_field(get_addr_key("DS", 1), "nickname", "Pump_Count")
+
+    assert shared.search_nicknames("pump") == (["Pump_Count", "Pump_Start", "Tank_Pump"], 3)
+    assert shared.get_address_for_nickname("Pump_Count") == "DS1"
+    assert shared.get_address_for_nickname("Alarm_Count") is None
+
+
+def test_shared_dataview_ranks_search_results(make_address_store) -> None:
+    names = ("Xpump_Run", "Main_Pump", "Pump_Start", "Aux_Pumping", "Pump", "Valve")
+    shared = SharedDataviewData(address_store=make_address_store(_nickname_rows("C", names)))
+
+    # Exact, prefix, word-start, then other substring; A-Z within each group
+    assert shared.search_nicknames("pump") == (
+        ["Pump", "Pump_Start", "Aux_Pumping", "Main_Pump", "Xpump_Run"],
+        5,
+    )
+    assert shared.search_nicknames("pump", limit=2) == (["Pump", "Pump_Start"], 5)
+
+
+def test_nickname_manager_patches_only_affected_keys_on_edit(make_address_store) -> None:
+    addr_key_1 = get_addr_key("X", 1)
+    addr_key_2 = get_addr_key("X", 2)
+    store = make_address_store(_nickname_rows("X", ("Input1", "Input2")))
+    manager = _make_manager(store)
+
+    untouched, edited = manager.nicknames
+    generation = manager.generation
+
+    with store.edit_session("Rename input") as session:
+        session.set_field(addr_key_2, "nickname", "Motor_Speed")
+
+    assert manager.nicknames[0] is untouched
+    assert manager.nicknames[1] is not edited
+    assert manager.nicknames[1].nickname == "Motor_Speed"
+    assert "mtr" in manager.nicknames[1].abbr_tags
+    assert manager.generation > generation
+
+    with store.edit_session("Clear input") as session:
+        session.set_field(addr_key_1, "nickname", "")
+
+    assert [obj.nickname for obj in manager.nicknames] == ["Motor_Speed"]
+    assert manager.get_address_for_nickname("Input1") is None
+
+
+def test_nickname_manager_keeps_sort_order_when_patching(make_address_store) -> None:
+    store = make_address_store(_nickname_rows("X", ("Delta", "Bravo", "Alpha")))
+    manager = _make_manager(store)
+    manager.apply_sorting(sort_by_nickname=True)
+
+    assert manager.get_filtered_nicknames(["X"]) == ["Alpha", "Bravo", "Delta"]
+
+    with store.edit_session("Rename input") as session:
+        session.set_field(get_addr_key("X", 1), "nickname", "Charlie")
+
+    assert manager.get_filtered_nicknames(["X"]) == ["Alpha", "Bravo", "Charlie"]
+
+    manager.apply_sorting(sort_by_nickname=False)
+    assert manager.get_filtered_nicknames(["X"]) == ["Charlie", "Bravo", "Alpha"]
+
+
+def test_nickname_manager_prefix_search_follows_cache_updates(make_address_store) -> None:
+    store = make_address_store(_nickname_rows("C", ("Pump_B", "Valve", "Pump_A")))
+    manager = _make_manager(store, "prefix")
+
+    assert manager.get_filtered_nicknames(["C"], "pump") == ["Pump_B", "Pump_A"]
+    assert manager.get_filtered_nicknames(["X"], "pump") == []
+
+    manager.apply_sorting(sort_by_nickname=True)
+    assert manager.get_filtered_nicknames(["C"], "pump") == ["Pump_A", "Pump_B"]
+
+    with store.edit_session("Rename valve") as session:
+        session.set_field(get_addr_key("C", 2), "nickname", "Pump_0")
+
+    assert manager.get_filtered_nicknames(["C"], "pump") == ["Pump_0", "Pump_A", "Pump_B"]
+
+
+def test_nickname_manager_keeps_search_index_for_metadata_edits(make_address_store) -> None:
+    key_1, key_2 = get_addr_key("C", 1), get_addr_key("C", 2)
+    store = make_address_store(_nickname_rows("C", ("Tank_Level", "Pump_Run")))
+    manager = _make_manager(store, "contains")
+
+    assert manager.get_filtered_nicknames(["C"], "level") == ["Tank_Level"]
+    index = manager._search_indexes["contains"]
+
+    with store.edit_session("Edit comment") as session:
+        session.set_field(key_1, "comment", "Main tank")
+
+    assert manager.get_filtered_nicknames(["C"], "level") == ["Tank_Level"]
+    assert manager._search_indexes["contains"] is index
+    assert "'Main tank'" in manager.get_nickname_details("Tank_Level")
+
+    with store.edit_session("Rename pump") as session:
+        session.set_field(key_2, "nickname", "Level_Switch")
+
+    # The prefix match now ranks ahead of the earlier word-boundary match
+    assert manager.get_filtered_nicknames(["C"], "level") == ["Level_Switch", "Tank_Level"]
+
+
+def test_nickname_manager_ranks_and_limits_results(make_address_store) -> None:
+    names = ("Sump_Pump", "mixer_pump2", "Pump_Run", "PUMP", "Pumpkin")
+    manager = _make_manager(make_address_store(_nickname_rows("C", names)), "contains")
+
+    # Exact, then prefix (cache order), then word-boundary, then other substring
+    ranked = ["PUMP", "Pump_Run", "Pumpkin", "Sump_Pump", "mixer_pump2"]
+    assert manager.get_filtered_nicknames(["C"], "pump") == ranked
+    assert manager.get_top_nicknames(["C"], "pump", 2) == (ranked[:2], 5)
+    assert manager.get_top_nicknames(["C"], "pump", 10) == (ranked, 5)
+    assert manager.get_top_nicknames(["C"], "", 3) == (list(names[:3]), 5)
+
+    # Explicit options (as captured on the Tk thread) override the settings object
+    assert manager.get_top_nicknames(["C"], "pump", 2, ("prefix", False, [])) == (
+        ["PUMP", "Pump_Run"],
+        3,
+    )
+
+
+def test_nickname_manager_narrows_from_previous_query(make_address_store, monkeypatch) -> None:
+    names = ("mixer_Pump", "Pump_Run", "pumpkin", "Valve", "Sump_Pump")
+    manager = _make_manager(make_address_store(_nickname_rows("C", names)), "contains")
+
+    def full_search(text):
+        manager.reset_search_session()
+        return manager.get_filtered_nicknames(["C"], text)
+
+    expected = {text: full_search(text) for text in ("p", "pu", "pum", "pump", "pumpk")}
+
+    manager.reset_search_session()
+    for text in ("p", "pu", "pum", "pump", "pumpk", "pump", "pu"):
+        assert manager.get_filtered_nicknames(["C"], text) == expected[text]
+
+    # Refined results come from the previous matches, not the full cache
+    manager.reset_search_session()
+    manager.get_filtered_nicknames(["C"], "pu")
+    with monkeypatch.context() as patch:
+        patch.setattr(manager, "_search_all", None)
+        assert manager.get_filtered_nicknames(["C"], "pump") == expected["pump"]
+
+    # Mode change starts over with a full search
+    manager.settings.search_mode = "prefix"
+    assert manager.get_filtered_nicknames(["C"], "pump") == ["Pump_Run", "pumpkin"]
+
+
+def test_nickname_manager_fuzzy_narrowing_matches_full_search(make_address_store) -> None:
+    names = ("Tank_Level", "tank_lvl", "Total_Run_Level", "Pump_Run", "TankLevelHigh")
+    manager = _make_manager(make_address_store(_nickname_rows("C", names)), "fuzzy")
+
+    def full_search(text):
+        manager.reset_search_session()
+        return manager.get_filtered_nicknames(["C"], text)
+
+    queries = ("t", "tl", "tlv", "tlvl")
+    expected = {text: full_search(text) for text in queries}
+    assert expected["tlvl"][0] == "tank_lvl"
+
+    manager.reset_search_session()
+    for text in queries:
+        assert manager.get_filtered_nicknames(["C"], text) == expected[text]
+
+
+def test_nickname_manager_candidate_base_respects_types_and_exclusions(make_address_store) -> None:
+    rows = {
+        get_addr_key("C", 1): AddressRow(memory_type="C", address=1, nickname="Run_Spare"),
+        get_addr_key("X", 1): AddressRow(memory_type="X", address=1, nickname="Run_Input"),
+        get_addr_key("SC", 1): AddressRow(memory_type="SC", address=1, nickname="Run_System"),
+        get_addr_key("C", 2): AddressRow(memory_type="C", address=2, nickname="Run_Motor"),
+    }
+    manager = _make_manager(make_address_store(rows), "contains")
+
+    # Candidates keep cache (memory type + address) order regardless of the type list order
+    assert manager.get_filtered_nicknames(["SC", "C", "X"]) == [
+        "Run_Input",
+        "Run_Spare",
+        "Run_Motor",
+        "Run_System",
+    ]
+    assert manager.get_filtered_nicknames(["C", "SC"], "run") == [
+        "Run_Spare",
+        "Run_Motor",
+        "Run_System",
+    ]
+
+    manager.settings.exclude_sc_sd = True
+    manager.settings.exclude_terms = ["spare"]
+    assert manager.get_filtered_nicknames(["C", "SC"]) == ["Run_Motor"]
+    assert manager.get_filtered_nicknames(["C", "SC"], "run") == ["Run_Motor"]
+
+
+def test_nickname_manager_saves_tag_cache_outside_searches(
+    make_address_store, tmp_path, monkeypatch
+) -> None:
+    path = tmp_path / "abbr_tags.json.gz"
+    manager = _make_manager(make_address_store(_nickname_rows("C", ("Tank_Level", "Pump_Run"))))
+    manager.filter_strategies["containsplus"] = ContainsPlusFilter(tag_cache_path=path)
+    tag_cache = manager.filter_strategies["containsplus"].tag_cache
+
+    # A few new tags wait for the save at shutdown instead of a write per search
+    assert manager.is_loaded
+    assert manager.get_filtered_nicknames(["C"]) == ["Tank_Level", "Pump_Run"]
+    assert tag_cache.unsaved_puts == 2
+    assert not path.exists()
+    assert manager.save_tag_cache()
+    assert path.exists()
+
+    # Once enough new tags pile up, the search returns and a daemon thread writes them
+    monkeypatch.setattr(nickname_manager, "TAG_CACHE_SAVE_PUTS", 1)
+    path.unlink()
+    with manager._shared_data.edit_session("Rename") as session:
+        session.set_field(get_addr_key("C", 2), "nickname", "Valve_Open")
+    assert manager.get_filtered_nicknames(["C"]) == ["Tank_Level", "Valve_Open"]
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert path.exists()
+    assert tag_cache.unsaved_puts == 0
@@ -0,0 +1,98 @@
+"""Tests for AddressRowStyler's per-cell highlight and note diffing."""
+
+from __future__ import annotations
+
+from pyclickplc.addresses import get_addr_key
+
+from clicknick.models.address_row import AddressRow
+from clicknick.views.address_editor.panel_constants import COL_COMMENT
+from clicknick.views.address_editor.row_styler import AddressRowStyler
+
+
+class _RecordingSheet:
+    """Sheet stand-in that records styling calls."""
+
+    def __init__(self, row_count):
+        self.cell_notes = {}
+        self.visible_rows = (0, row_count)
+        self.calls = []
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def set_refresh_timer(self):
+        pass
+
+    def highlight_cells(self, row, column=None, **kwargs):
+        self.calls.append(("highlight", row, column))
+
+    def dehighlight_cells(self, row, column=None, **kwargs):
+        self.calls.append(("dehighlight", row, column))
+
+    def note(self, row, column, note=None):
+        self.calls.append(("note", row, column, note))
+
+
+def _make_styler(make_address_store):
+    keys = [get_addr_key("DS", address) for address in (1, 2)]
+    store = make_address_store(
+        {
+            key: AddressRow(
+                memory_type="DS", address=address, nickname=f"Tag{address}", comment="Old"
+            )
+            for key, address in zip(keys, (1, 2), strict=True)
+        }
+    )
+    rows = [store.visible_state[key] for key in keys]
+    sheet = _RecordingSheet(len(rows))
+    styler = AddressRowStyler(sheet, store, lambda: rows, lambda: [0, 1])
+    return styler, store, rows, sheet
+
+
+def test_row_styler_only_touches_cells_whose_style_changed(make_address_store) -> None:
+    styler, store, rows, sheet = _make_styler(make_address_store)
+    styler.apply_all_styling()
+    sheet.calls.clear()
+
+    with store.edit_session("Edit comment") as session:
+        session.set_field(rows[1].addr_key, "comment", "changed")
+    rows[1] = store.visible_state[rows[1].addr_key]
+    styler.update_rows_styling({0, 1})
+
+    assert sheet.calls == [
+        ("highlight", 1, COL_COMMENT),
+        ("note", 1, COL_COMMENT, "Original: Old"),
+    ]
+    assert sheet.cell_notes[(1, COL_COMMENT)].dirty_note == "Old"
+
+    # Reverting removes exactly the highlight and note that were added
+    sheet.calls.clear()
+    with store.edit_session("Revert comment") as session:
+        session.set_field(rows[1].addr_key, "comment", "Old")
+    rows[1] = store.visible_state[rows[1].addr_key]
+    styler.update_rows_styling({1})
+
+    assert sheet.calls == [
+        ("dehighlight", 1, COL_COMMENT),
+        ("note", 1, COL_COMMENT, None),
+    ]
+    assert sheet.cell_notes == {}
+
+
+def test_row_styler_keeps_navigation_flash_across_redraws(make_address_store) -> None:
+    styler, _store, _rows, sheet = _make_styler(make_address_store)
+    styler.apply_all_styling()
+    scheduled = []
+    styler.highlight_row_temporary(1, after_func=lambda _ms, func: scheduled.append(func) or "id")
+    sheet.calls.clear()
+
+    # The flash's own refresh fires <<SheetRedrawn>>, which must not restyle the row
+    styler._on_sheet_redrawn(None)
+    assert sheet.calls == []
+
+    # Clearing the flash restores the row's normal (unstyled) cells
+    scheduled[0]()
+    assert {call for call in sheet.calls if call[0] == "dehighlight"} == {
+        *(("dehighlight", 1, col) for col in range(5)),
+        ("dehighlight", 1, None),
+    }
@@ -0,0 +1,63 @@
+"""Cold-import checks for the clicknick entry point."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Subsystems that must only load when the feature using them is first opened
+DEFERRED_MODULES = (
+    "pyodbc",
+    "tksheet",
+    "laddercodec",
+    "pyrung",
+    "clicknick.data.data_source",
+    "clicknick.ladder",
+    "clicknick.views.address_editor",
+    "clicknick.views.dataview_editor",
+    "clicknick.views.dialogs",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module with -X importtime and get {module: cumulative microseconds}.
+
+    Modules loaded during interpreter startup (site and its hooks) are left out.
+    """
+    src = Path(__file__).resolve().parents[1] / "src"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(src), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        if name.strip() == "site":
+            times.clear()  # everything so far was interpreter startup
+            continue
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.skipif(sys.platform != "win32", reason="clicknick.app needs ctypes.windll")
+def test_app_import_defers_heavy_subsystems() -> None:
+    times = _import_times("clicknick.app")
+
+    deferred = [
+        name
+        for name in times
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in DEFERRED_MODULES)
+    ]
+    assert deferred == []